@@ -22,12 +22,14 @@ Command Types:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Type, Union, Protocol, runtime_checkable
+from typing import Deque, Dict, List, Optional, Any, Type, Union, Protocol, runtime_checkable
 from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
 from dataclasses import dataclass, asdict, field
+from collections import deque
 from enum import Enum
+from itertools import islice
 import json
 import uuid
 
@@ -36,25 +38,65 @@ from ..domain.models import (
     Money, LicensePlate, ParkingTicket, Invoice, Payment
 )
 from ..application.parking_service import (
-    ParkingService, ParkingRequestDTO, ExitRequestDTO,
+    ParkingService, ParkingServiceError, ParkingRequestDTO, ExitRequestDTO,
     ChargingRequestDTO, ReservationRequestDTO,
     ParkingAllocationDTO, ParkingExitDTO, ChargingSessionDTO, ReservationDTO
 )
 from ..domain.bounded_contexts import ContextMapper
 
 
+# ============================================================================
+# COMMAND EXCEPTIONS
+# ============================================================================
+
+class CommandError(Exception):
+    """Base exception for command errors"""
+    
+    def __init__(self, message: str, command_id: Optional[str] = None,
+                 command_type: Optional[str] = None):
+        super().__init__(message)
+        self.command_id = command_id
+        self.command_type = command_type
+
+
+class CommandValidationError(CommandError, ValueError):
+    """Exception when a command fails validation"""
+    pass
+
+
+# Expected command failures; the processor reports them without a traceback.
+# Any other exception is also returned as a failed result, logged in full
+COMMAND_FAILURES = (CommandError, ParkingServiceError)
+
+
 # ============================================================================
 # COMMAND INTERFACES AND BASE CLASSES
 # ============================================================================
 
+# Factory key -> command class, and command class name -> factory key.
+# Populated by Command.__init_subclass__ for subclasses declaring a factory_key.
+_COMMAND_CLASSES: Dict[str, Type['Command']] = {}
+_COMMAND_KEYS: Dict[str, str] = {}
+
+
 class Command(ABC):
     """
     Abstract base class for all commands
     
     A command represents an intent to change the system state.
     Commands are named in the imperative (e.g., ParkVehicleCommand).
+    Concrete commands register themselves with the factory by declaring
+    a key: ``class ParkVehicleCommand(Command, factory_key="park_vehicle")``.
     """
     
+    __slots__ = ('command_id', 'executed_at', 'executed_by', 'logger', 'metadata')
+    
+    def __init_subclass__(cls, factory_key: Optional[str] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if factory_key:
+            _COMMAND_CLASSES[factory_key] = cls
+            _COMMAND_KEYS[cls.__name__] = factory_key
+    
     def __init__(self, command_id: Optional[str] = None):
         self.command_id = command_id or str(uuid.uuid4())
         self.executed_at: Optional[datetime] = None
@@ -135,6 +177,8 @@ class CompositeCommand(Command):
     Useful for transactions or complex operations that need atomicity.
     """
     
+    __slots__ = ('commands',)
+    
     def __init__(self, commands: Optional[List[Command]] = None):
         super().__init__()
         self.commands = commands or []
@@ -157,7 +201,11 @@ class CompositeCommand(Command):
                 # Validate command
                 is_valid, errors = command.validate()
                 if not is_valid:
-                    raise ValueError(f"Command validation failed: {errors}")
+                    raise CommandValidationError(
+                        f"Command validation failed: {errors}",
+                        command.command_id,
+                        command.__class__.__name__
+                    )
                 
                 # Execute command
                 result = command.execute(service)
@@ -276,7 +324,7 @@ class CompositeCommand(Command):
 # COMMAND RESULT CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Base class for command execution results"""
     success: bool
@@ -300,7 +348,7 @@ class CommandResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParkingCommandResult(CommandResult):
     """Result for parking-related commands"""
     ticket_id: Optional[str] = None
@@ -308,7 +356,7 @@ class ParkingCommandResult(CommandResult):
     license_plate: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChargingCommandResult(CommandResult):
     """Result for charging-related commands"""
     session_id: Optional[str] = None
@@ -316,7 +364,7 @@ class ChargingCommandResult(CommandResult):
     estimated_cost: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingCommandResult(CommandResult):
     """Result for billing-related commands"""
     invoice_id: Optional[str] = None
@@ -328,7 +376,7 @@ class BillingCommandResult(CommandResult):
 # PARKING COMMANDS
 # ============================================================================
 
-class ParkVehicleCommand(Command):
+class ParkVehicleCommand(Command, factory_key="park_vehicle"):
     """
     Command: Park a vehicle
     
@@ -336,6 +384,8 @@ class ParkVehicleCommand(Command):
     Can be undone by: ExitVehicleCommand (simulated)
     """
     
+    __slots__ = ('request', 'original_state', 'result')
+    
     def __init__(self, request: ParkingRequestDTO, executed_by: Optional[str] = None):
         super().__init__()
         self.request = request
@@ -469,12 +519,12 @@ class ParkVehicleCommand(Command):
     
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
-        data["request"] = asdict(self.request)
+        data["request"] = self.request.to_dict()
         data["result"] = asdict(self.result) if self.result else None
         return data
 
 
-class ExitVehicleCommand(Command):
+class ExitVehicleCommand(Command, factory_key="exit_vehicle"):
     """
     Command: Exit a vehicle
     
@@ -482,6 +532,8 @@ class ExitVehicleCommand(Command):
     Can be undone by: Re-parking (complex, not implemented here)
     """
     
+    __slots__ = ('request', 'result')
+    
     def __init__(self, request: ExitRequestDTO, executed_by: Optional[str] = None):
         super().__init__()
         self.request = request
@@ -550,12 +602,12 @@ class ExitVehicleCommand(Command):
     
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
-        data["request"] = asdict(self.request)
+        data["request"] = self.request.to_dict()
         data["result"] = asdict(self.result) if self.result else None
         return data
 
 
-class AllocateSpecificSlotCommand(Command):
+class AllocateSpecificSlotCommand(Command, factory_key="allocate_specific_slot"):
     """
     Command: Allocate a specific parking slot
     
@@ -563,6 +615,14 @@ class AllocateSpecificSlotCommand(Command):
     Can be undone by: ReleaseSpecificSlotCommand
     """
     
+    __slots__ = (
+        'license_plate',
+        'vehicle_type',
+        'parking_lot_id',
+        'slot_number',
+        'original_state',
+    )
+    
     def __init__(
         self,
         license_plate: str,
@@ -716,7 +776,7 @@ class AllocateSpecificSlotCommand(Command):
 # CHARGING COMMANDS
 # ============================================================================
 
-class StartChargingSessionCommand(Command):
+class StartChargingSessionCommand(Command, factory_key="start_charging_session"):
     """
     Command: Start an EV charging session
     
@@ -724,6 +784,8 @@ class StartChargingSessionCommand(Command):
     Can be undone by: StopChargingSessionCommand
     """
     
+    __slots__ = ('request', 'result')
+    
     def __init__(self, request: ChargingRequestDTO, executed_by: Optional[str] = None):
         super().__init__()
         self.request = request
@@ -855,18 +917,20 @@ class StartChargingSessionCommand(Command):
     
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
-        data["request"] = asdict(self.request)
+        data["request"] = self.request.to_dict()
         data["result"] = asdict(self.result) if self.result else None
         return data
 
 
-class StopChargingSessionCommand(Command):
+class StopChargingSessionCommand(Command, factory_key="stop_charging_session"):
     """
     Command: Stop an EV charging session
     
     Business Operation: EV Charging Termination and Billing
     """
     
+    __slots__ = ('session_id', 'station_id', 'result')
+    
     def __init__(
         self,
         session_id: str,
@@ -942,7 +1006,7 @@ class StopChargingSessionCommand(Command):
 # RESERVATION COMMANDS
 # ============================================================================
 
-class MakeReservationCommand(Command):
+class MakeReservationCommand(Command, factory_key="make_reservation"):
     """
     Command: Make a parking reservation
     
@@ -950,6 +1014,8 @@ class MakeReservationCommand(Command):
     Can be undone by: CancelReservationCommand
     """
     
+    __slots__ = ('request', 'result')
+    
     def __init__(self, request: ReservationRequestDTO, executed_by: Optional[str] = None):
         super().__init__()
         self.request = request
@@ -1077,18 +1143,20 @@ class MakeReservationCommand(Command):
     
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
-        data["request"] = asdict(self.request)
+        data["request"] = self.request.to_dict()
         data["result"] = asdict(self.result) if self.result else None
         return data
 
 
-class CancelReservationCommand(Command):
+class CancelReservationCommand(Command, factory_key="cancel_reservation"):
     """
     Command: Cancel a parking reservation
     
     Business Operation: Reservation Cancellation
     """
     
+    __slots__ = ('reservation_id', 'result')
+    
     def __init__(self, reservation_id: str, executed_by: Optional[str] = None):
         super().__init__()
         self.reservation_id = reservation_id
@@ -1154,13 +1222,15 @@ class CancelReservationCommand(Command):
 # BILLING COMMANDS
 # ============================================================================
 
-class GenerateInvoiceCommand(Command):
+class GenerateInvoiceCommand(Command, factory_key="generate_invoice"):
     """
     Command: Generate an invoice
     
     Business Operation: Invoice Generation
     """
     
+    __slots__ = ('license_plate', 'services', 'customer_id', 'invoice_id')
+    
     def __init__(
         self,
         license_plate: str,
@@ -1230,7 +1300,7 @@ class GenerateInvoiceCommand(Command):
         return f"Generate Invoice for {self.license_plate}"
 
 
-class ProcessPaymentCommand(Command):
+class ProcessPaymentCommand(Command, factory_key="process_payment"):
     """
     Command: Process a payment
     
@@ -1238,6 +1308,8 @@ class ProcessPaymentCommand(Command):
     Can be undone by: RefundPaymentCommand
     """
     
+    __slots__ = ('invoice_id', 'payment_method', 'amount', 'payment_id')
+    
     def __init__(
         self,
         invoice_id: str,
@@ -1364,7 +1436,7 @@ class ProcessPaymentCommand(Command):
 # ADMIN COMMANDS
 # ============================================================================
 
-class UpdatePricingStrategyCommand(Command):
+class UpdatePricingStrategyCommand(Command, factory_key="update_pricing_strategy"):
     """
     Command: Update pricing strategy
     
@@ -1372,6 +1444,8 @@ class UpdatePricingStrategyCommand(Command):
     Can be undone by: Restore previous strategy
     """
     
+    __slots__ = ('parking_lot_id', 'strategy_type', 'parameters', 'previous_strategy')
+    
     def __init__(
         self,
         parking_lot_id: str,
@@ -1484,13 +1558,15 @@ class UpdatePricingStrategyCommand(Command):
         return f"Update Pricing Strategy for {self.parking_lot_id} to {self.strategy_type}"
 
 
-class ConfigureParkingLotCommand(Command):
+class ConfigureParkingLotCommand(Command, factory_key="configure_parking_lot"):
     """
     Command: Configure parking lot settings
     
     Business Operation: Parking Lot Management
     """
     
+    __slots__ = ('parking_lot_id', 'configuration', 'previous_configuration')
+    
     def __init__(
         self,
         parking_lot_id: str,
@@ -1610,49 +1686,26 @@ class CommandFactory:
             
         Returns: Command instance or None if type not recognized
         """
-        command_classes = {
-            # Parking commands
-            "park_vehicle": ParkVehicleCommand,
-            "exit_vehicle": ExitVehicleCommand,
-            "allocate_specific_slot": AllocateSpecificSlotCommand,
-            
-            # Charging commands
-            "start_charging_session": StartChargingSessionCommand,
-            "stop_charging_session": StopChargingSessionCommand,
-            
-            # Reservation commands
-            "make_reservation": MakeReservationCommand,
-            "cancel_reservation": CancelReservationCommand,
-            
-            # Billing commands
-            "generate_invoice": GenerateInvoiceCommand,
-            "process_payment": ProcessPaymentCommand,
-            
-            # Admin commands
-            "update_pricing_strategy": UpdatePricingStrategyCommand,
-            "configure_parking_lot": ConfigureParkingLotCommand,
-        }
-        
-        command_class = command_classes.get(command_type)
+        command_class = _COMMAND_CLASSES.get(command_type)
         if not command_class:
             return None
         
         try:
             # Create DTOs from data
             if command_type == "park_vehicle":
-                request = ParkingRequestDTO(**data.get("request", {}))
+                request = ParkingRequestDTO.from_dict(data.get("request", {}))
                 return command_class(request, data.get("executed_by"))
             
             elif command_type == "exit_vehicle":
-                request = ExitRequestDTO(**data.get("request", {}))
+                request = ExitRequestDTO.from_dict(data.get("request", {}))
                 return command_class(request, data.get("executed_by"))
             
             elif command_type == "start_charging_session":
-                request = ChargingRequestDTO(**data.get("request", {}))
+                request = ChargingRequestDTO.from_dict(data.get("request", {}))
                 return command_class(request, data.get("executed_by"))
             
             elif command_type == "make_reservation":
-                request = ReservationRequestDTO(**data.get("request", {}))
+                request = ReservationRequestDTO.from_dict(data.get("request", {}))
                 return command_class(request, data.get("executed_by"))
             
             else:
@@ -1694,12 +1747,12 @@ class CommandProcessor:
         self.service = service
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Command history for undo/redo
-        self.command_history: List[Command] = []
-        self.undone_commands: List[Command] = []
-        
         # Maximum history size
         self.max_history_size = 1000
+        
+        # Command history for undo/redo (bounded: oldest entries fall off)
+        self.command_history: Deque[Command] = deque(maxlen=self.max_history_size)
+        self.undone_commands: List[Command] = []
     
     def process(self, command: Command) -> Dict[str, Any]:
         """
@@ -1716,16 +1769,16 @@ class CommandProcessor:
             # Execute command
             result = command.execute(self.service)
             
-            # Add to history if successful
+            # Add to history if successful (deque maxlen enforces max_history_size)
             if result.get("success", False):
-                self._add_to_history(command)
+                self.command_history.append(command)
                 # Clear undone commands stack (new branch)
                 self.undone_commands.clear()
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Error processing command: {e}", exc_info=True)
+            self.logger.error(f"Error processing command: {e}", exc_info=not isinstance(e, COMMAND_FAILURES))
             return {
                 "success": False,
                 "command_id": command.command_id,
@@ -1754,13 +1807,15 @@ class CommandProcessor:
                 "error": "No commands to undo"
             }
         
-        command = self.command_history.pop()
+        # Left in history until the undo succeeds, whatever it raises
+        command = self.command_history[-1]
         
         try:
             if command.can_undo():
                 result = command.undo(self.service)
                 
                 if result.get("success", False):
+                    self.command_history.pop()
                     self.undone_commands.append(command)
                 
                 return result
@@ -1771,11 +1826,7 @@ class CommandProcessor:
                 }
                 
         except Exception as e:
-            self.logger.error(f"Error undoing command: {e}", exc_info=True)
-            
-            # Put command back in history
-            self.command_history.append(command)
-            
+            self.logger.error(f"Error undoing command: {e}", exc_info=not isinstance(e, COMMAND_FAILURES))
             return {
                 "success": False,
                 "error": str(e)
@@ -1789,32 +1840,33 @@ class CommandProcessor:
                 "error": "No commands to redo"
             }
         
-        command = self.undone_commands.pop()
+        # Left in the undone stack until the redo succeeds, whatever it raises
+        command = self.undone_commands[-1]
         
         try:
             result = command.execute(self.service)
             
             if result.get("success", False):
-                self._add_to_history(command)
+                self.undone_commands.pop()
+                self.command_history.append(command)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Error redoing command: {e}", exc_info=True)
-            
-            # Put command back in undone stack
-            self.undone_commands.append(command)
-            
+            self.logger.error(f"Error redoing command: {e}", exc_info=not isinstance(e, COMMAND_FAILURES))
             return {
                 "success": False,
                 "error": str(e)
             }
     
     def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get command history"""
-        history = self.command_history.copy()
+        """Get command history (oldest first), optionally only the last `limit` entries"""
         if limit:
-            history = history[-limit:]
+            # Walk the tail from the right end: O(limit) instead of copying the whole deque
+            history = list(islice(reversed(self.command_history), limit))
+            history.reverse()
+        else:
+            history = self.command_history
         
         return [cmd.to_dict() for cmd in history]
     
@@ -1823,14 +1875,6 @@ class CommandProcessor:
         self.command_history.clear()
         self.undone_commands.clear()
     
-    def _add_to_history(self, command: Command):
-        """Add command to history, respecting max size"""
-        self.command_history.append(command)
-        
-        # Trim history if too large
-        if len(self.command_history) > self.max_history_size:
-            self.command_history = self.command_history[-self.max_history_size:]
-    
     def create_transaction(self, commands: List[Command]) -> CompositeCommand:
         """Create a transaction (composite command)"""
         return CompositeCommand(commands)
@@ -1891,31 +1935,9 @@ class CommandSerializer:
         )
     
     @staticmethod
-    def _command_type_to_key(command_type: str) -> str:
+    def _command_type_to_key(command_type: str) -> Optional[str]:
         """Convert command class name to factory key"""
-        # Remove "Command" suffix and convert to snake_case
-        base_name = command_type.replace("Command", "")
-        
-        # Convert PascalCase to snake_case
-        import re
-        key = re.sub(r'(?<!^)(?=[A-Z])', '_', base_name).lower()
-        
-        # Special cases
-        special_cases = {
-            "ParkVehicle": "park_vehicle",
-            "ExitVehicle": "exit_vehicle",
-            "AllocateSpecificSlot": "allocate_specific_slot",
-            "StartChargingSession": "start_charging_session",
-            "StopChargingSession": "stop_charging_session",
-            "MakeReservation": "make_reservation",
-            "CancelReservation": "cancel_reservation",
-            "GenerateInvoice": "generate_invoice",
-            "ProcessPayment": "process_payment",
-            "UpdatePricingStrategy": "update_pricing_strategy",
-            "ConfigureParkingLot": "configure_parking_lot",
-        }
-        
-        return special_cases.get(base_name, key)
+        return _COMMAND_KEYS.get(command_type)
 
 
 # ============================================================================
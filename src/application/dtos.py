@@ -16,25 +16,150 @@ DTO Principles:
 - Serialization/deserialization support
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any, Union, Type, TypeVar
-from datetime import datetime, date, time
+from typing import Annotated, ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Any, Sequence, Tuple, Union, Type, TypeVar, get_args, get_origin
+from datetime import datetime, date, time, timedelta
 from decimal import Decimal
 from enum import Enum
-import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property, lru_cache
+import re
+import sys
+import orjson
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, validator, root_validator
-from pydantic.dataclasses import dataclass as pydantic_dataclass
-from pydantic import ConfigDict
+# Import pydantic names from their defining modules (skips the package's lazy-attribute lookup)
+from pydantic.main import BaseModel
+from pydantic.fields import Field
+from pydantic.config import ConfigDict
+from pydantic.functional_validators import field_validator, model_validator
+from pydantic.functional_serializers import PlainSerializer
+from pydantic_core.core_schema import ValidationInfo
+
+try:
+    import hyperscan  # Optional: DFA matcher for bulk email validation
+except ImportError:
+    hyperscan = None
 
 # Type variable for DTO generics
 T = TypeVar('T')
 
+# Field types with their JSON representation attached. The serializer is compiled
+# into the core schema once per type instead of being looked up per value.
+DecimalString = Annotated[Decimal, PlainSerializer(str, return_type=str, when_used='json')]
+
+# Whitelists checked by the DTO validators
+_VALID_SLOT_FEATURES = frozenset({"covered", "camera", "valet", "wide", "compact", "indoor", "outdoor"})
+_REPORT_FORMATS = frozenset({"json", "csv", "pdf"})
+
+# Limits checked by the DTO validators
+_MAX_REPORT_RANGE_DAYS = 365
+_MAX_RESERVATION_ADVANCE = timedelta(days=30)
+
+# Wall clock shared by everything validated/built within one request
+_now_ctx: ContextVar[Optional[datetime]] = ContextVar('now', default=None)
+
+
+def _now() -> datetime:
+    """Current request time if one is set, otherwise datetime.now()"""
+    return _now_ctx.get() or datetime.now()
+
+
+@contextmanager
+def request_clock(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """Pin the DTO clock for the duration of a request (or batch import)"""
+    now = now or datetime.now()
+    token = _now_ctx.set(now)
+    try:
+        yield now
+    finally:
+        _now_ctx.reset(token)
+
+
+# Email format shared by DTOValidator and the customer DTOs
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_email(email: str) -> bool:
+    """Check email format (cached: the same customers are looked up repeatedly)"""
+    return _EMAIL_RE.match(email) is not None
+
+
+def _compile_email_database():
+    """Compile the email pattern for hyperscan (one email per line), if available"""
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[_EMAIL_RE.pattern.encode()],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_MULTILINE]
+    )
+    return database
+
+
+_EMAIL_DATABASE = _compile_email_database()
+
 
 # ============================================================================
 # BASE DTO CLASSES
 # ============================================================================
 
+_SCALAR_TYPES = (str, int, float, bool, bytes, Decimal, datetime, date, time, timedelta, UUID, Enum, type(None))
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    """True if every value a field can hold is an immutable scalar (no DTOs or containers)"""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _is_scalar_annotation(get_args(annotation)[0])
+    if origin is Union:
+        return all(_is_scalar_annotation(arg) for arg in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, _SCALAR_TYPES)
+
+
+# JSON form -> field type, for the scalar types JSON cannot carry natively
+_JSON_SCALAR_PARSERS = {
+    UUID: UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    Decimal: Decimal,
+}
+
+
+def _single_type(annotation: Any) -> Any:
+    """Strip Annotated[...] and Optional[...]; None if a union of several types remains"""
+    while get_origin(annotation) in (Union, Annotated):
+        if get_origin(annotation) is Annotated:
+            annotation = get_args(annotation)[0]
+            continue
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    return annotation
+
+
+def _compile_function(name: str, lines: List[str], namespace: Dict[str, Any]):
+    """exec generated source and return the function it defines"""
+    exec('\n'.join(lines), namespace)
+    return namespace[name]
+
+
+def _build_flat_to_dict(field_names: Tuple[str, ...]):
+    """Generate an unrolled ``to_dict`` body reading each field from the instance dict"""
+    items = ', '.join(f'{n!r}: d[{n!r}]' for n in field_names)
+    return _compile_function('_flat_to_dict', [
+        'def _flat_to_dict(self, exclude_none):',
+        '    d = self.__dict__',
+        f'    data = {{{items}}}',
+        '    if exclude_none:',
+        '        return {k: v for k, v in data.items() if v is not None}',
+        '    return data',
+    ], {})
+
+
 class BaseDTO(BaseModel):
     """Base DTO with common functionality"""
     
@@ -43,24 +168,41 @@ class BaseDTO(BaseModel):
         populate_by_name=True,
         arbitrary_types_allowed=True,
         use_enum_values=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat(),
-            Decimal: lambda v: str(v),
-            UUID: lambda v: str(v)
-        }
     )
     
+    # Filled per class: field names, JSON-string decoders for typed scalar fields,
+    # and a generated to_dict when all fields hold plain scalars
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+    _FIELD_DECODERS: ClassVar[Dict[str, Any]] = {}
+    _flat_to_dict: ClassVar[Optional[Any]] = None
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._FIELD_NAMES = tuple(cls.model_fields)
+        cls._FIELD_DECODERS = {
+            name: _JSON_SCALAR_PARSERS[field_type]
+            for name, f in cls.model_fields.items()
+            if (field_type := _single_type(f.annotation)) in _JSON_SCALAR_PARSERS
+        }
+        if all(_is_scalar_annotation(f.annotation) for f in cls.model_fields.values()):
+            cls._flat_to_dict = _build_flat_to_dict(cls._FIELD_NAMES)
+        else:
+            cls._flat_to_dict = None
+    
     def to_dict(self, exclude_none: bool = False, **kwargs) -> Dict[str, Any]:
         """Convert DTO to dictionary"""
+        if self._flat_to_dict is not None and not kwargs:
+            # Nothing to recurse into or copy: read the attributes directly
+            return self._flat_to_dict(exclude_none)
         data = self.model_dump(**kwargs)
         if exclude_none:
             data = {k: v for k, v in data.items() if v is not None}
         return data
     
-    def to_json(self, **kwargs) -> str:
+    def to_json(self, exclude_none: bool = False, **kwargs) -> str:
         """Convert DTO to JSON string"""
-        return self.model_dump_json(**kwargs)
+        return _encode_json(self.to_dict(exclude_none=exclude_none, **kwargs)).decode()
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BaseDTO':
@@ -68,10 +210,105 @@ class BaseDTO(BaseModel):
         return cls(**data)
     
     @classmethod
-    def from_json(cls, json_str: str) -> 'BaseDTO':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'BaseDTO':
         """Create DTO from JSON string"""
-        data = json.loads(json_str)
-        return cls(**data)
+        return cls.from_dict(orjson.loads(json_str))
+
+
+class ResponseDTO(BaseDTO):
+    """Base DTO for results built once and returned to the caller (read-only)"""
+    
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+
+_NOT_GIVEN = object()
+
+
+def generate_fast_init(cls: Type[T]) -> Type[T]:
+    """
+    Replace a result DTO's ``__init__`` with generated straight-line assignment
+
+    Only for DTOs built server-side from trusted values: keyword construction
+    skips validation. The only coercions kept are the cheap ones pydantic
+    would make for these fields: typed scalars (UUID, datetime, ...) given as
+    strings are parsed, and enum members are stored as their values
+    (``use_enum_values``). ``model_validate``/``model_validate_json`` still
+    run the full pydantic validator, because the decorator is applied after
+    pydantic has compiled the class.
+    """
+    namespace: Dict[str, Any] = {'_setattr': object.__setattr__, '_NOT_GIVEN': _NOT_GIVEN}
+    params, body = [], []
+    for name, field_info in cls.model_fields.items():
+        if field_info.is_required():
+            params.append(name)
+        elif field_info.default_factory is not None:
+            namespace[f'_factory_{name}'] = field_info.default_factory
+            params.append(f'{name}=_NOT_GIVEN')
+            body.append(f'    if {name} is _NOT_GIVEN: {name} = _factory_{name}()')
+        else:
+            namespace[f'_default_{name}'] = field_info.default
+            params.append(f'{name}=_default_{name}')
+        annotation = _single_type(field_info.annotation)
+        if name in cls._FIELD_DECODERS:
+            namespace[f'_parse_{name}'] = cls._FIELD_DECODERS[name]
+            body.append(f'    if type({name}) is str: {name} = _parse_{name}({name})')
+        elif isinstance(annotation, type) and issubclass(annotation, Enum):
+            namespace[f'_enum_{name}'] = annotation
+            body.append(f'    if isinstance({name}, _enum_{name}): {name} = {name}.value')
+    # Required fields first so the signature stays valid
+    params.sort(key=lambda param: '=' in param)
+    names = list(cls.model_fields)
+    namespace['_fields_set'] = frozenset(names)
+    body.append(f"    _setattr(self, '__dict__', {{{', '.join(f'{n!r}: {n}' for n in names)}}})")
+    # Every field is reported as set; nothing here relies on exclude_unset
+    body.append("    _setattr(self, '__pydantic_fields_set__', set(_fields_set))")
+    body.append("    _setattr(self, '__pydantic_extra__', None)")
+    body.append("    _setattr(self, '__pydantic_private__', None)")
+    init = _compile_function('__init__', [f"def __init__(self, *, {', '.join(params)}):", *body], namespace)
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    cls.__init__ = init
+    cls.from_dict = classmethod(_build_trusted_from_dict(cls))
+    return cls
+
+
+def _build_trusted_from_dict(cls: Type[BaseDTO]):
+    """
+    Generate a ``from_dict`` that rebuilds nested DTOs from their dict form
+    
+    Pairs with ``generate_fast_init``, which already parses typed scalars
+    given as strings; nested DTO fields are the one conversion left to unroll.
+    """
+    namespace: Dict[str, Any] = {}
+    body = ['def from_dict(cls, data):', '    data = dict(data)']
+    for name, field_info in cls.model_fields.items():
+        annotation = _single_type(field_info.annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseDTO):
+            namespace[f'_nested_{name}'] = annotation
+            body.append(f'    if type(data.get({name!r})) is dict: data[{name!r}] = _nested_{name}.from_dict(data[{name!r}])')
+    body.append('    return cls(**data)')
+    return _compile_function('from_dict', body, namespace)
+
+
+class ValueDTO(BaseDTO):
+    """
+    Base DTO for immutable value objects embedded in many other DTOs
+    
+    Their JSON-ready dict is computed once per instance and reused by the
+    serializers.
+    """
+    
+    model_config = ConfigDict(frozen=True)
+    
+    @cached_property
+    def _as_dict(self) -> Dict[str, Any]:
+        return self.model_dump(mode='json')
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            # The cached dict describes the original values
+            copy.__dict__.pop('_as_dict', None)
+        return copy
 
 
 class PaginatedRequest(BaseDTO):
@@ -108,6 +345,11 @@ class VehicleTypeDTO(str, Enum):
     BUS = "bus"
 
 
+EV_VEHICLE_TYPES: FrozenSet[VehicleTypeDTO] = frozenset(
+    m for m in VehicleTypeDTO if m.value.startswith('ev_')
+)
+
+
 class SlotTypeDTO(str, Enum):
     """Parking slot type DTO"""
     REGULAR = "regular"
@@ -200,33 +442,65 @@ class AlertSeverityDTO(str, Enum):
     CRITICAL = "critical"
 
 
+# Value -> member tables: converting a raw string at the DTO boundary is one dict
+# lookup instead of a trip through EnumMeta.__call__
+for _enum_dto in (
+    VehicleTypeDTO, SlotTypeDTO, ChargerTypeDTO, ParkingStrategyTypeDTO, PricingStrategyTypeDTO,
+    ChargingStrategyTypeDTO, PaymentMethodDTO, PaymentStatusDTO, InvoiceStatusDTO,
+    ReservationStatusDTO, AlertSeverityDTO,
+):
+    _enum_dto._STR_TO_MEMBER = {sys.intern(member.value): member for member in _enum_dto}
+del _enum_dto
+
+
 # ============================================================================
 # COMMON VALUE OBJECT DTOs
 # ============================================================================
 
-class MoneyDTO(BaseDTO):
+class MoneyDTO(ValueDTO):
     """Money value object DTO"""
-    amount: Decimal = Field(ge=0, description="Amount")
+    amount: DecimalString = Field(ge=0, description="Amount")
     currency: str = Field(default="USD", min_length=3, max_length=3, description="Currency code (ISO 4217)")
     
-    @validator('amount')
+    @field_validator('amount')
+    @classmethod
     def validate_amount(cls, v):
         """Validate amount precision"""
         # Ensure amount has at most 2 decimal places
         if v.as_tuple().exponent < -2:
             raise ValueError("Amount cannot have more than 2 decimal places")
         return v
+    
+    @property
+    def cents(self) -> int:
+        """Amount in integer minor units (exact, amounts have at most 2 decimal places)"""
+        return int(self.amount.scaleb(2))
+    
+    @classmethod
+    def from_cents(cls, cents: int, currency: str = "USD") -> 'MoneyDTO':
+        """
+        Create MoneyDTO from integer minor units
+        
+        Lets callers accumulate totals as plain ints and convert once at the
+        boundary. ``cents`` must be non-negative; validation is skipped.
+        """
+        return cls.model_construct(amount=Decimal(cents).scaleb(-2), currency=currency)
+
+
+# Shared zero-amount default (MoneyDTO is immutable, so one instance serves all)
+ZERO_USD = MoneyDTO.model_construct(amount=Decimal('0'), currency="USD")
 
 
-class TimeRangeDTO(BaseDTO):
+class TimeRangeDTO(ValueDTO):
     """Time range DTO"""
     start_time: datetime = Field(description="Start time")
     end_time: datetime = Field(description="End time")
     
-    @validator('end_time')
-    def validate_end_time(cls, v, values):
+    @field_validator('end_time')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
         """Validate that end time is after start time"""
-        if 'start_time' in values and v <= values['start_time']:
+        if 'start_time' in info.data and v <= info.data['start_time']:
             raise ValueError("End time must be after start time")
         return v
     
@@ -243,7 +517,8 @@ class LicensePlateDTO(BaseDTO):
     country_code: Optional[str] = Field(default=None, min_length=2, max_length=2, description="Country code (ISO 3166-1 alpha-2)")
     state: Optional[str] = Field(default=None, min_length=2, max_length=3, description="State/province code")
     
-    @validator('number')
+    @field_validator('number')
+    @classmethod
     def validate_license_plate(cls, v):
         """Basic license plate validation"""
         # Remove whitespace and convert to uppercase
@@ -266,7 +541,7 @@ class LicensePlateDTO(BaseDTO):
         return " ".join(parts)
 
 
-class LocationDTO(BaseDTO):
+class LocationDTO(ValueDTO):
     """Location DTO"""
     latitude: float = Field(ge=-90, le=90, description="Latitude")
     longitude: float = Field(ge=-180, le=180, description="Longitude")
@@ -283,7 +558,8 @@ class ContactInfoDTO(BaseDTO):
     phone: Optional[str] = Field(default=None, description="Phone number")
     mobile: Optional[str] = Field(default=None, description="Mobile number")
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         """Basic email validation"""
         if v and '@' not in v:
@@ -326,10 +602,11 @@ class ElectricVehicleDTO(VehicleBaseDTO):
     max_charging_rate_kw: Optional[float] = Field(default=None, gt=0, description="Maximum charging rate in kW")
     compatible_chargers: List[ChargerTypeDTO] = Field(default_factory=list, description="Compatible charger types")
     
-    @validator('vehicle_type')
+    @field_validator('vehicle_type')
+    @classmethod
     def validate_electric_type(cls, v):
         """Validate that vehicle type is electric"""
-        if not v.value.startswith('ev_'):
+        if v not in EV_VEHICLE_TYPES:
             raise ValueError(f"Vehicle type {v} is not electric")
         return v
 
@@ -360,13 +637,13 @@ class ParkingSlotBaseDTO(BaseDTO):
     features: List[str] = Field(default_factory=list, description="Slot features (covered, camera, etc.)")
     is_reserved: bool = Field(default=False, description="Is slot reserved")
     
-    @validator('features')
+    @field_validator('features')
+    @classmethod
     def validate_features(cls, v):
         """Validate slot features"""
-        valid_features = {"covered", "camera", "valet", "wide", "compact", "indoor", "outdoor"}
-        invalid = [f for f in v if f not in valid_features]
+        invalid = set(v) - _VALID_SLOT_FEATURES
         if invalid:
-            raise ValueError(f"Invalid features: {invalid}. Valid features: {valid_features}")
+            raise ValueError(f"Invalid features: {sorted(invalid)}. Valid features: {sorted(_VALID_SLOT_FEATURES)}")
         return v
 
 
@@ -411,7 +688,8 @@ class ParkingLotBaseDTO(BaseDTO):
     operating_hours: Optional[Dict[str, Any]] = Field(default=None, description="Operating hours")
     contact_info: Optional[ContactInfoDTO] = Field(default=None, description="Contact information")
     
-    @validator('code')
+    @field_validator('code')
+    @classmethod
     def validate_code(cls, v):
         """Validate parking lot code format"""
         v = v.strip().upper()
@@ -426,13 +704,14 @@ class ParkingLotCreateDTO(ParkingLotBaseDTO):
         description="Number of slots by type"
     )
     
-    @validator('slot_distribution')
-    def validate_slot_distribution(cls, v, values):
+    @field_validator('slot_distribution')
+    @classmethod
+    def validate_slot_distribution(cls, v, info: ValidationInfo):
         """Validate slot distribution matches total capacity"""
-        if 'total_capacity' in values:
+        if 'total_capacity' in info.data:
             total_slots = sum(v.values())
-            if total_slots != values['total_capacity']:
-                raise ValueError(f"Slot distribution total ({total_slots}) does not match total capacity ({values['total_capacity']})")
+            if total_slots != info.data['total_capacity']:
+                raise ValueError(f"Slot distribution total ({total_slots}) does not match total capacity ({info.data['total_capacity']})")
         return v
 
 
@@ -553,30 +832,28 @@ class ChargingStationDTO(ChargingStationBaseDTO):
 # PARKING OPERATION DTOs
 # ============================================================================
 
+class ParkingPreferencesDTO(BaseDTO):
+    """Parking preferences DTO (unknown keys are rejected)"""
+    
+    model_config = ConfigDict(extra='forbid')
+    
+    preferred_slot_type: Optional[SlotTypeDTO] = Field(default=None, description="Preferred slot type")
+    specific_slot: Optional[int] = Field(default=None, description="Specific slot number")
+    force_allocation: bool = Field(default=False, description="Allocate even if preferences cannot be met")
+    needs_charging: bool = Field(default=False, description="Needs EV charging")
+    priority_level: Optional[int] = Field(default=None, description="Priority level")
+    duration_hours: Optional[float] = Field(default=None, description="Expected parking duration in hours")
+
+
 class ParkingRequestDTO(BaseDTO):
     """DTO for parking request"""
     license_plate: str = Field(description="License plate number")
     vehicle_type: VehicleTypeDTO = Field(description="Vehicle type")
     parking_lot_id: UUID = Field(description="Parking lot ID")
     entry_time: Optional[datetime] = Field(default=None, description="Entry time (defaults to now)")
-    preferences: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Parking preferences"
-    )
+    preferences: Optional[ParkingPreferencesDTO] = Field(default=None, description="Parking preferences")
     customer_id: Optional[UUID] = Field(default=None, description="Customer ID")
     requires_charging: bool = Field(default=False, description="Requires EV charging")
-    
-    @validator('preferences')
-    def validate_preferences(cls, v):
-        """Validate parking preferences"""
-        valid_keys = {
-            "preferred_slot_type", "specific_slot", "force_allocation",
-            "needs_charging", "priority_level", "duration_hours"
-        }
-        invalid = [k for k in v.keys() if k not in valid_keys]
-        if invalid:
-            raise ValueError(f"Invalid preference keys: {invalid}. Valid keys: {valid_keys}")
-        return v
 
 
 class ExitRequestDTO(BaseDTO):
@@ -586,19 +863,17 @@ class ExitRequestDTO(BaseDTO):
     parking_lot_id: UUID = Field(description="Parking lot ID")
     exit_time: Optional[datetime] = Field(default=None, description="Exit time (defaults to now)")
     
-    @root_validator
-    def validate_identifier(cls, values):
+    @model_validator(mode='after')
+    def validate_identifier(self):
         """Validate that either ticket_id or license_plate is provided"""
-        ticket_id = values.get('ticket_id')
-        license_plate = values.get('license_plate')
-        
-        if not ticket_id and not license_plate:
+        if not self.ticket_id and not self.license_plate:
             raise ValueError("Either ticket_id or license_plate must be provided")
         
-        return values
+        return self
 
 
-class ParkingAllocationDTO(BaseDTO):
+@generate_fast_init
+class ParkingAllocationDTO(ResponseDTO):
     """DTO for parking allocation result"""
     success: bool = Field(description="Allocation success")
     ticket_id: Optional[UUID] = Field(default=None, description="Parking ticket ID")
@@ -611,7 +886,8 @@ class ParkingAllocationDTO(BaseDTO):
     timestamp: Optional[datetime] = Field(default=None, description="Allocation timestamp")
 
 
-class ParkingExitDTO(BaseDTO):
+@generate_fast_init
+class ParkingExitDTO(ResponseDTO):
     """DTO for parking exit result"""
     success: bool = Field(description="Exit success")
     license_plate: Optional[str] = Field(default=None, description="License plate")
@@ -639,22 +915,25 @@ class ChargingRequestDTO(BaseDTO):
     charging_strategy: ChargingStrategyTypeDTO = Field(default=ChargingStrategyTypeDTO.BALANCED, description="Charging strategy")
     customer_id: Optional[UUID] = Field(default=None, description="Customer ID")
     
-    @validator('target_charge_percentage')
-    def validate_target_charge(cls, v, values):
+    @field_validator('target_charge_percentage')
+    @classmethod
+    def validate_target_charge(cls, v, info: ValidationInfo):
         """Validate target charge is greater than current charge"""
-        if 'current_charge_percentage' in values and v <= values['current_charge_percentage']:
+        if 'current_charge_percentage' in info.data and v <= info.data['current_charge_percentage']:
             raise ValueError("Target charge percentage must be greater than current charge")
         return v
     
-    @validator('vehicle_type')
+    @field_validator('vehicle_type')
+    @classmethod
     def validate_electric_vehicle(cls, v):
         """Validate that vehicle type is electric"""
-        if not v.value.startswith('ev_'):
+        if v not in EV_VEHICLE_TYPES:
             raise ValueError(f"Vehicle type {v} is not electric")
         return v
 
 
-class ChargingSessionDTO(BaseDTO):
+@generate_fast_init
+class ChargingSessionDTO(ResponseDTO):
     """DTO for charging session result"""
     success: bool = Field(description="Session creation success")
     session_id: Optional[UUID] = Field(default=None, description="Charging session ID")
@@ -674,7 +953,8 @@ class ChargingStopRequestDTO(BaseDTO):
     stop_time: Optional[datetime] = Field(default=None, description="Stop time (defaults to now)")
 
 
-class ChargingStopResultDTO(BaseDTO):
+@generate_fast_init
+class ChargingStopResultDTO(ResponseDTO):
     """DTO for charging stop result"""
     success: bool = Field(description="Stop success")
     session_id: UUID = Field(description="Charging session ID")
@@ -700,34 +980,38 @@ class ReservationRequestDTO(BaseDTO):
     preferred_slot_type: Optional[SlotTypeDTO] = Field(default=None, description="Preferred slot type")
     customer_id: Optional[UUID] = Field(default=None, description="Customer ID")
     
-    @validator('end_time')
-    def validate_end_time(cls, v, values):
+    @field_validator('end_time')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
         """Validate reservation times"""
-        if 'start_time' in values and v <= values['start_time']:
+        if 'start_time' in info.data and v <= info.data['start_time']:
             raise ValueError("End time must be after start time")
         
         # Cannot reserve in the past
-        if v < datetime.now():
+        if v < _now():
             raise ValueError("Cannot make reservation in the past")
         
         return v
     
-    @validator('start_time')
+    @field_validator('start_time')
+    @classmethod
     def validate_start_time(cls, v):
         """Validate start time"""
+        now = _now()
+        
         # Cannot reserve too far in the past
-        if v < datetime.now():
+        if v < now:
             raise ValueError("Start time cannot be in the past")
         
         # Maximum reservation advance (e.g., 30 days)
-        max_advance = timedelta(days=30)
-        if v > datetime.now() + max_advance:
-            raise ValueError(f"Cannot reserve more than {max_advance.days} days in advance")
+        if v > now + _MAX_RESERVATION_ADVANCE:
+            raise ValueError(f"Cannot reserve more than {_MAX_RESERVATION_ADVANCE.days} days in advance")
         
         return v
 
 
-class ReservationDTO(BaseDTO):
+@generate_fast_init
+class ReservationDTO(ResponseDTO):
     """DTO for reservation result"""
     success: bool = Field(description="Reservation success")
     reservation_id: Optional[UUID] = Field(default=None, description="Reservation ID")
@@ -746,16 +1030,13 @@ class ReservationUpdateDTO(BaseDTO):
     end_time: Optional[datetime] = None
     preferred_slot_type: Optional[SlotTypeDTO] = None
     
-    @root_validator
-    def validate_times(cls, values):
+    @model_validator(mode='after')
+    def validate_times(self):
         """Validate time updates"""
-        start_time = values.get('start_time')
-        end_time = values.get('end_time')
-        
-        if start_time and end_time and end_time <= start_time:
+        if self.start_time and self.end_time and self.end_time <= self.start_time:
             raise ValueError("End time must be after start time")
         
-        return values
+        return self
 
 
 # ============================================================================
@@ -787,7 +1068,7 @@ class InvoiceDTO(BaseDTO):
     invoice_number: str = Field(description="Invoice number")
     customer_id: Optional[UUID] = Field(default=None, description="Customer ID")
     license_plate: str = Field(description="License plate")
-    items: List[InvoiceItemDTO] = Field(description="Invoice items")
+    items: List[Dict[str, Any]] = Field(description="Invoice items (InvoiceItemDTO fields)")
     subtotal: MoneyDTO = Field(description="Subtotal amount")
     tax: MoneyDTO = Field(description="Tax amount")
     total: MoneyDTO = Field(description="Total amount")
@@ -798,6 +1079,11 @@ class InvoiceDTO(BaseDTO):
     notes: Optional[str] = Field(default=None, description="Invoice notes")
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: Optional[datetime] = Field(default=None, description="Last update timestamp")
+    
+    @property
+    def items_parsed(self) -> List[InvoiceItemDTO]:
+        """Invoice items as InvoiceItemDTOs (built on demand, without revalidation)"""
+        return [DTOFactory.from_trusted(InvoiceItemDTO, item) for item in self.items]
 
 
 class PaymentRequestDTO(BaseDTO):
@@ -840,10 +1126,11 @@ class CustomerBaseDTO(BaseDTO):
     phone: Optional[str] = Field(default=None, description="Phone number")
     company: Optional[str] = Field(default=None, description="Company name")
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
-        """Basic email validation"""
-        if '@' not in v:
+        """Validate email format"""
+        if not _is_valid_email(v):
             raise ValueError("Invalid email address")
         return v
 
@@ -866,13 +1153,18 @@ class CustomerDTO(CustomerBaseDTO):
     """Complete customer DTO"""
     id: UUID = Field(description="Customer ID")
     customer_number: str = Field(description="Customer number")
-    vehicles: List[VehicleDTO] = Field(default_factory=list, description="Customer vehicles")
+    vehicles: List[Dict[str, Any]] = Field(default_factory=list, description="Customer vehicles (VehicleDTO fields)")
     has_subscription: bool = Field(default=False, description="Has active subscription")
     subscription_tier: Optional[str] = Field(default=None, description="Subscription tier")
-    total_spent: MoneyDTO = Field(default_factory=lambda: MoneyDTO(amount=Decimal('0'), currency="USD"), description="Total amount spent")
+    total_spent: MoneyDTO = Field(default=ZERO_USD, description="Total amount spent")
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: Optional[datetime] = Field(default=None, description="Last update timestamp")
     is_active: bool = Field(default=True, description="Is customer active")
+    
+    @property
+    def vehicles_parsed(self) -> List[VehicleDTO]:
+        """Customer vehicles as VehicleDTOs (built on demand, without revalidation)"""
+        return [DTOFactory.from_trusted(VehicleDTO, vehicle) for vehicle in self.vehicles]
 
 
 # ============================================================================
@@ -887,6 +1179,18 @@ class MetricDTO(BaseDTO):
     source: Optional[str] = Field(default=None, description="Metric source")
     tags: Dict[str, str] = Field(default_factory=dict, description="Metric tags")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
+    
+    @field_validator('name', 'source')
+    @classmethod
+    def intern_name(cls, v):
+        """Intern metric names/sources (a small, endlessly repeated set)"""
+        return sys.intern(v) if v is not None else v
+    
+    @field_validator('tags')
+    @classmethod
+    def intern_tags(cls, v):
+        """Intern tag keys and values so repeated tags share one string object"""
+        return {sys.intern(key): sys.intern(value) for key, value in v.items()}
 
 
 class AlertDTO(BaseDTO):
@@ -915,10 +1219,15 @@ class DashboardDTO(BaseDTO):
     vehicles_out: int = Field(ge=0, description="Vehicles exited today")
     active_charging_sessions: int = Field(ge=0, description="Active charging sessions")
     available_slots: int = Field(ge=0, description="Available slots")
-    recent_alerts: List[AlertDTO] = Field(default_factory=list, description="Recent alerts")
+    recent_alerts: List[Dict[str, Any]] = Field(default_factory=list, description="Recent alerts (AlertDTO fields)")
     hourly_occupancy: List[Dict[str, Any]] = Field(default_factory=list, description="Hourly occupancy data")
     top_vehicles: List[Dict[str, Any]] = Field(default_factory=list, description="Top frequent vehicles")
     timestamp: datetime = Field(description="Dashboard timestamp")
+    
+    @property
+    def recent_alerts_parsed(self) -> List[AlertDTO]:
+        """Recent alerts as AlertDTOs (built on demand, without revalidation)"""
+        return [DTOFactory.from_trusted(AlertDTO, alert) for alert in self.recent_alerts]
 
 
 class ReportRequestDTO(BaseDTO):
@@ -928,18 +1237,26 @@ class ReportRequestDTO(BaseDTO):
     end_date: date = Field(description="Report end date")
     parking_lot_id: Optional[UUID] = Field(default=None, description="Parking lot ID")
     filters: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Report filters")
-    format: str = Field(default="json", pattern="^(json|csv|pdf)$", description="Report format")
+    format: str = Field(default="json", description="Report format (json/csv/pdf)")
+    
+    @field_validator('format')
+    @classmethod
+    def validate_format(cls, v):
+        """Validate report format"""
+        if v not in _REPORT_FORMATS:
+            raise ValueError(f"Invalid report format: {v}. Valid formats: {sorted(_REPORT_FORMATS)}")
+        return v
     
-    @validator('end_date')
-    def validate_date_range(cls, v, values):
+    @field_validator('end_date')
+    @classmethod
+    def validate_date_range(cls, v, info: ValidationInfo):
         """Validate date range"""
-        if 'start_date' in values and v < values['start_date']:
+        if 'start_date' in info.data and v < info.data['start_date']:
             raise ValueError("End date must be after start date")
         
         # Maximum report range (e.g., 1 year)
-        max_range = 365
-        if 'start_date' in values and (v - values['start_date']).days > max_range:
-            raise ValueError(f"Report range cannot exceed {max_range} days")
+        if 'start_date' in info.data and (v - info.data['start_date']).days > _MAX_REPORT_RANGE_DAYS:
+            raise ValueError(f"Report range cannot exceed {_MAX_REPORT_RANGE_DAYS} days")
         
         return v
 
@@ -948,8 +1265,60 @@ class ReportRequestDTO(BaseDTO):
 # QUERY & FILTER DTOs
 # ============================================================================
 
-class ParkingSlotQueryDTO(PaginatedRequest):
+class ProjectedQueryDTO(PaginatedRequest):
+    """Base DTO for list queries that can ask for a subset of result fields"""
+    
+    # Field names of the result DTO, computed once per query class
+    result_fields: ClassVar[FrozenSet[str]] = frozenset()
+    
+    fields: Optional[FrozenSet[str]] = Field(default=None, description="Result fields to return (all if omitted)")
+    
+    @field_validator('fields')
+    @classmethod
+    def validate_fields(cls, v):
+        """Validate requested fields exist on the result DTO"""
+        if v is not None:
+            unknown = v - cls.result_fields
+            if unknown:
+                raise ValueError(f"Unknown fields: {sorted(unknown)}")
+        return v
+    
+    def project(self, row: Mapping[str, Any]) -> Dict[str, Any]:
+        """Keep only the requested fields of a result row"""
+        if self.fields is None:
+            return dict(row)
+        return {name: row[name] for name in self.fields if name in row}
+
+
+# Per-filter test against a slot ``s``; ``v_<name>`` is the query's value
+_SLOT_FILTER_EXPRESSIONS = {
+    'parking_lot_id': 's.parking_lot_id == v_parking_lot_id',
+    'slot_type': 's.slot_type == v_slot_type',
+    'floor_level': 's.floor_level == v_floor_level',
+    'is_occupied': 's.is_occupied == v_is_occupied',
+    'is_reserved': 's.is_reserved == v_is_reserved',
+    'vehicle_type': 'v_vehicle_type in s.vehicle_types',
+    'features': 'v_features.issubset(s.features)',
+    'min_hourly_rate': 's.hourly_rate.amount >= v_min_hourly_rate',
+    'max_hourly_rate': 's.hourly_rate.amount <= v_max_hourly_rate',
+}
+
+
+@lru_cache(maxsize=None)
+def _slot_predicate_factory(filter_names: Tuple[str, ...]):
+    """Compile, once per combination of active filters, a factory for the slot predicate"""
+    test = ' and '.join(_SLOT_FILTER_EXPRESSIONS[name] for name in filter_names) or 'True'
+    params = ', '.join(f'v_{name}' for name in filter_names)
+    return _compile_function('_make_predicate', [
+        f'def _make_predicate({params}):',
+        f'    return lambda s: {test}',
+    ], {})
+
+
+class ParkingSlotQueryDTO(ProjectedQueryDTO):
     """DTO for parking slot queries"""
+    result_fields: ClassVar[FrozenSet[str]] = frozenset(ParkingSlotDTO.model_fields)
+    
     parking_lot_id: Optional[UUID] = None
     slot_type: Optional[SlotTypeDTO] = None
     floor_level: Optional[int] = None
@@ -957,12 +1326,29 @@ class ParkingSlotQueryDTO(PaginatedRequest):
     is_reserved: Optional[bool] = None
     vehicle_type: Optional[VehicleTypeDTO] = None
     features: Optional[List[str]] = None
-    min_hourly_rate: Optional[Decimal] = None
-    max_hourly_rate: Optional[Decimal] = None
+    min_hourly_rate: Optional[DecimalString] = None
+    max_hourly_rate: Optional[DecimalString] = None
+    
+    def compile_predicate(self):
+        """
+        Build a filter for ParkingSlotDTO-shaped slots matching this query
+        
+        Only the filters actually set are tested, in one generated expression;
+        the compiled code is shared by all queries using the same filters.
+        """
+        values = {
+            name: getattr(self, name) for name in _SLOT_FILTER_EXPRESSIONS
+            if getattr(self, name) is not None
+        }
+        if 'features' in values:
+            values['features'] = frozenset(values['features'])
+        return _slot_predicate_factory(tuple(values))(*values.values())
 
 
-class ParkingLotQueryDTO(PaginatedRequest):
+class ParkingLotQueryDTO(ProjectedQueryDTO):
     """DTO for parking lot queries"""
+    result_fields: ClassVar[FrozenSet[str]] = frozenset(ParkingLotDTO.model_fields)
+    
     name: Optional[str] = None
     code: Optional[str] = None
     city: Optional[str] = None
@@ -974,33 +1360,39 @@ class ParkingLotQueryDTO(PaginatedRequest):
     is_active: Optional[bool] = None
 
 
-class InvoiceQueryDTO(PaginatedRequest):
+class InvoiceQueryDTO(ProjectedQueryDTO):
     """DTO for invoice queries"""
+    result_fields: ClassVar[FrozenSet[str]] = frozenset(InvoiceDTO.model_fields)
+    
     customer_id: Optional[UUID] = None
     license_plate: Optional[str] = None
     status: Optional[InvoiceStatusDTO] = None
-    min_amount: Optional[Decimal] = None
-    max_amount: Optional[Decimal] = None
+    min_amount: Optional[DecimalString] = None
+    max_amount: Optional[DecimalString] = None
     issue_date_from: Optional[date] = None
     issue_date_to: Optional[date] = None
     due_date_from: Optional[date] = None
     due_date_to: Optional[date] = None
 
 
-class PaymentQueryDTO(PaginatedRequest):
+class PaymentQueryDTO(ProjectedQueryDTO):
     """DTO for payment queries"""
+    result_fields: ClassVar[FrozenSet[str]] = frozenset(PaymentDTO.model_fields)
+    
     invoice_id: Optional[UUID] = None
     customer_id: Optional[UUID] = None
     payment_method: Optional[PaymentMethodDTO] = None
     status: Optional[PaymentStatusDTO] = None
-    min_amount: Optional[Decimal] = None
-    max_amount: Optional[Decimal] = None
+    min_amount: Optional[DecimalString] = None
+    max_amount: Optional[DecimalString] = None
     processed_date_from: Optional[date] = None
     processed_date_to: Optional[date] = None
 
 
-class ReservationQueryDTO(PaginatedRequest):
+class ReservationQueryDTO(ProjectedQueryDTO):
     """DTO for reservation queries"""
+    result_fields: ClassVar[FrozenSet[str]] = frozenset(ReservationDTO.model_fields)
+    
     customer_id: Optional[UUID] = None
     license_plate: Optional[str] = None
     parking_lot_id: Optional[UUID] = None
@@ -1015,38 +1407,92 @@ class ReservationQueryDTO(PaginatedRequest):
 # RESPONSE DTOs
 # ============================================================================
 
-class SuccessResponseDTO(BaseDTO):
+class SuccessResponseDTO(ResponseDTO):
     """Standard success response DTO"""
     success: bool = Field(default=True, description="Success flag")
     message: str = Field(description="Success message")
     data: Optional[Any] = Field(default=None, description="Response data")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Response timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Response timestamp")
 
 
-class ErrorResponseDTO(BaseDTO):
+class ErrorResponseDTO(ResponseDTO):
     """Standard error response DTO"""
     success: bool = Field(default=False, description="Success flag")
     error: str = Field(description="Error message")
     error_code: Optional[str] = Field(default=None, description="Error code")
     details: Optional[Dict[str, Any]] = Field(default=None, description="Error details")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Error timestamp")
 
 
-class ValidationErrorDTO(BaseDTO):
+class ValidationErrorDTO(ResponseDTO):
     """Validation error DTO"""
     success: bool = Field(default=False, description="Success flag")
     error: str = Field(default="Validation failed", description="Error message")
     errors: List[Dict[str, str]] = Field(description="Validation errors")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Error timestamp")
 
 
 # ============================================================================
 # DTO FACTORY AND UTILITIES
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _nested_dto_fields(dto_class: Type[BaseDTO]) -> Dict[str, Tuple[Type[BaseDTO], bool]]:
+    """Map field name -> (nested DTO class, is_list) for fields holding DTOs"""
+    nested = {}
+    for name, field_info in dto_class.model_fields.items():
+        annotation = field_info.annotation
+        is_list = False
+        # Unwrap Optional[...] and List[...]
+        while get_origin(annotation) in (Union, list, List):
+            if get_origin(annotation) in (list, List):
+                is_list = True
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(args) != 1:
+                break
+            annotation = args[0]
+        if isinstance(annotation, type) and issubclass(annotation, BaseDTO):
+            nested[name] = (annotation, is_list)
+    return nested
+
+
 class DTOFactory:
     """Factory for creating DTOs from various sources"""
     
+    @staticmethod
+    def from_trusted(dto_class: Type[T], data: Dict[str, Any]) -> T:
+        """
+        Create a DTO from trusted, already-validated data without running validators
+        
+        Intended for rows read back from the database or cache. Nested DTO
+        fields passed as dicts (e.g. InvoiceDTO.total, CustomerDTO.total_spent)
+        are constructed the same way. UUID values (e.g. from UUID columns) are
+        kept as UUID objects; only values still in their JSON string form
+        (e.g. from a JSON cache entry) go through the class's field decoders.
+        Never use this for client input.
+        """
+        decoders = dto_class._FIELD_DECODERS
+        if decoders:
+            data = {
+                k: decoders[k](v) if type(v) is str and k in decoders else v
+                for k, v in data.items()
+            }
+        nested = _nested_dto_fields(dto_class)
+        if nested:
+            data = dict(data)
+            for name, (nested_class, is_list) in nested.items():
+                value = data.get(name)
+                if value is None:
+                    continue
+                if is_list:
+                    data[name] = [
+                        DTOFactory.from_trusted(nested_class, item) if isinstance(item, dict) else item
+                        for item in value
+                    ]
+                elif isinstance(value, dict):
+                    data[name] = DTOFactory.from_trusted(nested_class, value)
+        return dto_class.model_construct(**data)
+    
     @staticmethod
     def create_parking_request(
         license_plate: str,
@@ -1109,6 +1555,16 @@ class DTOFactory:
             amount = Decimal(str(amount))
         return MoneyDTO(amount=amount, currency=currency)
     
+    @staticmethod
+    def create_money_dec(amount: Decimal, currency: str = "USD") -> MoneyDTO:
+        """
+        Create MoneyDTO from an already-computed Decimal (e.g. invoice totals)
+        
+        Skips the type check and validation done by create_money; callers must
+        pass a non-negative Decimal with at most 2 decimal places.
+        """
+        return MoneyDTO.model_construct(amount=amount, currency=currency)
+    
     @staticmethod
     def create_time_range(start_time: datetime, end_time: datetime) -> TimeRangeDTO:
         """Create TimeRangeDTO"""
@@ -1131,9 +1587,35 @@ class DTOValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return _is_valid_email(email)
+    
+    @staticmethod
+    def validate_emails_bulk(emails: Iterable[str]) -> List[bool]:
+        """
+        Validate many emails at once (e.g. bulk customer import)
+        
+        With hyperscan installed, all emails are scanned in a single pass over
+        one newline-joined buffer; otherwise each is checked with the compiled
+        regex. Returns one flag per email, in input order.
+        """
+        emails = list(emails)
+        if _EMAIL_DATABASE is None or any('\n' in email for email in emails):
+            return [_is_valid_email(email) for email in emails]
+        
+        # Anchored per line, so a match ending at a line's end offset means the whole line matched
+        match_ends = set()
+        _EMAIL_DATABASE.scan(
+            "\n".join(emails).encode(),
+            match_event_handler=lambda pattern_id, start, end, flags, context: match_ends.add(end)
+        )
+        
+        results = []
+        offset = 0
+        for email in emails:
+            offset += len(email.encode())
+            results.append(offset in match_ends)
+            offset += 1  # newline separator
+        return results
     
     @staticmethod
     def validate_license_plate(plate: str, country_code: Optional[str] = None) -> bool:
@@ -1147,16 +1629,77 @@ class DTOValidator:
 # SERIALIZATION UTILITIES
 # ============================================================================
 
+# Dataclasses are native since orjson 3.x; the flag is kept for older releases
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for types it does not serialize natively"""
+    if isinstance(obj, ValueDTO):
+        return obj._as_dict
+    if isinstance(obj, BaseModel):
+        # Shallow: orjson recurses into the field values itself
+        return dict(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_json(payload: Any) -> bytes:
+    """The one orjson call behind every DTO serializer"""
+    return orjson.dumps(payload, default=_json_default, option=_ORJSON_OPTIONS)
+
+
 class DTOSerializer:
     """Serializer for DTOs"""
     
     @staticmethod
-    def serialize(dto: BaseDTO, **kwargs) -> str:
-        """Serialize DTO to JSON"""
-        return dto.to_json(**kwargs)
+    def serialize_response(payload: Any) -> bytes:
+        """
+        Render a response body (a DTO, a list of DTOs or a dict) to JSON bytes
+        
+        orjson walks the payload natively (datetime, date, UUID and enums
+        included), so API adapters can return the bytes as the body directly.
+        """
+        return _encode_json(payload)
+    
+    @staticmethod
+    def serialize_bytes(dto: Any) -> bytes:
+        """
+        Serialize a single DTO straight to JSON bytes
+        
+        Accepts pydantic DTOs and the application service's dataclass DTOs
+        alike; orjson walks dataclass instances itself, so no ``asdict`` or
+        ``to_dict`` pass is made before encoding.
+        """
+        return _encode_json(dto)
+    
+    @staticmethod
+    def serialize_many(dtos: Sequence[Any]) -> bytes:
+        """
+        Serialize a collection of DTOs as one JSON array in a single orjson call
+        
+        Use instead of joining per-DTO ``serialize`` results for list responses.
+        """
+        if not isinstance(dtos, (list, tuple)):
+            dtos = list(dtos)
+        return _encode_json(dtos)
+    
+    @staticmethod
+    def serialize(dto: BaseDTO, exclude_none: bool = False, **kwargs) -> str:
+        """
+        Serialize DTO to JSON
+        
+        ``exclude_none`` and any ``model_dump`` options (include, exclude,
+        by_alias, ...) are applied through ``to_dict`` before encoding.
+        """
+        if exclude_none or kwargs:
+            return _encode_json(dto.to_dict(exclude_none=exclude_none, **kwargs)).decode()
+        # orjson walks the DTO itself; no intermediate to_dict pass
+        return _encode_json(dto).decode()
     
     @staticmethod
-    def deserialize(json_str: str, dto_class: Type[T]) -> T:
+    def deserialize(json_str: Union[str, bytes], dto_class: Type[T]) -> T:
         """Deserialize JSON to DTO"""
         return dto_class.from_json(json_str)
     
@@ -1170,68 +1713,3 @@ class DTOSerializer:
         """Create DTO from dictionary"""
         return dto_class.from_dict(data)
 
-
-# ============================================================================
-# EXAMPLE USAGE
-# ============================================================================
-
-def example_usage():
-    """Example usage of DTOs"""
-    
-    # Create a parking request DTO
-    parking_request = ParkingRequestDTO(
-        license_plate="ABC-123",
-        vehicle_type=VehicleTypeDTO.CAR,
-        parking_lot_id=uuid4(),
-        preferences={"preferred_slot_type": "premium"}
-    )
-    
-    print(f"Parking Request: {parking_request.to_dict()}")
-    
-    # Create a money DTO
-    money = MoneyDTO(amount=Decimal("15.75"), currency="USD")
-    print(f"Money: {money.amount} {money.currency}")
-    
-    # Create a charging request DTO
-    charging_request = ChargingRequestDTO(
-        license_plate="EV-456",
-        vehicle_type=VehicleTypeDTO.EV_CAR,
-        station_id=uuid4(),
-        current_charge_percentage=20.0,
-        target_charge_percentage=80.0,
-        battery_capacity_kwh=60.0,
-        charging_strategy=ChargingStrategyTypeDTO.FAST
-    )
-    
-    print(f"Charging Request: {charging_request.to_dict()}")
-    
-    # Serialize to JSON
-    json_str = parking_request.to_json()
-    print(f"JSON: {json_str}")
-    
-    # Deserialize from JSON
-    deserialized = ParkingRequestDTO.from_json(json_str)
-    print(f"Deserialized: {deserialized.license_plate}")
-    
-    # Create paginated query
-    query = ParkingSlotQueryDTO(
-        page=1,
-        page_size=10,
-        slot_type=SlotTypeDTO.EV,
-        is_occupied=False
-    )
-    
-    print(f"Query: Page {query.page}, Size {query.page_size}")
-    
-    # Create error response
-    error_response = ErrorResponseDTO(
-        error="Parking lot is full",
-        error_code="PARKING_LOT_FULL",
-        details={"parking_lot_id": str(uuid4()), "occupancy_rate": 1.0}
-    )
-    
-    print(f"Error Response: {error_response.error}")
-
-
-if __name__ == "__main__":
-    example_usage()
\ No newline at end of file
@@ -20,13 +20,24 @@ Key Principles:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple, Protocol, runtime_checkable
+from typing import Dict, List, Optional, Any, Tuple, Union, Protocol, runtime_checkable
 from datetime import datetime, timedelta
 from decimal import Decimal
+import base64
+from collections import deque
+import itertools
 import logging
-from dataclasses import dataclass, asdict
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+import threading
+import time
+from dataclasses import MISSING, dataclass, field, fields, replace
 from enum import Enum
 
+import orjson
+
 from ..domain.models import (
     ParkingSlot, Vehicle, ElectricVehicle,
     VehicleType, SlotType, ChargerType,
@@ -41,7 +52,7 @@ from ..domain.strategies import (
     StandardPricingStrategy, DynamicPricingStrategy, SubscriptionPricingStrategy
 )
 from ..domain.bounded_contexts import (
-    ContextMapper, ParkingManagementContext,
+    ContextMapper, ParkingManagementContext, ShardedParkingContext,
     BillingPricingContext, EVChargingContext,
     SecurityValidationContext, MonitoringAnalyticsContext
 )
@@ -51,7 +62,90 @@ from ..domain.bounded_contexts import (
 # DATA TRANSFER OBJECTS (DTOs)
 # ============================================================================
 
-@dataclass
+# Field metadata for state only the service may set (e.g. the ingress
+# validation outcome): never read from or written to plain dicts
+_SERVICE_ONLY = {"service_only": True}
+
+
+def _external_fields(cls) -> List[Any]:
+    """Fields that may appear in a DTO's dict form"""
+    return [f for f in fields(cls) if not f.metadata.get("service_only", False)]
+
+
+def _from_dict_source(cls, namespace: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Source for building ``cls`` from a dict named ``data``
+    
+    Returns the unknown-key check statement and the positional argument list;
+    defaults and factories they refer to are added to ``namespace``.
+    """
+    namespace['_FIELDS'] = frozenset(f.name for f in _external_fields(cls))
+    args = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        if f.default is not MISSING:
+            namespace[f'_default_{f.name}'] = f.default
+            args.append(f'data.get({f.name!r}, _default_{f.name})')
+        elif f.default_factory is not MISSING:
+            namespace[f'_factory_{f.name}'] = f.default_factory
+            args.append(f'data[{f.name!r}] if {f.name!r} in data else _factory_{f.name}()')
+        else:
+            args.append(f'data[{f.name!r}]')
+    check = (
+        '    if not data.keys() <= _FIELDS:\n'
+        f'        raise TypeError(f"{cls.__name__} got unexpected fields: {{sorted(data.keys() - _FIELDS)}}")\n'
+    )
+    return check, ", ".join(args)
+
+
+def _positional_from_dict(cls):
+    """
+    Attach a generated ``from_dict`` that passes every field positionally
+    
+    Avoids building and walking a kwargs dict per construction; unknown keys
+    are still rejected with TypeError, as ``cls(**data)`` would. Derived
+    (``init=False``) fields are accepted and ignored, so ``to_dict`` output
+    round-trips; service-only fields are rejected like unknown keys.
+    """
+    namespace: Dict[str, Any] = {}
+    check, args = _from_dict_source(cls, namespace)
+    exec(f'def from_dict(cls, data):\n{check}    return cls({args})', namespace)
+    cls.from_dict = classmethod(namespace['from_dict'])
+    return cls
+
+
+def _specialized_handler(request_cls, execute):
+    """
+    Generate ``handle(data)`` that builds ``request_cls`` inline and calls ``execute``
+    
+    Same construction as ``request_cls.from_dict``, without the classmethod
+    call or the parse/execute pair lookup per command.
+    """
+    namespace: Dict[str, Any] = {'_cls': request_cls, '_execute': execute}
+    check, args = _from_dict_source(request_cls, namespace)
+    exec(f'def handle(data):\n{check}    return _execute(_cls({args}))', namespace)
+    return namespace['handle']
+
+
+def _generated_to_dict(cls):
+    """
+    Attach a generated ``to_dict`` returning a shallow dict of every field
+    
+    Unlike ``asdict`` it does not deep-copy values; nested dicts (request
+    preferences) are shared with the DTO. Service-only fields are left out.
+    """
+    items = ", ".join(f"{f.name!r}: self.{f.name}" for f in _external_fields(cls))
+    namespace: Dict[str, Any] = {}
+    exec(f'def to_dict(self):\n    return {{{items}}}', namespace)
+    namespace['to_dict'].__qualname__ = f'{cls.__qualname__}.to_dict'
+    cls.to_dict = namespace['to_dict']
+    return cls
+
+
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(slots=True)
 class VehicleDTO:
     """DTO for vehicle information"""
     license_plate: str
@@ -64,7 +158,9 @@ class VehicleDTO:
     disabled_permit: bool = False
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(frozen=True, slots=True)
 class ParkingRequestDTO:
     """DTO for parking requests"""
     license_plate: str
@@ -74,9 +170,19 @@ class ParkingRequestDTO:
     preferences: Optional[Dict[str, Any]] = None
     customer_id: Optional[str] = None
     requires_charging: bool = False
+    # Set only by ParkingService.validate_request; rejected in command data
+    validated: bool = field(default=False, init=False, compare=False, metadata=_SERVICE_ONLY)
+    validation_error: Optional[str] = field(default=None, init=False, compare=False, metadata=_SERVICE_ONLY)
+    is_electric: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Resolved once here; an unknown vehicle type is reported by the service
+        object.__setattr__(self, "is_electric", _is_electric(self.vehicle_type))
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(slots=True)
 class ParkingAllocationDTO:
     """DTO for parking allocation results"""
     success: bool
@@ -90,16 +196,20 @@ class ParkingAllocationDTO:
     timestamp: Optional[datetime] = None
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(frozen=True, slots=True)
 class ExitRequestDTO:
     """DTO for exit requests"""
+    parking_lot_id: str
     ticket_id: Optional[str] = None
     license_plate: Optional[str] = None
-    parking_lot_id: str
     exit_time: Optional[datetime] = None
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(slots=True)
 class ParkingExitDTO:
     """DTO for parking exit results"""
     success: bool
@@ -112,7 +222,9 @@ class ParkingExitDTO:
     message: Optional[str] = None
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(frozen=True, slots=True)
 class ChargingRequestDTO:
     """DTO for charging requests"""
     license_plate: str
@@ -123,9 +235,16 @@ class ChargingRequestDTO:
     battery_capacity_kwh: float
     charging_strategy: str = "balanced"  # "fast", "cost_optimized", "balanced"
     customer_id: Optional[str] = None
+    is_electric: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Resolved once here; an unknown vehicle type is reported by the service
+        object.__setattr__(self, "is_electric", _is_electric(self.vehicle_type))
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(slots=True)
 class ChargingSessionDTO:
     """DTO for charging session results"""
     success: bool
@@ -138,7 +257,9 @@ class ChargingSessionDTO:
     strategy_used: Optional[str] = None
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(slots=True)
 class InvoiceDTO:
     """DTO for invoice information"""
     invoice_id: str
@@ -152,7 +273,12 @@ class InvoiceDTO:
     services: List[Dict[str, Any]] = None
 
 
-@dataclass
+# Slot type order of the per-type count tuples in ParkingLotStatusDTO
+SLOT_TYPE_ORDER: Tuple[str, ...] = tuple(slot_type.value for slot_type in SlotType)
+
+
+@_positional_from_dict
+@dataclass(slots=True)
 class ParkingLotStatusDTO:
     """DTO for parking lot status"""
     parking_lot_id: str
@@ -160,11 +286,37 @@ class ParkingLotStatusDTO:
     occupied_slots: int
     available_slots: int
     occupancy_rate: float
-    by_slot_type: Dict[str, Dict[str, int]]
+    slot_totals: Tuple[int, ...]  # Indexed like SLOT_TYPE_ORDER
+    slot_occupied: Tuple[int, ...]  # Indexed like SLOT_TYPE_ORDER
     timestamp: datetime
+    
+    @property
+    def by_slot_type(self) -> Dict[str, Dict[str, Any]]:
+        """Per-type counts in the nested-dict shape, built on demand"""
+        return {
+            slot_type: {
+                "occupied": occupied, "total": total, "available": total - occupied,
+                "rate": occupied / total if total > 0 else 0
+            }
+            for slot_type, total, occupied in zip(SLOT_TYPE_ORDER, self.slot_totals, self.slot_occupied)
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Response shape: per-type counts are emitted as ``by_slot_type``"""
+        return {
+            "parking_lot_id": self.parking_lot_id,
+            "total_slots": self.total_slots,
+            "occupied_slots": self.occupied_slots,
+            "available_slots": self.available_slots,
+            "occupancy_rate": self.occupancy_rate,
+            "by_slot_type": self.by_slot_type,
+            "timestamp": self.timestamp,
+        }
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(frozen=True, slots=True)
 class ReservationRequestDTO:
     """DTO for reservation requests"""
     license_plate: str
@@ -174,9 +326,14 @@ class ReservationRequestDTO:
     end_time: datetime
     preferred_slot_type: Optional[str] = None
     customer_id: Optional[str] = None
+    # Set only by ParkingService.validate_request; rejected in command data
+    validated: bool = field(default=False, init=False, compare=False, metadata=_SERVICE_ONLY)
+    validation_error: Optional[str] = field(default=None, init=False, compare=False, metadata=_SERVICE_ONLY)
 
 
-@dataclass
+@_positional_from_dict
+@_generated_to_dict
+@dataclass(slots=True)
 class ReservationDTO:
     """DTO for reservation results"""
     success: bool
@@ -272,10 +429,101 @@ class ReservationError(ParkingServiceError):
     pass
 
 
+class _NowCache:
+    """Wall-clock time refreshed at most once per resolution window"""
+    
+    __slots__ = ('_resolution_ns', '_last_ns', '_last_dt')
+    
+    def __init__(self, resolution_ms: int = 50):
+        self._resolution_ns = resolution_ms * 1_000_000
+        self._last_dt = datetime.now()
+        self._last_ns = time.monotonic_ns()
+    
+    def now(self) -> datetime:
+        current_ns = time.monotonic_ns()
+        if current_ns - self._last_ns >= self._resolution_ns:
+            self._last_dt = datetime.now()
+            self._last_ns = current_ns
+        return self._last_dt
+
+
+_now_cache = _NowCache()
+
+
+class StripedLock:
+    """Fixed set of locks selected by key hash, so unrelated keys rarely contend"""
+    
+    __slots__ = ('_locks',)
+    
+    def __init__(self, stripes: int = 64):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+    
+    def get(self, key: Any) -> threading.Lock:
+        """Lock guarding ``key``; equal keys always map to the same lock"""
+        return self._locks[hash(key) % len(self._locks)]
+
+
+def now_coarse() -> datetime:
+    """
+    Current time to within ~50ms, for response and metric timestamps
+    
+    Use datetime.now() where ordering between events matters (entry/exit times).
+    """
+    return _now_cache.now()
+
+
+_reservation_seq = itertools.count()
+
+# Per-thread buffers of pre-generated confirmation codes, refilled from one
+# os.urandom call per batch
+_code_pool = threading.local()
+_CODE_BATCH_SIZE = 256
+
+
+def _new_reservation_id() -> str:
+    """Nanosecond clock in hex plus a 16-bit sequence, unique within the process"""
+    return f"RES-{time.time_ns():x}-{next(_reservation_seq) & 0xFFFF:04x}"
+
+
+@lru_cache(maxsize=32)
+def _resolve_vehicle_type(vehicle_type: str) -> Tuple[VehicleType, bool]:
+    """Vehicle type enum and its is_electric flag for a raw request string"""
+    resolved = VehicleType(vehicle_type)
+    return resolved, resolved.is_electric
+
+
+# Raw vehicle_type strings the service accepts
+_VEHICLE_TYPE_VALUES = frozenset(vehicle_type.value for vehicle_type in VehicleType)
+
+
+def _is_electric(vehicle_type: str) -> bool:
+    """is_electric flag for a raw request string; False for unknown vehicle types"""
+    try:
+        return _resolve_vehicle_type(vehicle_type)[1]
+    except ValueError:
+        return False
+
+
 # ============================================================================
 # MAIN PARKING SERVICE
 # ============================================================================
 
+# Queued after the last metric command to stop the recorder thread
+_STOP_METRICS: Dict[str, Any] = {"type": "stop"}
+
+# Service settings, overridable through ParkingServiceFactory.create_service_with_config
+_CONFIG_ATTRIBUTES = (
+    "max_parking_duration_hours", "grace_period_minutes", "overstay_penalty_rate",
+    "reservation_hold_minutes", "default_currency", "status_cache_ttl_seconds",
+    "idempotency_window_seconds", "idempotency_max_entries",
+    "billing_status_max_entries", "dashboard_timeout_seconds",
+    "shared_status_ttl_seconds",
+)
+
+# Sizes of the background workers; fixed once they start, so constructor-only
+_WORKER_SETTINGS = ("metric_queue_size", "billing_workers")
+
+
 class ParkingService:
     """
     Main application service for parking management
@@ -290,13 +538,45 @@ class ParkingService:
     It coordinates between bounded contexts and applies business rules.
     """
     
-    def __init__(self, context_mapper: Optional[ContextMapper] = None):
+    __slots__ = (
+        "logger", "context_mapper",
+        "parking_context", "billing_context", "charging_context",
+        "security_context", "monitoring_context",
+        "_validate_license_plate", "_check_access", "_allocate_parking",
+        "_release_parking", "_get_status_and_occupancy",
+        "parking_strategies", "pricing_strategies", "default_pricing_strategy",
+        "_parking_strategy_cache", "_pricing_strategy_cache",
+    ) + _CONFIG_ATTRIBUTES + _WORKER_SETTINGS + (
+        "_status_cache", "_status_versions", "_status_epoch", "_status_lock", "_recent_allocations", "_allocation_plates", "_allocations_lock",
+        "_metric_queue", "_metric_worker", "_workers_lock", "_closed",
+        "_billing_executor", "_billing_status", "_billing_status_lock", "_dashboard_executor",
+        "cache_client", "_lot_locks",
+    )
+    
+    # Static parts of the park_vehicle commands; copied, never mutated in place
+    _VALIDATE_LP_TEMPLATE = {"country": "default"}
+    _CHECK_ACCESS_TEMPLATE = {"facility_type": "parking"}
+    _VEHICLE_STUB = {"make": "Unknown", "model": "Unknown"}
+    _EV_VEHICLE_DEFAULTS = {"battery_capacity_kwh": 60.0, "charge_percentage": 50.0}
+    
+    def __init__(self, context_mapper: Optional[ContextMapper] = None, parking_shards: int = 1,
+                 cache_client: Any = None, metric_queue_size: int = 10_000, billing_workers: int = 4):
         """
         Initialize the parking service
         
         Args:
             context_mapper: Optional context mapper for bounded contexts.
                           If not provided, creates a standard configuration.
+            parking_shards: Number of partitions for parking lot state.
+                          With more than one, lots are spread by id over
+                          several parking contexts, and the sharded context
+                          replaces "parking_management" in the mapper.
+            cache_client: Optional shared cache (e.g. a redis.Redis client)
+                          with get/set(ex=)/delete, used as a read-through
+                          cache for parking lot status across processes.
+            metric_queue_size: Capacity of the background metric queue;
+                          metrics past it are dropped with a warning.
+            billing_workers: Number of threads running deferred exit billing.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         
@@ -309,42 +589,111 @@ class ParkingService:
         
         # Get references to contexts
         self.parking_context = self.context_mapper.contexts["parking_management"]
+        if parking_shards > 1:
+            # Registered in the mapper too, so every context routes through the shards
+            self.parking_context = ShardedParkingContext.from_context(self.parking_context, parking_shards)
+            self.context_mapper.contexts["parking_management"] = self.parking_context
         self.billing_context = self.context_mapper.contexts["billing_pricing"]
         self.charging_context = self.context_mapper.contexts["ev_charging"]
         self.security_context = self.context_mapper.contexts["security_validation"]
         self.monitoring_context = self.context_mapper.contexts["monitoring_analytics"]
         
+        # Handlers used on every park/exit/status call, resolved once instead
+        # of going through type-keyed dispatch per request
+        self._validate_license_plate = self.security_context.get_handler("validate_license_plate")
+        self._check_access = self.security_context.get_handler("check_access")
+        self._allocate_parking = self.parking_context.get_handler("allocate_parking")
+        self._release_parking = self.parking_context.get_handler("release_parking")
+        self._get_status_and_occupancy = self.parking_context.get_handler("get_status_and_occupancy")
+        
         # Initialize parking strategies registry
         self._initialize_strategies()
         
         # Service configuration
-        self.config = {
-            "max_parking_duration_hours": 168,  # 7 days
-            "grace_period_minutes": 15,
-            "overstay_penalty_rate": 1.5,  # 50% penalty
-            "reservation_hold_minutes": 30,
-            "default_currency": "USD"
-        }
+        self.max_parking_duration_hours = 168  # 7 days
+        self.grace_period_minutes = 15
+        self.overstay_penalty_rate = 1.5  # 50% penalty
+        self.reservation_hold_minutes = 30
+        self.default_currency = "USD"
+        self.status_cache_ttl_seconds = 0.5
+        self.idempotency_window_seconds = 30
+        self.idempotency_max_entries = 4096
+        self.metric_queue_size = metric_queue_size
+        self.billing_workers = billing_workers
+        self.billing_status_max_entries = 4096
+        self.dashboard_timeout_seconds = 2.0
+        self.shared_status_ttl_seconds = 2
+        
+        self.cache_client = cache_client
+        
+        # parking_lot_id -> (monotonic expiry, status); dropped on park/exit
+        self._status_cache: Dict[str, Tuple[float, ParkingLotStatusDTO]] = {}
+        # parking_lot_id -> epoch of its last invalidation; a status computed
+        # across an invalidation is returned but not cached
+        self._status_versions: Dict[str, int] = {}
+        self._status_epoch = itertools.count(1)
+        self._status_lock = threading.Lock()
+        
+        # license_plate -> (request, monotonic expiry, allocation) for retried park
+        # requests; dropped when the vehicle exits
+        self._recent_allocations: Dict[str, Tuple[ParkingRequestDTO, float, ParkingAllocationDTO]] = {}
+        # ticket_id -> license_plate of each remembered allocation, for exits by ticket
+        self._allocation_plates: Dict[str, str] = {}
+        self._allocations_lock = threading.Lock()
+        
+        # Metrics are not part of any response: a daemon thread records them
+        # off the request path. Started by the first metric, so services that
+        # never record one (mocks, short-lived factories) own no thread
+        self._metric_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=self.metric_queue_size)
+        self._metric_worker: Optional[threading.Thread] = None
+        # Guards lazy worker start-up against close()
+        self._workers_lock = threading.Lock()
+        self._closed = False
+        
+        # Exit billing (fee + invoice) runs after the exit response is returned,
+        # on workers created by the first exit; ticket_id -> billing outcome
+        self._billing_executor: Optional[ThreadPoolExecutor] = None
+        self._billing_status: Dict[str, Dict[str, Any]] = {}
+        # Billing workers and exits write statuses concurrently
+        self._billing_status_lock = threading.Lock()
+        
+        # The dashboard's status, alerts and metrics lookups are independent;
+        # their pool is created by the first get_dashboard_data call
+        self._dashboard_executor: Optional[ThreadPoolExecutor] = None
         
         self.logger.info("ParkingService initialized")
     
     def _initialize_strategies(self):
-        """Initialize parking strategies registry"""
+        """
+        Initialize parking strategies registry
+        
+        The registries hold strategy classes; each is instantiated on first
+        use through _get_parking_strategy/_get_pricing_strategy and reused.
+        """
         self.parking_strategies = {
-            VehicleType.CAR: StandardCarStrategy(),
-            VehicleType.EV_CAR: ElectricCarStrategy(),
-            VehicleType.MOTORCYCLE: MotorcycleStrategy(),
-            VehicleType.EV_MOTORCYCLE: MotorcycleStrategy(),
-            VehicleType.TRUCK: LargeVehicleStrategy(),
-            VehicleType.EV_TRUCK: LargeVehicleStrategy(),
-            VehicleType.BUS: LargeVehicleStrategy(),
+            VehicleType.CAR: StandardCarStrategy,
+            VehicleType.EV_CAR: ElectricCarStrategy,
+            VehicleType.MOTORCYCLE: MotorcycleStrategy,
+            VehicleType.EV_MOTORCYCLE: MotorcycleStrategy,
+            VehicleType.TRUCK: LargeVehicleStrategy,
+            VehicleType.EV_TRUCK: LargeVehicleStrategy,
+            VehicleType.BUS: LargeVehicleStrategy,
         }
         
         self.pricing_strategies = {
-            "standard": StandardPricingStrategy(),
-            "dynamic": DynamicPricingStrategy(),
-            "subscription": SubscriptionPricingStrategy()
+            "standard": StandardPricingStrategy,
+            "dynamic": DynamicPricingStrategy,
+            "subscription": SubscriptionPricingStrategy
         }
+        
+        self._parking_strategy_cache: Dict[VehicleType, ParkingStrategy] = {}
+        self._pricing_strategy_cache: Dict[str, PricingStrategy] = {}
+        
+        # Serializes state changes per parking lot; different lots proceed in parallel
+        self._lot_locks = StripedLock(max(64, os.cpu_count() or 1))
+        
+        # Passed straight to the billing context, which then skips its own lookup
+        self.default_pricing_strategy = self._get_pricing_strategy("standard")
     
     def park_vehicle(self, request: ParkingRequestDTO) -> ParkingAllocationDTO:
         """
@@ -358,29 +707,41 @@ class ParkingService:
         5. Update monitoring metrics
         
         Returns: Parking allocation result
+        
+        A retry of an identical request inside ``idempotency_window_seconds``
+        returns the earlier allocation instead of allocating a second slot.
         """
-        self.logger.info(f"Processing parking request for {request.license_plate}")
+        self.logger.info("Processing parking request for %s", request.license_plate)
+        
+        # Unlocked fast path for retries that arrive after the first attempt finished
+        replay = self._replayed_allocation(request)
+        if replay is not None:
+            return replay
         
         try:
-            # Step 1: Validate license plate
-            validation_result = self.security_context.execute_command({
-                "type": "validate_license_plate",
-                "license_plate": request.license_plate,
-                "country": "default"
-            })
+            # Step 1: Validate vehicle type and license plate (the plate unless
+            # already done at ingress)
+            if request.vehicle_type not in _VEHICLE_TYPE_VALUES:
+                return ParkingAllocationDTO(
+                    success=False,
+                    message=f"Unknown vehicle type: {request.vehicle_type}"
+                )
+            
+            plate_error = (
+                request.validation_error if request.validated
+                else self._license_plate_error(request.license_plate)
+            )
             
-            if not validation_result.get("success", False):
+            if plate_error is not None:
                 return ParkingAllocationDTO(
                     success=False,
-                    message=f"License plate validation failed: {validation_result.get('error')}"
+                    message=f"License plate validation failed: {plate_error}"
                 )
             
             # Step 2: Check access permissions
-            access_result = self.security_context.execute_command({
-                "type": "check_access",
-                "license_plate": request.license_plate,
-                "facility_type": "parking"
-            })
+            access_command = self._CHECK_ACCESS_TEMPLATE.copy()
+            access_command["license_plate"] = request.license_plate
+            access_result = self._check_access(access_command)
             
             if not access_result.get("access_granted", False):
                 return ParkingAllocationDTO(
@@ -390,59 +751,59 @@ class ParkingService:
             
             # Step 3: Prepare parking command
             entry_time = request.entry_time or datetime.now()
-            vehicle_data = {
-                "license_plate": request.license_plate,
-                "vehicle_type": request.vehicle_type,
-                "make": "Unknown",
-                "model": "Unknown"
-            }
+            vehicle_data = self._VEHICLE_STUB.copy()
+            vehicle_data["license_plate"] = request.license_plate
+            vehicle_data["vehicle_type"] = request.vehicle_type
             
             # Add EV-specific data if applicable
-            vehicle_type = VehicleType(request.vehicle_type)
-            if vehicle_type.is_electric and request.requires_charging:
-                vehicle_data.update({
-                    "battery_capacity_kwh": 60.0,  # Default
-                    "charge_percentage": 50.0  # Default
-                })
+            if request.is_electric and request.requires_charging:
+                vehicle_data.update(self._EV_VEHICLE_DEFAULTS)
             
             parking_command = {
-                "type": "allocate_parking",
                 "vehicle": vehicle_data,
                 "parking_lot_id": request.parking_lot_id,
                 "preferences": request.preferences or {},
                 "entry_time": entry_time.isoformat()
             }
             
-            # Step 4: Execute parking allocation
-            allocation_result = self.parking_context.execute_command(parking_command)
-            
-            if not allocation_result.get("success", False):
-                return ParkingAllocationDTO(
-                    success=False,
-                    message=f"Parking allocation failed: {allocation_result.get('error')}"
+            # Step 4: Execute parking allocation. The replay check is repeated
+            # under the lot lock so concurrent retries allocate only once
+            with self._lot_locks.get(request.parking_lot_id):
+                replay = self._replayed_allocation(request)
+                if replay is not None:
+                    return replay
+                
+                allocation_result = self._allocate_parking(parking_command)
+                
+                if not allocation_result.success:
+                    return ParkingAllocationDTO(
+                        success=False,
+                        message=f"Parking allocation failed: {allocation_result.error}"
+                    )
+                
+                allocation = ParkingAllocationDTO(
+                    success=True,
+                    ticket_id=allocation_result.ticket_id,
+                    slot_number=allocation_result.slot_number,
+                    slot_type=allocation_result.slot_type,
+                    strategy_used=allocation_result.strategy_used or "unknown",
+                    timestamp=now_coarse(),
+                    message="Vehicle parked successfully"
                 )
+                self._remember_allocation(request, allocation)
             
             # Step 5: Record monitoring metric
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "vehicle_entry",
-                "value": 1,
-                "source": request.parking_lot_id
-            })
+            self._record_metrics([
+                {"metric_type": "vehicle_entry", "value": 1, "source": request.parking_lot_id}
+            ])
+            
+            self._invalidate_status(request.parking_lot_id)
             
             # Step 6: Return allocation result
-            return ParkingAllocationDTO(
-                success=True,
-                ticket_id=allocation_result["ticket_id"],
-                slot_number=allocation_result["slot_number"],
-                slot_type=allocation_result["slot_type"],
-                strategy_used=allocation_result.get("strategy_used", "unknown"),
-                timestamp=datetime.now(),
-                message="Vehicle parked successfully"
-            )
+            return allocation
             
         except Exception as e:
-            self.logger.error(f"Error parking vehicle: {e}", exc_info=True)
+            self.logger.error("Error parking vehicle: %s", e, exc_info=True)
             return ParkingAllocationDTO(
                 success=False,
                 message=f"Internal error: {str(e)}"
@@ -454,14 +815,17 @@ class ParkingService:
         
         Use Case: Vehicle Exit
         1. Validate exit request
-        2. Calculate parking duration and fee
-        3. Generate invoice
-        4. Release parking slot
-        5. Update monitoring metrics
+        2. Release parking slot
+        3. Update monitoring metrics
+        4. Calculate parking duration and fee (deferred)
+        5. Generate invoice (deferred)
+        
+        Fee calculation and invoicing run on the billing workers after the
+        response; poll ``get_billing_status(ticket_id)`` for the invoice.
         
         Returns: Exit processing result
         """
-        self.logger.info(f"Processing exit request: {request}")
+        self.logger.info("Processing exit request: %s", request)
         
         try:
             exit_time = request.exit_time or datetime.now()
@@ -483,11 +847,11 @@ class ParkingService:
             # In real system, would retrieve from parking context
             
             # Step 3: Release parking
-            release_result = self.parking_context.execute_command({
-                "type": "release_parking",
-                "ticket_id": ticket_id,
-                "parking_lot_id": request.parking_lot_id
-            })
+            with self._lot_locks.get(request.parking_lot_id):
+                release_result = self._release_parking({
+                    "ticket_id": ticket_id,
+                    "parking_lot_id": request.parking_lot_id
+                })
             
             if not release_result.get("success", False):
                 return ParkingExitDTO(
@@ -495,75 +859,38 @@ class ParkingService:
                     message=f"Failed to release parking: {release_result.get('error')}"
                 )
             
-            # Step 4: Calculate fee
-            # In real system, would get actual entry time and calculate
-            duration_hours = 2.5  # Mock value
-            fee_calculation = self.billing_context.execute_command({
-                "type": "calculate_fee",
-                "fee_type": "parking",
-                "pricing_strategy": "standard",
-                "entry_time": (exit_time - timedelta(hours=duration_hours)).isoformat(),
-                "exit_time": exit_time.isoformat(),
-                "slot": {"type": "regular"},  # Mock slot data
-                "vehicle_type": "car"  # Mock vehicle type
-            })
-            
-            if not fee_calculation.get("success", False):
-                return ParkingExitDTO(
-                    success=False,
-                    message=f"Fee calculation failed: {fee_calculation.get('error')}"
-                )
-            
-            total_fee = fee_calculation.get("fee_amount", 0.0)
+            # Step 4: Record monitoring metric
+            self._record_metrics([
+                {"metric_type": "vehicle_exit", "value": 1, "source": request.parking_lot_id}
+            ])
             
-            # Step 5: Generate invoice
-            invoice_result = self.billing_context.execute_command({
-                "type": "generate_invoice",
-                "license_plate": request.license_plate or "UNKNOWN",
-                "services": [{
-                    "type": "parking",
-                    "details": {
-                        "duration_hours": duration_hours,
-                        "slot_type": "regular"
-                    }
-                }]
-            })
+            self._invalidate_status(request.parking_lot_id)
+            self._forget_allocation(request.license_plate, ticket_id)
             
-            if not invoice_result.get("success", False):
-                return ParkingExitDTO(
-                    success=False,
-                    message=f"Invoice generation failed: {invoice_result.get('error')}"
+            # Step 5: Hand fee calculation and invoicing to the billing workers
+            self._set_billing_status(ticket_id, {"status": "pending"})
+            try:
+                (self._billing_executor or self._billing_pool()).submit(
+                    self._finalize_billing, ticket_id, request.license_plate, request.parking_lot_id, exit_time
                 )
+            except RuntimeError:
+                # Service closed: the slot is released but nothing will bill it
+                self.logger.error("Billing unavailable after close; ticket %s not invoiced", ticket_id)
+                self._set_billing_status(ticket_id, {"status": "failed", "error": "Service closed"})
             
-            # Step 6: Record monitoring metric
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "vehicle_exit",
-                "value": 1,
-                "source": request.parking_lot_id
-            })
-            
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "revenue",
-                "value": total_fee,
-                "source": request.parking_lot_id
-            })
-            
-            # Step 7: Return exit result
+            # Step 6: Return exit result (invoice follows via get_billing_status)
             return ParkingExitDTO(
                 success=True,
                 license_plate=request.license_plate,
                 slot_number=release_result.get("slot_released"),
-                duration_hours=duration_hours,
-                total_fee=total_fee,
-                invoice_id=invoice_result.get("invoice_id"),
-                payment_required=total_fee > 0,
-                message="Vehicle exited successfully"
+                invoice_id=None,
+                total_fee=None,
+                payment_required=True,
+                message="Exit accepted; invoice pending"
             )
             
         except Exception as e:
-            self.logger.error(f"Error exiting vehicle: {e}", exc_info=True)
+            self.logger.error("Error exiting vehicle: %s", e, exc_info=True)
             return ParkingExitDTO(
                 success=False,
                 message=f"Internal error: {str(e)}"
@@ -582,12 +909,11 @@ class ParkingService:
         
         Returns: Charging session result
         """
-        self.logger.info(f"Starting charging session for {request.license_plate}")
+        self.logger.info("Starting charging session for %s", request.license_plate)
         
         try:
             # Step 1: Validate vehicle type is electric
-            vehicle_type = VehicleType(request.vehicle_type)
-            if not vehicle_type.is_electric:
+            if not request.is_electric:
                 return ChargingSessionDTO(
                     success=False,
                     message=f"Vehicle type {request.vehicle_type} is not electric"
@@ -615,12 +941,9 @@ class ParkingService:
                 )
             
             # Step 3: Record monitoring metric
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "charging_session_start",
-                "value": 1,
-                "source": request.station_id
-            })
+            self._record_metrics([
+                {"metric_type": "charging_session_start", "value": 1, "source": request.station_id}
+            ])
             
             # Step 4: Return charging session result
             return ChargingSessionDTO(
@@ -635,7 +958,7 @@ class ParkingService:
             )
             
         except Exception as e:
-            self.logger.error(f"Error starting charging session: {e}", exc_info=True)
+            self.logger.error("Error starting charging session: %s", e, exc_info=True)
             return ChargingSessionDTO(
                 success=False,
                 message=f"Internal error: {str(e)}"
@@ -652,7 +975,7 @@ class ParkingService:
         4. Generate invoice
         5. Update monitoring metrics
         """
-        self.logger.info(f"Stopping charging session {session_id}")
+        self.logger.info("Stopping charging session %s", session_id)
         
         try:
             # Step 1: Stop charging session
@@ -675,25 +998,17 @@ class ParkingService:
             fee_calculation = self.billing_context.execute_command({
                 "type": "calculate_fee",
                 "fee_type": "charging",
+                "strategy": self.default_pricing_strategy,
                 "energy_kwh": energy_kwh,
                 "charger_type": "DC_FAST",  # Mock
-                "time_of_day": datetime.now().isoformat()
-            })
-            
-            # Step 3: Record monitoring metric
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "charging_session_stop",
-                "value": 1,
-                "source": station_id
+                "time_of_day": datetime.now()
             })
             
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "charging_energy",
-                "value": energy_kwh,
-                "source": station_id
-            })
+            # Step 3: Record monitoring metrics
+            self._record_metrics([
+                {"metric_type": "charging_session_stop", "value": 1, "source": station_id},
+                {"metric_type": "charging_energy", "value": energy_kwh, "source": station_id}
+            ])
             
             return {
                 "success": True,
@@ -705,7 +1020,7 @@ class ParkingService:
             }
             
         except Exception as e:
-            self.logger.error(f"Error stopping charging session: {e}", exc_info=True)
+            self.logger.error("Error stopping charging session: %s", e, exc_info=True)
             return {
                 "success": False,
                 "error": str(e)
@@ -720,43 +1035,108 @@ class ParkingService:
         2. Get availability by slot type
         3. Get recent activity
         4. Return formatted status
+        
+        Results are reused for ``status_cache_ttl_seconds`` (polling dashboards
+        hit this several times a second) and, when a ``cache_client`` is set,
+        shared with other processes for ``shared_status_ttl_seconds``. Parking,
+        exits and reservations in this process drop both entries; changes made
+        by other processes drop only the shared entry, so this process's local
+        entry can lag them by up to ``status_cache_ttl_seconds``.
+        The returned DTO may be shared between callers and must not be mutated.
         """
-        self.logger.debug(f"Getting status for parking lot {parking_lot_id}")
+        self.logger.debug("Getting status for parking lot %s", parking_lot_id)
+        
+        cached = self._status_cache.get(parking_lot_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        version = self._status_versions.get(parking_lot_id)
+        
+        status = self._get_shared_status(parking_lot_id)
+        if status is not None:
+            self._cache_status(status, version)
+            return status
         
         try:
-            # Step 1: Get occupancy information
-            occupancy_result = self.parking_context.execute_query({
-                "type": "get_occupancy",
-                "parking_lot_id": parking_lot_id
-            })
-            
-            if not occupancy_result.get("success", False):
-                raise ParkingServiceError(f"Failed to get occupancy: {occupancy_result.get('error')}")
-            
-            # Step 2: Get parking status
-            status_result = self.parking_context.execute_query({
-                "type": "get_parking_status",
+            # Step 1: Get status and per-type occupancy in one pass
+            status_result = self._get_status_and_occupancy({
                 "parking_lot_id": parking_lot_id
             })
             
             if not status_result.get("success", False):
                 raise ParkingServiceError(f"Failed to get parking status: {status_result.get('error')}")
             
-            # Step 3: Format and return status
-            return ParkingLotStatusDTO(
+            # Step 2: Format and return status
+            status = ParkingLotStatusDTO(
                 parking_lot_id=parking_lot_id,
                 total_slots=status_result["total_slots"],
                 occupied_slots=status_result["occupied_slots"],
                 available_slots=status_result["available_slots"],
                 occupancy_rate=status_result["occupancy_rate"],
-                by_slot_type=occupancy_result.get("by_slot_type", {}),
-                timestamp=datetime.now()
+                slot_totals=status_result["total_by_type"],
+                slot_occupied=status_result["occupied_by_type"],
+                timestamp=now_coarse()
             )
+            if self._cache_status(status, version):
+                self._set_shared_status(status, version)
+            return status
             
         except Exception as e:
-            self.logger.error(f"Error getting parking lot status: {e}", exc_info=True)
+            self.logger.error("Error getting parking lot status: %s", e, exc_info=True)
             raise
     
+    def _cache_status(self, status: ParkingLotStatusDTO, version: Optional[int]) -> bool:
+        """Cache a status read at ``version`` locally, unless the lot was invalidated since"""
+        with self._status_lock:
+            if self._status_versions.get(status.parking_lot_id) != version:
+                return False
+            self._status_cache[status.parking_lot_id] = (
+                time.monotonic() + self.status_cache_ttl_seconds, status
+            )
+            return True
+    
+    def _invalidate_status(self, parking_lot_id: str):
+        """Drop a lot's cached status, locally and in the shared cache"""
+        with self._status_lock:
+            self._status_versions[parking_lot_id] = next(self._status_epoch)
+            self._status_cache.pop(parking_lot_id, None)
+        if self.cache_client is not None:
+            try:
+                self.cache_client.delete(f"lot:status:{parking_lot_id}")
+            except Exception as e:
+                self.logger.warning("Failed to invalidate shared status for %s: %s", parking_lot_id, e)
+    
+    def _get_shared_status(self, parking_lot_id: str) -> Optional[ParkingLotStatusDTO]:
+        """Read a lot's status from the shared cache; None on miss or cache error"""
+        if self.cache_client is None:
+            return None
+        try:
+            payload = self.cache_client.get(f"lot:status:{parking_lot_id}")
+            if not payload:
+                return None
+            data = orjson.loads(payload)
+            data["slot_totals"] = tuple(data["slot_totals"])
+            data["slot_occupied"] = tuple(data["slot_occupied"])
+            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+            return ParkingLotStatusDTO.from_dict(data)
+        except Exception as e:
+            self.logger.warning("Failed to read shared status for %s: %s", parking_lot_id, e)
+            return None
+    
+    def _set_shared_status(self, status: ParkingLotStatusDTO, version: Optional[int]):
+        """Publish a freshly computed status to the shared cache"""
+        if self.cache_client is None:
+            return
+        key = f"lot:status:{status.parking_lot_id}"
+        try:
+            # The dataclass fields, flat tuples included, not the to_dict response shape
+            self.cache_client.set(key, orjson.dumps(status), ex=self.shared_status_ttl_seconds)
+            if self._status_versions.get(status.parking_lot_id) != version:
+                # Invalidated while publishing; its delete may have run before the set
+                self.cache_client.delete(key)
+        except Exception as e:
+            self.logger.warning("Failed to write shared status for %s: %s", status.parking_lot_id, e)
+    
     def make_reservation(self, request: ReservationRequestDTO) -> ReservationDTO:
         """
         Make a parking reservation
@@ -770,7 +1150,7 @@ class ParkingService:
         
         Returns: Reservation result
         """
-        self.logger.info(f"Processing reservation for {request.license_plate}")
+        self.logger.info("Processing reservation for %s", request.license_plate)
         
         try:
             # Step 1: Validate time range
@@ -780,50 +1160,50 @@ class ParkingService:
                     message="End time must be after start time"
                 )
             
-            # Step 2: Validate license plate
-            validation_result = self.security_context.execute_command({
-                "type": "validate_license_plate",
-                "license_plate": request.license_plate
-            })
+            # Step 2: Validate license plate, unless already done at ingress
+            plate_error = (
+                request.validation_error if request.validated
+                else self._license_plate_error(request.license_plate)
+            )
             
-            if not validation_result.get("success", False):
+            if plate_error is not None:
                 return ReservationDTO(
                     success=False,
-                    message=f"Invalid license plate: {validation_result.get('error')}"
+                    message=f"Invalid license plate: {plate_error}"
                 )
             
-            # Step 3: Check availability
-            availability_result = self.parking_context.execute_query({
-                "type": "get_available_slots",
-                "parking_lot_id": request.parking_lot_id,
-                "vehicle_type": request.vehicle_type
-            })
+            # Step 3: Check availability and create the reservation under the lot lock
+            with self._lot_locks.get(request.parking_lot_id):
+                availability_result = self.parking_context.execute_query({
+                    "type": "get_available_slots",
+                    "parking_lot_id": request.parking_lot_id,
+                    "vehicle_type": request.vehicle_type
+                })
             
-            if not availability_result.get("success", False):
-                return ReservationDTO(
-                    success=False,
-                    message=f"Failed to check availability: {availability_result.get('error')}"
-                )
+                if not availability_result.get("success", False):
+                    return ReservationDTO(
+                        success=False,
+                        message=f"Failed to check availability: {availability_result.get('error')}"
+                    )
             
-            available_slots = availability_result.get("available_slots", 0)
-            if available_slots == 0:
-                return ReservationDTO(
-                    success=False,
-                    message="No available slots for reservation"
-                )
+                available_slots = availability_result.get("available_slots", 0)
+                if available_slots == 0:
+                    return ReservationDTO(
+                        success=False,
+                        message="No available slots for reservation"
+                    )
             
-            # Step 4: Create reservation
-            # In real system, would use a reservation context
-            reservation_id = f"RES-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-            confirmation_code = self._generate_confirmation_code()
+                # Step 4: Create reservation
+                # In real system, would use a reservation context
+                reservation_id = _new_reservation_id()
+                confirmation_code = self._generate_confirmation_code()
             
             # Step 5: Record monitoring metric
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "reservation_made",
-                "value": 1,
-                "source": request.parking_lot_id
-            })
+            self._record_metrics([
+                {"metric_type": "reservation_made", "value": 1, "source": request.parking_lot_id}
+            ])
+            
+            self._invalidate_status(request.parking_lot_id)
             
             # Step 6: Return reservation result
             return ReservationDTO(
@@ -836,7 +1216,7 @@ class ParkingService:
             )
             
         except Exception as e:
-            self.logger.error(f"Error making reservation: {e}", exc_info=True)
+            self.logger.error("Error making reservation: %s", e, exc_info=True)
             return ReservationDTO(
                 success=False,
                 message=f"Internal error: {str(e)}"
@@ -853,28 +1233,25 @@ class ParkingService:
         4. Process refund if applicable
         5. Update monitoring metrics
         """
-        self.logger.info(f"Cancelling reservation {reservation_id}")
+        self.logger.info("Cancelling reservation %s", reservation_id)
         
         try:
             # In real system, would validate and cancel reservation
             # For now, return mock result
             
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "reservation_cancelled",
-                "value": 1,
-                "source": "reservation_system"
-            })
+            self._record_metrics([
+                {"metric_type": "reservation_cancelled", "value": 1, "source": "reservation_system"}
+            ])
             
             return {
                 "success": True,
                 "reservation_id": reservation_id,
-                "cancelled_at": datetime.now().isoformat(),
+                "cancelled_at": now_coarse().isoformat(),
                 "message": "Reservation cancelled successfully"
             }
             
         except Exception as e:
-            self.logger.error(f"Error cancelling reservation: {e}", exc_info=True)
+            self.logger.error("Error cancelling reservation: %s", e, exc_info=True)
             return {
                 "success": False,
                 "error": str(e)
@@ -890,7 +1267,7 @@ class ParkingService:
         3. Format invoice data
         4. Return invoice DTO
         """
-        self.logger.debug(f"Getting invoice {invoice_id}")
+        self.logger.debug("Getting invoice %s", invoice_id)
         
         try:
             # Step 1: Get invoice from billing context
@@ -918,7 +1295,7 @@ class ParkingService:
             )
             
         except Exception as e:
-            self.logger.error(f"Error getting invoice: {e}", exc_info=True)
+            self.logger.error("Error getting invoice: %s", e, exc_info=True)
             raise
     
     def process_payment(self, invoice_id: str, payment_method: str, amount: float) -> Dict[str, Any]:
@@ -932,7 +1309,7 @@ class ParkingService:
         4. Generate receipt
         5. Update monitoring metrics
         """
-        self.logger.info(f"Processing payment for invoice {invoice_id}")
+        self.logger.info("Processing payment for invoice %s", invoice_id)
         
         try:
             # Step 1: Process payment through billing context
@@ -950,12 +1327,9 @@ class ParkingService:
                 }
             
             # Step 2: Record monitoring metric
-            self.monitoring_context.execute_command({
-                "type": "record_metric",
-                "metric_type": "payment_processed",
-                "value": amount,
-                "source": payment_method
-            })
+            self._record_metrics([
+                {"metric_type": "payment_processed", "value": amount, "source": payment_method}
+            ])
             
             # Step 3: Return payment result
             return {
@@ -964,12 +1338,12 @@ class ParkingService:
                 "invoice_id": invoice_id,
                 "amount_paid": amount,
                 "payment_status": payment_result.get("payment_status"),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_coarse().isoformat(),
                 "message": "Payment processed successfully"
             }
             
         except Exception as e:
-            self.logger.error(f"Error processing payment: {e}", exc_info=True)
+            self.logger.error("Error processing payment: %s", e, exc_info=True)
             return {
                 "success": False,
                 "error": str(e)
@@ -989,6 +1363,31 @@ class ParkingService:
             "license_plate": license_plate
         })
     
+    def validate_request(
+        self, request: Union[ParkingRequestDTO, ReservationRequestDTO]
+    ) -> Union[ParkingRequestDTO, ReservationRequestDTO]:
+        """
+        Validate a parking or reservation request's license plate once, at ingress
+        
+        Returns a copy of the request carrying the outcome, which
+        park_vehicle and make_reservation use instead of validating again.
+        The outcome fields cannot be passed to the constructor or from_dict,
+        so this is the only way a request becomes validated.
+        """
+        validated = replace(request)
+        object.__setattr__(validated, "validated", True)
+        object.__setattr__(validated, "validation_error", self._license_plate_error(request.license_plate))
+        return validated
+    
+    def _license_plate_error(self, license_plate: str) -> Optional[str]:
+        """Run license plate validation; None if the plate is accepted"""
+        validation_command = self._VALIDATE_LP_TEMPLATE.copy()
+        validation_command["license_plate"] = license_plate
+        validation_result = self._validate_license_plate(validation_command)
+        if validation_result.get("success", False):
+            return None
+        return validation_result.get("error") or "validation failed"
+    
     def get_dashboard_data(self, parking_lot_id: str) -> Dict[str, Any]:
         """
         Get dashboard data for monitoring
@@ -1003,61 +1402,298 @@ class ParkingService:
         try:
             dashboard_data = {}
             
+            # Fetch status, alerts and metrics concurrently; anything failed or
+            # not back within dashboard_timeout_seconds falls back to its empty value
+            executor = self._dashboard_executor or self._dashboard_pool()
+            futures = {
+                "parking status": executor.submit(
+                    self._safe_query, "parking status", self.get_parking_lot_status, parking_lot_id
+                ),
+                "alerts": executor.submit(
+                    self._safe_query, "alerts", self.monitoring_context.execute_query, {
+                        "type": "get_alerts"
+                    }
+                ),
+                "metrics": executor.submit(
+                    self._safe_query, "metrics", self.monitoring_context.execute_query, {
+                        "type": "get_metrics",
+                        "metric_types": ["occupancy_rate", "revenue", "vehicle_entry"],
+                        "limit": 10
+                    }
+                ),
+            }
+            wait(futures.values(), timeout=self.dashboard_timeout_seconds)
+            results = {}
+            for name, future in futures.items():
+                if future.done():
+                    results[name] = future.result()
+                else:
+                    self.logger.warning("Timed out getting %s", name)
+                    results[name] = (False, None)
+            
             # Get parking lot status
-            try:
-                status = self.get_parking_lot_status(parking_lot_id)
-                dashboard_data["parking_status"] = asdict(status)
-            except Exception as e:
-                self.logger.warning(f"Failed to get parking status: {e}")
-                dashboard_data["parking_status"] = None
+            ok, status = results["parking status"]
+            dashboard_data["parking_status"] = status.to_dict() if ok else None
             
             # Get active alerts
-            try:
-                alerts_result = self.monitoring_context.execute_query({
-                    "type": "get_alerts"
-                })
-                dashboard_data["alerts"] = alerts_result.get("active_alerts", [])
-            except Exception as e:
-                self.logger.warning(f"Failed to get alerts: {e}")
-                dashboard_data["alerts"] = []
+            ok, alerts_result = results["alerts"]
+            dashboard_data["alerts"] = alerts_result.get("active_alerts", []) if ok else []
             
             # Get recent metrics
-            try:
-                metrics_result = self.monitoring_context.execute_query({
-                    "type": "get_metrics",
-                    "metric_types": ["occupancy_rate", "revenue", "vehicle_entry"],
-                    "limit": 10
-                })
-                dashboard_data["recent_metrics"] = metrics_result.get("metrics", [])
-            except Exception as e:
-                self.logger.warning(f"Failed to get metrics: {e}")
-                dashboard_data["recent_metrics"] = []
+            ok, metrics_result = results["metrics"]
+            dashboard_data["recent_metrics"] = metrics_result.get("metrics", []) if ok else []
             
-            dashboard_data["timestamp"] = datetime.now().isoformat()
+            dashboard_data["timestamp"] = now_coarse().isoformat()
             dashboard_data["success"] = True
             
             return dashboard_data
             
         except Exception as e:
-            self.logger.error(f"Error getting dashboard data: {e}", exc_info=True)
+            self.logger.error("Error getting dashboard data: %s", e,
+                              exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return {
                 "success": False,
                 "error": str(e)
             }
     
+    def _dashboard_pool(self) -> ThreadPoolExecutor:
+        """Create the dashboard executor once; RuntimeError after close()"""
+        with self._workers_lock:
+            if self._closed:
+                raise RuntimeError("Service closed")
+            if self._dashboard_executor is None:
+                self._dashboard_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="dashboard")
+            return self._dashboard_executor
+    
+    def _safe_query(self, name: str, query_fn, *args) -> Tuple[bool, Any]:
+        """Run a dashboard sub-query, returning (ok, result) instead of raising"""
+        try:
+            return True, query_fn(*args)
+        except Exception as e:
+            self.logger.warning("Failed to get %s: %s", name, e)
+            return False, None
+    
+    def _record_metrics(self, metrics: List[Dict[str, Any]]):
+        """Queue all monitoring metrics of one operation as a single command"""
+        if self._metric_worker is None and not self._start_metric_worker():
+            self.logger.warning("Service closed, dropping %d metric(s)", len(metrics))
+            return
+        try:
+            self._metric_queue.put_nowait({
+                "type": "record_metrics",
+                "metrics": metrics,
+                "timestamp": now_coarse()
+            })
+        except queue.Full:
+            self.logger.warning("Metric queue full, dropping %d metric(s)", len(metrics))
+    
+    def _start_metric_worker(self) -> bool:
+        """Start the metric recorder thread once; False after close()"""
+        with self._workers_lock:
+            if self._closed:
+                return False
+            if self._metric_worker is None:
+                worker = threading.Thread(target=self._drain_metrics, name="metric-recorder", daemon=True)
+                worker.start()
+                self._metric_worker = worker
+            return True
+    
+    def _billing_pool(self) -> ThreadPoolExecutor:
+        """Create the billing executor once; RuntimeError after close()"""
+        with self._workers_lock:
+            if self._closed:
+                raise RuntimeError("Service closed")
+            if self._billing_executor is None:
+                self._billing_executor = ThreadPoolExecutor(
+                    max_workers=self.billing_workers, thread_name_prefix="billing"
+                )
+            return self._billing_executor
+    
+    def _drain_metrics(self):
+        """Worker loop: hand queued metric commands to the monitoring context"""
+        while True:
+            command = self._metric_queue.get()
+            if command is _STOP_METRICS:
+                self._metric_queue.task_done()
+                return
+            try:
+                self.monitoring_context.execute_command(command)
+            except Exception as e:
+                self.logger.error("Error recording metrics: %s", e)
+            finally:
+                self._metric_queue.task_done()
+    
+    def flush_metrics(self):
+        """Block until every queued metric has been recorded"""
+        self._metric_queue.join()
+    
+    def close(self):
+        """
+        Finish background work and stop the worker threads
+        
+        Waits for in-flight exit billing (so no pending invoice is lost) and
+        for the dashboard lookups, then records every queued metric. Exits
+        accepted after close are reported with a "failed" billing status;
+        metrics recorded after close are dropped.
+        """
+        with self._workers_lock:
+            self._closed = True
+        if self._billing_executor is not None:
+            self._billing_executor.shutdown(wait=True)
+        if self._dashboard_executor is not None:
+            self._dashboard_executor.shutdown(wait=True)
+        if self._metric_worker is not None and self._metric_worker.is_alive():
+            # Queued behind any metrics still waiting, so those are recorded first
+            self._metric_queue.put(_STOP_METRICS)
+            self._metric_worker.join()
+    
+    def __enter__(self) -> 'ParkingService':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def get_billing_status(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Billing outcome of an exit: status is "pending", "invoiced" or "failed"
+        
+        Returns None for tickets with no exit billing on record.
+        """
+        return self._billing_status.get(ticket_id)
+    
+    def _set_billing_status(self, ticket_id: str, status: Dict[str, Any]):
+        """Record a ticket's billing outcome, evicting the oldest entries past the cap"""
+        billing_status = self._billing_status
+        with self._billing_status_lock:
+            billing_status.pop(ticket_id, None)
+            if len(billing_status) >= self.billing_status_max_entries:
+                del billing_status[next(iter(billing_status))]
+            billing_status[ticket_id] = status
+    
+    def _finalize_billing(self, ticket_id: str, license_plate: Optional[str],
+                          parking_lot_id: str, exit_time: datetime):
+        """Billing worker: calculate the exit fee and generate its invoice"""
+        try:
+            # In real system, would get actual entry time and calculate
+            duration_hours = 2.5  # Mock value
+            fee_calculation = self.billing_context.execute_command({
+                "type": "calculate_fee",
+                "fee_type": "parking",
+                "pricing_strategy": "standard",
+                "strategy": self.default_pricing_strategy,
+                "entry_time": exit_time - timedelta(hours=duration_hours),
+                "exit_time": exit_time,
+                "slot": {"type": "regular"},  # Mock slot data
+                "vehicle_type": "car"  # Mock vehicle type
+            })
+            
+            if not fee_calculation.get("success", False):
+                self._set_billing_status(ticket_id, {
+                    "status": "failed",
+                    "error": f"Fee calculation failed: {fee_calculation.get('error')}"
+                })
+                return
+            
+            total_fee = fee_calculation.get("fee_amount", 0.0)
+            
+            invoice_result = self.billing_context.execute_command({
+                "type": "generate_invoice",
+                "license_plate": license_plate or "UNKNOWN",
+                "services": [{
+                    "type": "parking",
+                    "details": {
+                        "duration_hours": duration_hours,
+                        "slot_type": "regular"
+                    }
+                }]
+            })
+            
+            if not invoice_result.get("success", False):
+                self._set_billing_status(ticket_id, {
+                    "status": "failed",
+                    "error": f"Invoice generation failed: {invoice_result.get('error')}"
+                })
+                return
+            
+            self._record_metrics([
+                {"metric_type": "revenue", "value": total_fee, "source": parking_lot_id}
+            ])
+            
+            self._set_billing_status(ticket_id, {
+                "status": "invoiced",
+                "invoice_id": invoice_result.get("invoice_id"),
+                "total_fee": total_fee,
+                "duration_hours": duration_hours,
+                "payment_required": total_fee > 0
+            })
+            
+        except Exception as e:
+            self.logger.error("Error billing exit for ticket %s: %s", ticket_id, e, exc_info=True)
+            self._set_billing_status(ticket_id, {"status": "failed", "error": str(e)})
+    
+    def _replayed_allocation(self, request: ParkingRequestDTO) -> Optional[ParkingAllocationDTO]:
+        """The remembered allocation if ``request`` retries one inside the window"""
+        recent = self._recent_allocations.get(request.license_plate)
+        if recent is not None and recent[1] > time.monotonic() and recent[0] == request:
+            return recent[2]
+        return None
+    
+    def _remember_allocation(self, request: ParkingRequestDTO, allocation: ParkingAllocationDTO):
+        """Keep a successful allocation so retries of the same request get it back"""
+        recent = self._recent_allocations
+        plates = self._allocation_plates
+        expiry = time.monotonic() + self.idempotency_window_seconds
+        with self._allocations_lock:
+            previous = recent.pop(request.license_plate, None)
+            if previous is not None:
+                plates.pop(previous[2].ticket_id, None)
+            if len(recent) >= self.idempotency_max_entries:
+                # Oldest first: dicts keep insertion order
+                plates.pop(recent.pop(next(iter(recent)))[2].ticket_id, None)
+            recent[request.license_plate] = (request, expiry, allocation)
+            plates[allocation.ticket_id] = request.license_plate
+    
+    def _forget_allocation(self, license_plate: Optional[str], ticket_id: Optional[str]):
+        """Drop the remembered allocation of a vehicle that has left"""
+        with self._allocations_lock:
+            if ticket_id is not None:
+                license_plate = self._allocation_plates.pop(ticket_id, license_plate)
+            if license_plate is None:
+                return
+            forgotten = self._recent_allocations.pop(license_plate, None)
+            if forgotten is not None:
+                self._allocation_plates.pop(forgotten[2].ticket_id, None)
+    
     def _generate_confirmation_code(self) -> str:
         """Generate a confirmation code for reservations"""
-        import random
-        import string
-        return ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+        pool = getattr(_code_pool, "codes", None)
+        if not pool:
+            # 40 random bits per code encode to exactly 8 base32 characters (A-Z, 2-7)
+            encoded = base64.b32encode(os.urandom(5 * _CODE_BATCH_SIZE)).decode("ascii")
+            pool = _code_pool.codes = deque(
+                encoded[i:i + 8] for i in range(0, len(encoded), 8)
+            )
+        return pool.popleft()
     
     def _get_pricing_strategy(self, customer_type: str = "standard") -> PricingStrategy:
         """Get appropriate pricing strategy based on customer type"""
-        return self.pricing_strategies.get(customer_type, self.pricing_strategies["standard"])
+        strategy = self._pricing_strategy_cache.get(customer_type)
+        if strategy is None:
+            strategy_class = self.pricing_strategies.get(customer_type)
+            # Unknown types share the standard instance rather than getting their own
+            strategy = strategy_class() if strategy_class else self.default_pricing_strategy
+            self._pricing_strategy_cache[customer_type] = strategy
+        return strategy
     
     def _get_parking_strategy(self, vehicle_type: VehicleType) -> ParkingStrategy:
         """Get appropriate parking strategy based on vehicle type"""
-        return self.parking_strategies.get(vehicle_type, StandardCarStrategy())
+        strategy = self._parking_strategy_cache.get(vehicle_type)
+        if strategy is None:
+            strategy_class = self.parking_strategies.get(vehicle_type)
+            # Unknown types share the car strategy instance rather than getting their own
+            strategy = strategy_class() if strategy_class else self._get_parking_strategy(VehicleType.CAR)
+            self._parking_strategy_cache[vehicle_type] = strategy
+        return strategy
 
 
 # ============================================================================
@@ -1073,10 +1709,24 @@ class ParkingServiceFactory:
         return ParkingService()
     
     @staticmethod
-    def create_service_with_config(config: Dict[str, Any]) -> ParkingService:
-        """Create a parking service with custom configuration"""
-        service = ParkingService()
-        service.config.update(config)
+    def create_service_with_config(config: Dict[str, Any], cache_client: Any = None) -> ParkingService:
+        """
+        Create a parking service with custom configuration and an optional shared cache
+        
+        Unknown keys are ignored with a warning, as the old config dict
+        accepted any key.
+        """
+        settings = dict(config)
+        unknown = settings.keys() - _CONFIG_ATTRIBUTES - set(_WORKER_SETTINGS)
+        if unknown:
+            logging.getLogger(ParkingService.__name__).warning(
+                "Ignoring unknown parking service setting(s): %s", ", ".join(sorted(unknown))
+            )
+        worker_settings = {key: settings.pop(key) for key in _WORKER_SETTINGS if key in settings}
+        service = ParkingService(cache_client=cache_client, **worker_settings)
+        for key in _CONFIG_ATTRIBUTES:
+            if key in settings:
+                setattr(service, key, settings[key])
         return service
     
     @staticmethod
@@ -1098,6 +1748,7 @@ class MockParkingService(ParkingService):
     
     def __init__(self):
         super().__init__()
+        self._mock_ids = itertools.count(1)
         self.mock_data = {
             "parking_lots": {
                 "lot-001": {
@@ -1115,11 +1766,11 @@ class MockParkingService(ParkingService):
         """Mock park vehicle"""
         return ParkingAllocationDTO(
             success=True,
-            ticket_id=f"TICKET-MOCK-{datetime.now().strftime('%H%M%S')}",
+            ticket_id=f"TICKET-MOCK-{next(self._mock_ids):06d}",
             slot_number=42,
             slot_type="REGULAR",
             strategy_used="MockStrategy",
-            timestamp=datetime.now(),
+            timestamp=now_coarse(),
             message="Mock: Vehicle parked successfully"
         )
     
@@ -1131,7 +1782,7 @@ class MockParkingService(ParkingService):
             slot_number=42,
             duration_hours=2.5,
             total_fee=15.75,
-            invoice_id=f"INV-MOCK-{datetime.now().strftime('%H%M%S')}",
+            invoice_id=f"INV-MOCK-{next(self._mock_ids):06d}",
             payment_required=True,
             message="Mock: Vehicle exited successfully"
         )
@@ -1144,12 +1795,10 @@ class MockParkingService(ParkingService):
             occupied_slots=45,
             available_slots=55,
             occupancy_rate=0.45,
-            by_slot_type={
-                "REGULAR": {"occupied": 30, "total": 70, "available": 40},
-                "PREMIUM": {"occupied": 10, "total": 20, "available": 10},
-                "EV": {"occupied": 5, "total": 10, "available": 5}
-            },
-            timestamp=datetime.now()
+            # regular, ev, disabled, premium, reserved
+            slot_totals=(70, 10, 0, 20, 0),
+            slot_occupied=(30, 5, 0, 10, 0),
+            timestamp=now_coarse()
         )
 
 
@@ -1167,40 +1816,71 @@ class ParkingCommandHandler:
     def __init__(self, service: ParkingService):
         self.service = service
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # command type -> generated function taking the command data
+        self._dispatch = {
+            command_type: _specialized_handler(request_cls, execute)
+            for command_type, request_cls, execute in (
+                ("park_vehicle", ParkingRequestDTO, service.park_vehicle),
+                ("exit_vehicle", ExitRequestDTO, service.exit_vehicle),
+                ("start_charging", ChargingRequestDTO, service.start_charging_session),
+                ("make_reservation", ReservationRequestDTO, service.make_reservation),
+            )
+        }
     
     def handle(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Handle a parking command"""
+        result = self._execute(command)
+        if isinstance(result, dict):
+            return result
+        return {"success": result.success, "data": result.to_dict()}
+    
+    def handle_batch(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Handle several parking commands in one call, in order
+        
+        Each command succeeds or fails on its own; the responses line up
+        with ``commands`` and match what ``handle`` returns for each.
+        """
+        execute = self._execute
+        responses = []
+        append = responses.append
+        for command in commands:
+            result = execute(command)
+            append(result if isinstance(result, dict)
+                   else {"success": result.success, "data": result.to_dict()})
+        return responses
+    
+    def handle_bytes(self, command: Dict[str, Any]) -> bytes:
+        """
+        Handle a parking command, returning the response as JSON bytes
+        
+        Result DTOs are handed to orjson as-is (it encodes slotted
+        dataclasses and datetimes natively), skipping the to_dict pass.
+        """
+        result = self._execute(command)
+        if isinstance(result, dict):
+            return orjson.dumps(result)
+        return orjson.dumps({"success": result.success, "data": result})
+    
+    def _execute(self, command: Dict[str, Any]) -> Any:
+        """Run a command; returns its result DTO, or an error response dict"""
         command_type = command.get("type")
         
+        handler = self._dispatch.get(command_type)
+        if handler is None:
+            return {
+                "success": False,
+                "error": f"Unknown command type: {command_type}"
+            }
+        
         try:
-            if command_type == "park_vehicle":
-                request = ParkingRequestDTO(**command["data"])
-                result = self.service.park_vehicle(request)
-                return {"success": result.success, "data": asdict(result)}
-            
-            elif command_type == "exit_vehicle":
-                request = ExitRequestDTO(**command["data"])
-                result = self.service.exit_vehicle(request)
-                return {"success": result.success, "data": asdict(result)}
-            
-            elif command_type == "start_charging":
-                request = ChargingRequestDTO(**command["data"])
-                result = self.service.start_charging_session(request)
-                return {"success": result.success, "data": asdict(result)}
-            
-            elif command_type == "make_reservation":
-                request = ReservationRequestDTO(**command["data"])
-                result = self.service.make_reservation(request)
-                return {"success": result.success, "data": asdict(result)}
-            
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown command type: {command_type}"
-                }
+            return handler(command["data"])
                 
         except Exception as e:
-            self.logger.error(f"Error handling command {command_type}: {e}", exc_info=True)
+            # Bad command data is routine; the traceback is only worth its cost when debugging
+            self.logger.error("Error handling command %s: %s", command_type, e,
+                              exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return {
                 "success": False,
                 "error": str(e)
@@ -15,12 +15,15 @@ Key Concepts:
 - All modifications go through aggregate root methods
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Set, Tuple, Any
+from typing import Deque, List, Optional, Dict, Set, Tuple, Any
 from datetime import datetime, timedelta
 from decimal import Decimal
+import time
 import uuid
 import logging
+import secrets
 
 from .models import (
     Entity, ParkingSlot, Vehicle, ElectricVehicle,
@@ -32,6 +35,11 @@ from .models import (
 )
 
 
+# Shared immutable constants
+_ZERO_REVENUE = Money(Decimal('0.00'))
+_MIN_OVERSTAY_MULTIPLIER = Decimal('1.0')
+
+
 # ============================================================================
 # BASE AGGREGATE ROOT
 # ============================================================================
@@ -42,10 +50,13 @@ class AggregateRoot(Entity):
     Provides domain event collection and versioning
     """
     
+    __slots__ = ('_version', '_changes', '_logger')
+    
     def __init__(self, id: Optional[str] = None):
         super().__init__(id)
         self._version: int = 1
-        self._changes: List[DomainEvent] = []
+        # deque.append is atomic, so events can be recorded without holding a lock
+        self._changes: Deque[DomainEvent] = deque()
         self._logger = logging.getLogger(self.__class__.__name__)
     
     @property
@@ -60,12 +71,13 @@ class AggregateRoot(Entity):
     def _add_domain_event(self, event: DomainEvent) -> None:
         """Add a domain event to the list of changes"""
         self._changes.append(event)
-        self._logger.debug(f"Added domain event: {event.__class__.__name__}")
+        self._logger.debug("Added domain event: %s", type(event).__name__)
     
-    def clear_events(self) -> List[DomainEvent]:
+    def clear_events(self) -> Deque[DomainEvent]:
         """Clear and return all domain events"""
-        events = self._changes.copy()
-        self._changes.clear()
+        # Swap rather than copy: an event appended concurrently lands in
+        # exactly one of the two buffers
+        events, self._changes = self._changes, deque()
         return events
     
     @property
@@ -82,7 +94,7 @@ class AggregateRoot(Entity):
 # PARKING LOT AGGREGATE
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ParkingPolicies:
     """Value Object: Parking lot business policies"""
     max_stay_hours: float = 24.0
@@ -97,7 +109,7 @@ class ParkingPolicies:
         if self.max_stay_hours <= 0:
             raise ValueError("Max stay hours must be positive")
         
-        if self.overstay_fee_multiplier < Decimal('1.0'):
+        if self.overstay_fee_multiplier < _MIN_OVERSTAY_MULTIPLIER:
             raise ValueError("Overstay fee multiplier cannot be less than 1.0")
         
         if self.min_reservation_hours <= 0:
@@ -110,6 +122,14 @@ class ParkingLot(AggregateRoot):
     Enforces business rules and invariants for parking operations
     """
     
+    __slots__ = (
+        'name', 'location', 'capacity', 'policies',
+        '_slots_list', '_id_to_index', '_occupied_bits',
+        '_slots_by_type', '_occupied_by_type', '_free_by_type', '_closed',
+        '_occupied_count', '_vehicle_index',
+        'total_parking_sessions', 'total_revenue', 'creation_date', '_last_updated_ns',
+    )
+    
     def __init__(
         self,
         name: str,
@@ -125,16 +145,21 @@ class ParkingLot(AggregateRoot):
         self.policies = policies or ParkingPolicies()
         
         # Internal state
-        self._slots: Dict[str, ParkingSlot] = {}  # slot_id -> ParkingSlot
-        self._occupied_slots: Set[str] = set()    # Set of occupied slot IDs
-        self._slot_numbers: Dict[int, str] = {}   # slot_number -> slot_id
-        self._vehicle_to_slot: Dict[str, str] = {}  # vehicle_id -> slot_id
+        self._slots_list: List[ParkingSlot] = []  # slot_number - 1 -> ParkingSlot
+        self._id_to_index: Dict[str, int] = {}    # slot_id -> index in _slots_list
+        self._occupied_bits = bytearray()         # 1 at index i while slot i is occupied
+        self._slots_by_type: Dict[SlotType, List[ParkingSlot]] = {t: [] for t in SlotType}
+        self._occupied_by_type: Dict[SlotType, int] = dict.fromkeys(SlotType, 0)
+        self._free_by_type: Dict[SlotType, Deque[int]] = {t: deque() for t in SlotType}  # free, open slot indices
+        self._closed: Set[int] = set()            # Indices of slots closed for maintenance
+        self._occupied_count: int = 0             # Number of 1 bytes in _occupied_bits
+        self._vehicle_index: Dict[str, int] = {}  # vehicle_id -> index in _slots_list
         
         # Statistics
         self.total_parking_sessions: int = 0
-        self.total_revenue: Money = Money(Decimal('0.00'))
+        self.total_revenue: Money = _ZERO_REVENUE
         self.creation_date: datetime = datetime.now()
-        self.last_updated: datetime = self.creation_date
+        self._last_updated_ns: int = time.time_ns()  # datetime built only when read
         
         # Initialize slots based on capacity
         self._initialize_slots()
@@ -146,27 +171,17 @@ class ParkingLot(AggregateRoot):
         """Initialize parking slots based on capacity"""
         slot_number = 1
         
-        # Create regular slots
-        for _ in range(self.capacity.regular):
-            self._create_slot(slot_number, SlotType.REGULAR)
-            slot_number += 1
-        
-        # Create EV slots
-        for _ in range(self.capacity.ev):
-            self._create_slot(slot_number, SlotType.EV)
-            slot_number += 1
-        
-        # Create disabled slots
-        for _ in range(self.capacity.disabled):
-            self._create_slot(slot_number, SlotType.DISABLED)
-            slot_number += 1
+        for slot_type, count in (
+            (SlotType.REGULAR, self.capacity.regular),
+            (SlotType.EV, self.capacity.ev),
+            (SlotType.DISABLED, self.capacity.disabled),
+            (SlotType.PREMIUM, self.capacity.premium),
+        ):
+            for _ in range(count):
+                self._create_slot(slot_number, slot_type)
+                slot_number += 1
         
-        # Create premium slots
-        for _ in range(self.capacity.premium):
-            self._create_slot(slot_number, SlotType.PREMIUM)
-            slot_number += 1
-        
-        self._logger.debug(f"Initialized {len(self._slots)} slots")
+        self._logger.debug(f"Initialized {len(self._slots_list)} slots")
     
     def _create_slot(self, number: int, slot_type: SlotType) -> str:
         """Create a parking slot and add to internal collections"""
@@ -176,15 +191,18 @@ class ParkingLot(AggregateRoot):
             floor_level=1  # Could be parameterized
         )
         
-        self._slots[slot.id] = slot
-        self._slot_numbers[number] = slot.id
+        self._id_to_index[slot.id] = len(self._slots_list)
+        self._free_by_type[slot_type].append(len(self._slots_list))
+        self._slots_by_type[slot_type].append(slot)
+        self._slots_list.append(slot)
+        self._occupied_bits.append(0)
         
         return slot.id
     
     def _validate_invariants(self) -> None:
         """Validate aggregate invariants"""
         # Invariant 1: Slot count must match capacity
-        total_slots = len(self._slots)
+        total_slots = len(self._slots_list)
         expected_slots = self.capacity.total_capacity()
         
         if total_slots != expected_slots:
@@ -193,21 +211,24 @@ class ParkingLot(AggregateRoot):
                 f"expected {expected_slots} from capacity"
             )
         
-        # Invariant 2: Occupied slots must be valid slots
-        for slot_id in self._occupied_slots:
-            if slot_id not in self._slots:
-                raise ValueError(f"Occupied slot {slot_id} not found in slots")
+        # Invariant 2: Occupancy bits must match the slots and the running count
+        for slot, occupied in zip(self._slots_list, self._occupied_bits):
+            if slot.is_occupied != bool(occupied):
+                raise ValueError(f"Occupancy of slot {slot.number} out of sync")
+        if self._occupied_bits.count(1) != self._occupied_count:
+            raise ValueError("Occupied slot count out of sync")
         
         # Invariant 3: Vehicle to slot mapping must be consistent
-        for vehicle_id, slot_id in self._vehicle_to_slot.items():
-            if slot_id not in self._occupied_slots:
+        for vehicle_id, index in self._vehicle_index.items():
+            if not self._occupied_bits[index]:
                 raise ValueError(
-                    f"Vehicle {vehicle_id} mapped to non-occupied slot {slot_id}"
+                    f"Vehicle {vehicle_id} mapped to non-occupied slot {index + 1}"
                 )
         
-        # Invariant 4: Slot numbers must be unique
-        if len(self._slot_numbers) != total_slots:
-            raise ValueError("Duplicate slot numbers detected")
+        # Invariant 4: Slot numbers must be unique (each slot sits at number - 1)
+        for index, slot in enumerate(self._slots_list):
+            if slot.number != index + 1:
+                raise ValueError("Duplicate slot numbers detected")
         
         self._logger.debug("All parking lot invariants satisfied")
     
@@ -227,8 +248,10 @@ class ParkingLot(AggregateRoot):
         """
         self._logger.info(f"Parking vehicle: {vehicle.license_plate}")
         
+        vehicle_id = vehicle.id
+        
         # Check if vehicle is already parked
-        if vehicle.id in self._vehicle_to_slot:
+        if vehicle_id in self._vehicle_index:
             raise ValueError(f"Vehicle {vehicle.license_plate} is already parked")
         
         # Find suitable slot
@@ -237,23 +260,28 @@ class ParkingLot(AggregateRoot):
             raise ValueError(f"No suitable slot available for {vehicle.vehicle_type}")
         
         # Occupy the slot
-        slot.occupy(vehicle.id)
-        self._occupied_slots.add(slot.id)
-        self._vehicle_to_slot[vehicle.id] = slot.id
+        slot.occupy(vehicle_id)
+        index = slot.number - 1
+        # Found slots are always at the head of their deque, so this is O(1)
+        self._free_by_type[slot.slot_type].remove(index)
+        self._occupied_bits[index] = 1
+        self._occupied_by_type[slot.slot_type] += 1
+        self._occupied_count += 1
+        self._vehicle_index[vehicle_id] = index
         
         # Generate ticket
         ticket_number = self._generate_ticket_number()
         
         # Update statistics
         self.total_parking_sessions += 1
-        self.last_updated = datetime.now()
+        self._last_updated_ns = time.time_ns()
         self._increment_version()
         
         # Raise domain event
         event = VehicleParkedEvent(
             parking_lot_id=self.id,
             slot_id=slot.id,
-            vehicle_id=vehicle.id,
+            vehicle_id=vehicle_id,
             license_plate=vehicle.license_plate.value,
             vehicle_type=vehicle.vehicle_type
         )
@@ -275,11 +303,10 @@ class ParkingLot(AggregateRoot):
         Remove vehicle from slot
         Returns: (fee, time_range) if vehicle was parked, (None, None) otherwise
         """
-        if slot_id not in self._slots:
+        slot = self._slot_by_id(slot_id)
+        if slot is None:
             raise ValueError(f"Slot {slot_id} not found")
         
-        slot = self._slots[slot_id]
-        
         if not slot.is_occupied:
             self._logger.warning(f"Slot {slot.number} is not occupied")
             return None, None
@@ -299,10 +326,14 @@ class ParkingLot(AggregateRoot):
         
         # Vacate the slot
         time_range = slot.vacate()
-        self._occupied_slots.remove(slot.id)
+        index = slot.number - 1
+        self._occupied_bits[index] = 0
+        self._occupied_by_type[slot.slot_type] -= 1
+        self._occupied_count -= 1
+        if index not in self._closed:
+            self._free_by_type[slot.slot_type].append(index)
         
-        if actual_vehicle_id in self._vehicle_to_slot:
-            del self._vehicle_to_slot[actual_vehicle_id]
+        self._vehicle_index.pop(actual_vehicle_id, None)
         
         # Calculate fee if we have time range
         fee = None
@@ -331,7 +362,7 @@ class ParkingLot(AggregateRoot):
             # Update revenue
             self.total_revenue = self.total_revenue + fee
         
-        self.last_updated = datetime.now()
+        self._last_updated_ns = time.time_ns()
         self._increment_version()
         
         # Raise domain event
@@ -365,29 +396,30 @@ class ParkingLot(AggregateRoot):
         Find an available slot for the given vehicle type
         Optionally filter by specific slot type
         """
-        for slot in self._slots.values():
-            if not slot.is_occupied and slot.can_accommodate_vehicle_type(vehicle_type):
-                if slot_type is None or slot.slot_type == slot_type:
-                    return slot
+        # Head of the first accepted type's free deque; types are tried in
+        # SlotType order, the order their slots are numbered in
+        for candidate_type in (SlotType if slot_type is None else (slot_type,)):
+            free = self._free_by_type[candidate_type]
+            if free and candidate_type.can_accommodate(vehicle_type):
+                return self._slots_list[free[0]]
         return None
     
     def get_slot_by_number(self, slot_number: int) -> Optional[ParkingSlot]:
         """Get slot by its number"""
-        slot_id = self._slot_numbers.get(slot_number)
-        if slot_id:
-            return self._slots.get(slot_id)
+        if 1 <= slot_number <= len(self._slots_list):
+            return self._slots_list[slot_number - 1]
         return None
     
     def get_slot_by_vehicle(self, vehicle_id: str) -> Optional[ParkingSlot]:
         """Get slot containing the given vehicle"""
-        slot_id = self._vehicle_to_slot.get(vehicle_id)
-        if slot_id:
-            return self._slots.get(slot_id)
-        return None
+        index = self._vehicle_index.get(vehicle_id)
+        if index is None:
+            return None
+        return self._slots_list[index]
     
     def get_vehicle_in_slot(self, slot_id: str) -> Optional[str]:
         """Get vehicle ID in the given slot"""
-        slot = self._slots.get(slot_id)
+        slot = self._slot_by_id(slot_id)
         if slot and slot.is_occupied:
             return slot.current_vehicle_id
         return None
@@ -429,25 +461,35 @@ class ParkingLot(AggregateRoot):
         # For non-EV vehicles
         return self.find_available_slot(vehicle.vehicle_type)
     
+    def _slot_by_id(self, slot_id: str) -> Optional[ParkingSlot]:
+        """Get slot by its ID"""
+        index = self._id_to_index.get(slot_id)
+        if index is None:
+            return None
+        return self._slots_list[index]
+    
     def _generate_ticket_number(self) -> str:
-        """Generate a unique ticket number"""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        unique_id = str(uuid.uuid4())[:8].upper()
-        return f"TKT-{timestamp}-{unique_id}"
+        """Generate a unique ticket number (epoch seconds plus 32 random bits)"""
+        return f"TKT-{time.time_ns() // 1_000_000_000}-{secrets.token_hex(4).upper()}"
     
     # ========================================================================
     # QUERY METHODS (Read-only)
     # ========================================================================
     
+    @property
+    def last_updated(self) -> datetime:
+        """Time of the last state change"""
+        return datetime.fromtimestamp(self._last_updated_ns / 1e9)
+    
     @property
     def total_slots(self) -> int:
         """Get total number of slots"""
-        return len(self._slots)
+        return len(self._slots_list)
     
     @property
     def occupied_slots(self) -> int:
         """Get number of occupied slots"""
-        return len(self._occupied_slots)
+        return self._occupied_count
     
     @property
     def available_slots(self) -> int:
@@ -460,27 +502,28 @@ class ParkingLot(AggregateRoot):
             return 0.0
         return (self.occupied_slots / self.total_slots) * 100.0
     
+    def count_slots_by_type(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Get (total, occupied) slot counts per type, in SlotType order"""
+        return (
+            tuple(len(slots) for slots in self._slots_by_type.values()),
+            tuple(self._occupied_by_type.values()),
+        )
+    
     def get_slots_by_type(self, slot_type: SlotType) -> List[ParkingSlot]:
         """Get all slots of specific type"""
-        return [slot for slot in self._slots.values() if slot.slot_type == slot_type]
+        return list(self._slots_by_type[slot_type])
     
     def get_available_slots_by_type(self, slot_type: SlotType) -> List[ParkingSlot]:
         """Get available slots of specific type"""
-        return [
-            slot for slot in self._slots.values()
-            if slot.slot_type == slot_type and not slot.is_occupied
-        ]
+        return [slot for slot in self._slots_by_type[slot_type] if not slot.is_occupied]
     
     def get_occupied_slots_by_type(self, slot_type: SlotType) -> List[ParkingSlot]:
         """Get occupied slots of specific type"""
-        return [
-            slot for slot in self._slots.values()
-            if slot.slot_type == slot_type and slot.is_occupied
-        ]
+        return [slot for slot in self._slots_by_type[slot_type] if slot.is_occupied]
     
     def get_slot_status(self, slot_id: str) -> Dict[str, Any]:
         """Get detailed status of a slot"""
-        slot = self._slots.get(slot_id)
+        slot = self._slot_by_id(slot_id)
         if not slot:
             raise ValueError(f"Slot {slot_id} not found")
         
@@ -514,11 +557,11 @@ class ParkingLot(AggregateRoot):
                 "occupancy_rate": self.get_occupancy_rate(),
                 "by_type": {
                     slot_type.value: {
-                        "total": len(self.get_slots_by_type(slot_type)),
-                        "occupied": len(self.get_occupied_slots_by_type(slot_type)),
-                        "available": len(self.get_available_slots_by_type(slot_type)),
+                        "total": total,
+                        "occupied": occupied,
+                        "available": total - occupied,
                     }
-                    for slot_type in SlotType
+                    for slot_type, total, occupied in zip(SlotType, *self.count_slots_by_type())
                 }
             },
             "statistics": {
@@ -558,7 +601,7 @@ class ParkingLot(AggregateRoot):
     
     def close_slot(self, slot_id: str, reason: str = "Maintenance") -> None:
         """Close a slot for maintenance"""
-        slot = self._slots.get(slot_id)
+        slot = self._slot_by_id(slot_id)
         if not slot:
             raise ValueError(f"Slot {slot_id} not found")
         
@@ -569,21 +612,32 @@ class ParkingLot(AggregateRoot):
         if "maintenance" not in slot.features:
             slot.features.append("maintenance")
         
-        self.last_updated = datetime.now()
+        # Take it out of allocation until reopened
+        index = slot.number - 1
+        if index not in self._closed:
+            self._closed.add(index)
+            self._free_by_type[slot.slot_type].remove(index)
+        
+        self._last_updated_ns = time.time_ns()
         self._increment_version()
         
         self._logger.info(f"Closed slot {slot.number} for {reason}")
     
     def reopen_slot(self, slot_id: str) -> None:
         """Reopen a closed slot"""
-        slot = self._slots.get(slot_id)
+        slot = self._slot_by_id(slot_id)
         if not slot:
             raise ValueError(f"Slot {slot_id} not found")
         
         if "maintenance" in slot.features:
             slot.features.remove("maintenance")
         
-        self.last_updated = datetime.now()
+        index = slot.number - 1
+        if index in self._closed:
+            self._closed.discard(index)
+            self._free_by_type[slot.slot_type].append(index)
+        
+        self._last_updated_ns = time.time_ns()
         self._increment_version()
         
         self._logger.info(f"Reopened slot {slot.number}")
@@ -591,7 +645,7 @@ class ParkingLot(AggregateRoot):
     def update_policies(self, new_policies: ParkingPolicies) -> None:
         """Update parking lot policies"""
         self.policies = new_policies
-        self.last_updated = datetime.now()
+        self._last_updated_ns = time.time_ns()
         self._increment_version()
         
         self._logger.info(f"Updated parking lot policies")
@@ -736,7 +790,7 @@ class ChargingStation(AggregateRoot):
         # Statistics
         self.total_energy_delivered_kwh: float = 0.0
         self.total_sessions: int = 0
-        self.total_revenue: Money = Money(Decimal('0.00'))
+        self.total_revenue: Money = _ZERO_REVENUE
         self.creation_date: datetime = datetime.now()
         self.last_updated: datetime = self.creation_date
         
@@ -23,7 +23,8 @@ Context Maps:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Set, Optional, Any, Protocol, runtime_checkable
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Set, Optional, Any, Protocol, runtime_checkable
 from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
@@ -44,6 +45,11 @@ from .strategies import (
 )
 
 
+def _as_datetime(value: Any) -> datetime:
+    """Accept a datetime from in-process callers or an ISO string from serialized commands"""
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
 # ============================================================================
 # CONTEXT INTERFACES
 # ============================================================================
@@ -66,6 +72,18 @@ class BoundedContext(ABC):
         """Execute a query within this bounded context"""
         pass
     
+    def get_handler(self, name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Resolve a command or query handler once, for callers on a hot path
+        
+        The handler takes the same dict as execute_command/execute_query,
+        without the "type" key.
+        """
+        handler = getattr(self, f"_{name}", None)
+        if handler is None:
+            raise ValueError(f"Unknown command or query type: {name}")
+        return handler
+    
     def get_context_info(self) -> Dict[str, Any]:
         """Get information about this bounded context"""
         return {
@@ -92,6 +110,17 @@ class ContextIntegration(Protocol):
 # PARKING MANAGEMENT CONTEXT
 # ============================================================================
 
+@dataclass(slots=True)
+class AllocationResult:
+    """Result of the allocate_parking command; error is set only on failure"""
+    success: bool
+    ticket_id: Optional[str] = None
+    slot_number: Optional[int] = None
+    slot_type: Optional[str] = None
+    strategy_used: Optional[str] = None
+    error: Optional[str] = None
+
+
 class ParkingManagementContext(BoundedContext):
     """
     Bounded Context: Parking Management
@@ -129,8 +158,8 @@ class ParkingManagementContext(BoundedContext):
         # Integration points
         self.integrations: Dict[str, ContextIntegration] = {}
     
-    def execute_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute parking management commands"""
+    def execute_command(self, command: Dict[str, Any]) -> Any:
+        """Execute parking management commands (allocation returns an AllocationResult)"""
         command_type = command.get("type")
         
         if command_type == "allocate_parking":
@@ -156,12 +185,14 @@ class ParkingManagementContext(BoundedContext):
             return self._get_parking_status(query)
         elif query_type == "get_occupancy":
             return self._get_occupancy(query)
+        elif query_type == "get_status_and_occupancy":
+            return self._get_status_and_occupancy(query)
         elif query_type == "get_vehicle_history":
             return self._get_vehicle_history(query)
         else:
             raise ValueError(f"Unknown query type: {query_type}")
     
-    def _allocate_parking(self, command: Dict[str, Any]) -> Dict[str, Any]:
+    def _allocate_parking(self, command: Dict[str, Any]) -> AllocationResult:
         """Allocate parking slot for vehicle"""
         try:
             # Extract command data
@@ -172,7 +203,7 @@ class ParkingManagementContext(BoundedContext):
             # Get parking lot
             parking_lot = self.parking_lots.get(lot_id)
             if not parking_lot:
-                return {"success": False, "error": f"Parking lot {lot_id} not found"}
+                return AllocationResult(success=False, error=f"Parking lot {lot_id} not found")
             
             # Create vehicle (in real system, this would come from Vehicle context)
             vehicle = self._create_vehicle_from_data(vehicle_data)
@@ -186,7 +217,7 @@ class ParkingManagementContext(BoundedContext):
             slot = strategy.allocate_slot(parking_lot, vehicle, preferences)
             
             if not slot:
-                return {"success": False, "error": "No available slots"}
+                return AllocationResult(success=False, error="No available slots")
             
             # Mark slot as occupied
             parking_lot.occupy_slot(slot.number, vehicle.license_plate)
@@ -212,17 +243,17 @@ class ParkingManagementContext(BoundedContext):
                 "slot_number": slot.number
             })
             
-            return {
-                "success": True,
-                "ticket_id": ticket.ticket_id,
-                "slot_number": slot.number,
-                "slot_type": slot.slot_type.value,
-                "strategy_used": strategy.get_strategy_name()
-            }
+            return AllocationResult(
+                success=True,
+                ticket_id=ticket.ticket_id,
+                slot_number=slot.number,
+                slot_type=slot.slot_type.value,
+                strategy_used=strategy.get_strategy_name()
+            )
             
         except Exception as e:
             self.logger.error(f"Error allocating parking: {e}")
-            return {"success": False, "error": str(e)}
+            return AllocationResult(success=False, error=str(e))
     
     def _release_parking(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Release parking slot"""
@@ -271,7 +302,7 @@ class ParkingManagementContext(BoundedContext):
             self.logger.error(f"Error releasing parking: {e}")
             return {"success": False, "error": str(e)}
     
-    def _register_vehicle_entry(self, command: Dict[str, Any]) -> Dict[str, Any]:
+    def _register_vehicle_entry(self, command: Dict[str, Any]) -> AllocationResult:
         """Register vehicle entry (without immediate allocation)"""
         # This would handle entry gate logic, license plate recognition, etc.
         # For now, delegate to allocate_parking
@@ -334,20 +365,42 @@ class ParkingManagementContext(BoundedContext):
         if not parking_lot:
             return {"success": False, "error": f"Parking lot {lot_id} not found"}
         
-        occupancy_by_type = {}
-        for slot_type in SlotType:
-            count = parking_lot.get_occupied_slots_by_type(slot_type)
-            total = parking_lot.get_total_slots_by_type(slot_type)
-            occupancy_by_type[slot_type.value] = {
-                "occupied": count,
-                "total": total,
-                "rate": count / total if total > 0 else 0
-            }
-        
+        # Flat per-type counts, in SlotType declaration order
+        total_by_type, occupied_by_type = parking_lot.count_slots_by_type()
         return {
             "success": True,
             "overall_occupancy": parking_lot.get_occupancy_rate(),
-            "by_slot_type": occupancy_by_type
+            "by_slot_type": {
+                slot_type.value: {
+                    "occupied": occupied,
+                    "total": total,
+                    "rate": occupied / total if total > 0 else 0
+                }
+                for slot_type, total, occupied in zip(SlotType, total_by_type, occupied_by_type)
+            },
+            "occupied_by_type": occupied_by_type,
+            "total_by_type": total_by_type
+        }
+    
+    def _get_status_and_occupancy(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Get parking status and per-type occupancy in a single query"""
+        lot_id = query["parking_lot_id"]
+        
+        parking_lot = self.parking_lots.get(lot_id)
+        if not parking_lot:
+            return {"success": False, "error": f"Parking lot {lot_id} not found"}
+        
+        total_by_type, occupied_by_type = parking_lot.count_slots_by_type()
+        total_slots = sum(total_by_type)
+        occupied_slots = sum(occupied_by_type)
+        return {
+            "success": True,
+            "total_slots": total_slots,
+            "occupied_slots": occupied_slots,
+            "available_slots": total_slots - occupied_slots,
+            "occupancy_rate": (occupied_slots / total_slots) * 100.0 if total_slots else 0.0,
+            "occupied_by_type": occupied_by_type,
+            "total_by_type": total_by_type
         }
     
     def _get_vehicle_history(self, query: Dict[str, Any]) -> Dict[str, Any]:
@@ -396,6 +449,87 @@ class ParkingManagementContext(BoundedContext):
         self.logger.info(f"Registered integration with {context_name} context")
 
 
+class ShardedParkingContext(BoundedContext):
+    """
+    Parking management partitioned by parking lot
+    
+    Each shard is a ParkingManagementContext owning the lots whose id hashes
+    to it. Commands and queries are routed on "parking_lot_id"; vehicle
+    history, which has no lot, is gathered from every shard. Shards take no
+    locks of their own: callers serialize changes per lot, as ParkingService
+    does with its lot locks.
+    """
+    
+    def __init__(self, shards: List[ParkingManagementContext]):
+        if not shards:
+            raise ValueError("At least one shard is required")
+        super().__init__("ParkingManagement")
+        self.shards = shards
+    
+    @classmethod
+    def from_context(cls, context: ParkingManagementContext, shard_count: int) -> "ShardedParkingContext":
+        """Split an existing context into shard_count shards, keeping it as shard 0"""
+        shards = [context] + [ParkingManagementContext() for _ in range(shard_count - 1)]
+        sharded = cls(shards)
+        for name, integration in context.integrations.items():
+            for shard in shards[1:]:
+                shard.register_integration(name, integration)
+        for lot_id in list(context.parking_lots):
+            shard = sharded.shard_for(lot_id)
+            if shard is not context:
+                shard.parking_lots[lot_id] = context.parking_lots.pop(lot_id)
+        return sharded
+    
+    def _index_for(self, lot_id: str) -> int:
+        return hash(lot_id) % len(self.shards)
+    
+    def shard_for(self, lot_id: str) -> ParkingManagementContext:
+        """Get the shard owning a parking lot"""
+        return self.shards[self._index_for(lot_id)]
+    
+    def add_parking_lot(self, parking_lot: ParkingLot) -> None:
+        """Register a parking lot with its shard"""
+        self.shard_for(parking_lot.id).parking_lots[parking_lot.id] = parking_lot
+    
+    def _route(self, name: str, message: Dict[str, Any]) -> Any:
+        return self.shard_for(message["parking_lot_id"]).get_handler(name)(message)
+    
+    def execute_command(self, command: Dict[str, Any]) -> Any:
+        """Execute a parking command on the shard owning its lot"""
+        return self._route(command.get("type"), command)
+    
+    def execute_query(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a parking query on the shard owning its lot"""
+        if query.get("type") == "get_vehicle_history":
+            return self._get_vehicle_history(query)
+        return self._route(query.get("type"), query)
+    
+    def get_handler(self, name: str) -> Callable[[Dict[str, Any]], Any]:
+        """Resolve a routing handler; the shard is picked per call"""
+        if name == "get_vehicle_history":
+            return self._get_vehicle_history
+        # Validate the name up front, as ParkingManagementContext does
+        self.shards[0].get_handler(name)
+        return lambda message: self._route(name, message)
+    
+    def _get_vehicle_history(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a vehicle's parking history from every shard"""
+        history: List[Dict[str, Any]] = []
+        for shard in self.shards:
+            history.extend(shard.get_handler("get_vehicle_history")(query)["history"])
+        return {
+            "success": True,
+            "license_plate": query["license_plate"],
+            "total_visits": len(history),
+            "history": history
+        }
+    
+    def register_integration(self, context_name: str, integration: ContextIntegration):
+        """Register integration with another bounded context on every shard"""
+        for shard in self.shards:
+            shard.register_integration(context_name, integration)
+
+
 # ============================================================================
 # BILLING & PRICING CONTEXT
 # ============================================================================
@@ -472,17 +606,20 @@ class BillingPricingContext(BoundedContext):
             fee_type = command["fee_type"]
             pricing_strategy_name = command.get("pricing_strategy", "standard")
             
-            strategy = self.pricing_strategies.get(pricing_strategy_name)
-            if not strategy:
-                strategy = self.pricing_strategies["standard"]
+            # Callers holding a strategy object pass it as "strategy" and skip the lookup
+            strategy = command.get("strategy")
+            if strategy is None:
+                strategy = self.pricing_strategies.get(pricing_strategy_name)
+                if not strategy:
+                    strategy = self.pricing_strategies["standard"]
             
             if fee_type == "parking":
                 # Extract parking fee calculation data
                 # In real system, this would use actual domain objects
                 slot_data = command["slot"]
                 time_range = TimeRange(
-                    start_time=datetime.fromisoformat(command["entry_time"]),
-                    end_time=datetime.fromisoformat(command["exit_time"])
+                    start_time=_as_datetime(command["entry_time"]),
+                    end_time=_as_datetime(command["exit_time"])
                 )
                 
                 # Calculate base fee
@@ -491,7 +628,7 @@ class BillingPricingContext(BoundedContext):
                 fee = Money(base_amount)
                 
                 # Apply dynamic pricing if needed
-                if pricing_strategy_name == "dynamic":
+                if isinstance(strategy, DynamicPricingStrategy):
                     occupancy_rate = command.get("occupancy_rate", 0.0)
                     fee = strategy.calculate_parking_fee(
                         slot=None,  # Would be actual slot object
@@ -512,7 +649,7 @@ class BillingPricingContext(BoundedContext):
                 # Calculate charging fee
                 energy_kwh = command["energy_kwh"]
                 charger_type = ChargerType(command["charger_type"])
-                time_of_day = datetime.fromisoformat(command["time_of_day"])
+                time_of_day = _as_datetime(command["time_of_day"])
                 
                 fee = strategy.calculate_charging_fee(energy_kwh, charger_type, time_of_day)
                 
@@ -1143,6 +1280,8 @@ class MonitoringAnalyticsContext(BoundedContext):
         
         if command_type == "record_metric":
             return self._record_metric(command)
+        elif command_type == "record_metrics":
+            return self._record_metrics(command)
         elif command_type == "generate_report":
             return self._generate_report(command)
         elif command_type == "predict_demand":
@@ -1203,6 +1342,20 @@ class MonitoringAnalyticsContext(BoundedContext):
             self.logger.error(f"Error recording metric: {e}")
             return {"success": False, "error": str(e)}
     
+    def _record_metrics(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        """Record a batch of operational metrics from one operation"""
+        timestamp = command.get("timestamp")
+        if timestamp is not None:
+            # The batch is stamped when the operation happened, not when it is recorded
+            for metric in command["metrics"]:
+                metric.setdefault("timestamp", timestamp)
+        results = [self._record_metric(metric) for metric in command["metrics"]]
+        return {
+            "success": all(result["success"] for result in results),
+            "metrics_recorded": sum(1 for result in results if result["success"]),
+            "results": results
+        }
+    
     def _generate_report(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Generate analytics report"""
         try:
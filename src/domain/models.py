@@ -135,7 +135,9 @@ class Capacity:
         if self.regular < 0 or self.ev < 0 or self.disabled < 0 or self.premium < 0:
             raise ValueError("Capacity values cannot be negative")
         
-        total = self.total_capacity()
+        # Immutable, so the sum is computed once
+        total = self.regular + self.ev + self.disabled + self.premium
+        object.__setattr__(self, '_total', total)
         if total == 0:
             raise ValueError("Total capacity must be greater than 0")
         
@@ -145,7 +147,7 @@ class Capacity:
     
     def total_capacity(self) -> int:
         """Calculate total capacity"""
-        return self.regular + self.ev + self.disabled + self.premium
+        return self._total
     
     def get_by_type(self, slot_type: 'SlotType') -> int:
         """Get capacity for specific slot type"""
@@ -173,6 +175,9 @@ class Capacity:
         return f"Capacity: {', '.join(parts)}"
 
 
+_DECIMAL_ZERO = Decimal('0')
+
+
 @dataclass(frozen=True)
 class Money:
     """
@@ -184,7 +189,7 @@ class Money:
     
     def __post_init__(self):
         """Validate money amount"""
-        if self.amount < Decimal('0'):
+        if self.amount < _DECIMAL_ZERO:
             raise ValueError("Money amount cannot be negative")
         
         if len(self.currency) != 3:
@@ -201,13 +206,13 @@ class Money:
         if self.currency != other.currency:
             raise ValueError(f"Cannot subtract {other.currency} from {self.currency}")
         result = self.amount - other.amount
-        if result < Decimal('0'):
+        if result < _DECIMAL_ZERO:
             raise ValueError("Result cannot be negative")
         return Money(result, self.currency)
     
     def __mul__(self, multiplier: Decimal) -> 'Money':
         """Multiply money by a decimal"""
-        if multiplier < Decimal('0'):
+        if multiplier < _DECIMAL_ZERO:
             raise ValueError("Multiplier cannot be negative")
         return Money(self.amount * multiplier, self.currency)
     
@@ -449,23 +454,45 @@ class Entity:
     Provides common functionality for entities with identity
     """
     
+    __slots__ = ('_id', '_id_str')
+    
     def __init__(self, id: Optional[str] = None):
-        self._id = id or str(uuid.uuid4())
+        # UUID ids are held as their 16 raw bytes and formatted on first read;
+        # any other id is kept as given
+        if not id:
+            self._id = uuid.uuid4().bytes
+            self._id_str = None
+            return
+        self._id = self._id_str = id
+        if isinstance(id, str) and len(id) == 36:
+            try:
+                parsed = uuid.UUID(id)
+            except ValueError:
+                pass
+            else:
+                if str(parsed) == id:
+                    self._id = parsed.bytes
+                    self._id_str = None
     
     @property
     def id(self) -> str:
         """Get entity ID"""
-        return self._id
+        entity_id = self._id_str
+        if entity_id is None:
+            entity_id = self._id_str = str(uuid.UUID(bytes=self._id))
+        return entity_id
     
     def __eq__(self, other: object) -> bool:
         """Entities are equal if they have the same ID and type"""
         if not isinstance(other, Entity):
             return False
-        return self.id == other.id and type(self) == type(other)
+        # _id is canonical (bytes for every canonical UUID string), so it
+        # compares without formatting
+        return self._id == other._id and type(self) == type(other)
     
     def __hash__(self) -> int:
         """Hash based on ID and type"""
-        return hash((self.id, type(self).__name__))
+        return hash((self._id, type(self).__name__))
     
     def __repr__(self) -> str:
         """Representation for debugging"""
@@ -849,6 +876,47 @@ class ParkingSlot(Entity):
         return f"{self.display_name} - {status}"
 
 
+# ============================================================================
+# PARKING AND BILLING RECORDS
+# ============================================================================
+
+@dataclass
+class ParkingTicket:
+    """Record of an active parking session, issued on allocation"""
+    ticket_id: str
+    license_plate: Any
+    slot_number: int
+    entry_time: datetime
+    vehicle_type: VehicleType
+
+
+@dataclass
+class Invoice:
+    """Invoice for parking and charging services; status changes on payment"""
+    invoice_id: str
+    customer_id: Optional[str]
+    license_plate: Any
+    issue_date: datetime
+    due_date: Optional[datetime]
+    subtotal: Money
+    tax: Money
+    total: Money
+    services: List[Dict[str, Any]] = field(default_factory=list)
+    status: str = "pending"
+    payment_date: Optional[datetime] = None
+
+
+@dataclass
+class Payment:
+    """Payment made against an invoice"""
+    payment_id: str
+    invoice_id: str
+    amount: Money
+    method: str
+    timestamp: datetime
+    status: str = "completed"
+
+
 # ============================================================================
 # DOMAIN SERVICES (Stateless services that operate on multiple entities)
 # ============================================================================
@@ -857,8 +925,33 @@ class ParkingFeeCalculator:
     """
     Domain Service: Calculates parking fees based on business rules
     Stateless service that operates on slots and time ranges
+    
+    Rules are folded into a single Decimal multiplier per fee, so each
+    calculation builds one Money rather than one per rule.
     """
     
+    _FIRST_HOUR_MULTIPLIER = Decimal('0.90')  # 10% discount for first hour
+    _EVENING_MULTIPLIER = Decimal('1.20')  # 20% premium for evening/overnight
+    _FEATURE_PREMIUMS = (
+        ("covered", Decimal('0.15')),  # 15% premium for covered
+        ("camera", Decimal('0.05')),  # 5% premium for security camera
+        ("valet", Decimal('0.25')),  # 25% premium for valet service
+    )
+    _NO_ADJUSTMENT = Decimal('1')
+    _BASE_MULTIPLIER = Decimal('1.0')
+    
+    _EV_BASE_RATE_PER_KWH = Decimal('0.30')  # $0.30 per kWh
+    _CHARGER_MULTIPLIERS = {
+        ChargerType.LEVEL_1: Decimal('1.0'),
+        ChargerType.LEVEL_2: Decimal('1.2'),
+        ChargerType.DC_FAST: Decimal('1.5'),
+        ChargerType.TESLA: Decimal('1.8'),
+        ChargerType.CHADEMO: Decimal('1.5'),
+        ChargerType.CCS: Decimal('1.5'),
+    }
+    _PEAK_MULTIPLIER = Decimal('1.25')  # 25% peak surcharge
+    _OFF_PEAK_MULTIPLIER = Decimal('0.75')  # 25% off-peak discount
+    
     @staticmethod
     def calculate_fee(
         slot: ParkingSlot,
@@ -872,54 +965,50 @@ class ParkingFeeCalculator:
         # Base calculation from slot
         base_fee = slot.calculate_fee(time_range.duration)
         
-        # Apply vehicle-specific multiplier
+        # Vehicle-specific, time-based and slot feature rules
+        multiplier = (
+            ParkingFeeCalculator._time_based_multiplier(time_range)
+            * ParkingFeeCalculator._feature_multiplier(slot)
+        )
         if vehicle:
-            multiplier = vehicle.get_parking_rate_multiplier()
-            adjusted_amount = base_fee.amount * multiplier
-            base_fee = Money(adjusted_amount, base_fee.currency)
-        
-        # Apply time-based rules
-        base_fee = ParkingFeeCalculator._apply_time_based_rules(base_fee, time_range)
+            multiplier *= vehicle.get_parking_rate_multiplier()
         
-        # Apply slot feature premiums
-        base_fee = ParkingFeeCalculator._apply_feature_premiums(base_fee, slot)
-        
-        return base_fee
+        return Money(base_fee.amount * multiplier, base_fee.currency)
     
     @staticmethod
-    def _apply_time_based_rules(fee: Money, time_range: TimeRange) -> Money:
-        """Apply time-based business rules to fee"""
+    def _time_based_multiplier(time_range: TimeRange) -> Decimal:
+        """Combined multiplier of the time-based business rules"""
+        multiplier = ParkingFeeCalculator._NO_ADJUSTMENT
+        
         # Example rule: First hour discount
         if time_range.duration_hours <= 1:
-            # 10% discount for first hour
-            discount = fee.amount * Decimal('0.10')
-            fee = Money(fee.amount - discount, fee.currency)
+            multiplier *= ParkingFeeCalculator._FIRST_HOUR_MULTIPLIER
         
         # Example rule: Evening premium (6 PM to 6 AM)
         start_hour = time_range.start_time.hour
         if 18 <= start_hour or start_hour < 6:
-            # 20% premium for evening/overnight
-            premium = fee.amount * Decimal('0.20')
-            fee = Money(fee.amount + premium, fee.currency)
+            multiplier *= ParkingFeeCalculator._EVENING_MULTIPLIER
         
-        return fee
+        return multiplier
+    
+    @staticmethod
+    def _feature_multiplier(slot: ParkingSlot) -> Decimal:
+        """Combined multiplier of the slot feature premiums"""
+        multiplier = ParkingFeeCalculator._BASE_MULTIPLIER
+        for feature, premium in ParkingFeeCalculator._FEATURE_PREMIUMS:
+            if slot.has_feature(feature):
+                multiplier += premium
+        return multiplier
+    
+    @staticmethod
+    def _apply_time_based_rules(fee: Money, time_range: TimeRange) -> Money:
+        """Apply time-based business rules to fee"""
+        return Money(fee.amount * ParkingFeeCalculator._time_based_multiplier(time_range), fee.currency)
     
     @staticmethod
     def _apply_feature_premiums(fee: Money, slot: ParkingSlot) -> Money:
         """Apply premiums for slot features"""
-        premium_multiplier = Decimal('1.0')
-        
-        if slot.has_feature("covered"):
-            premium_multiplier += Decimal('0.15')  # 15% premium for covered
-        
-        if slot.has_feature("camera"):
-            premium_multiplier += Decimal('0.05')   # 5% premium for security camera
-        
-        if slot.has_feature("valet"):
-            premium_multiplier += Decimal('0.25')   # 25% premium for valet service
-        
-        adjusted_amount = fee.amount * premium_multiplier
-        return Money(adjusted_amount, fee.currency)
+        return Money(fee.amount * ParkingFeeCalculator._feature_multiplier(slot), fee.currency)
     
     @staticmethod
     def calculate_ev_charging_fee(
@@ -930,30 +1019,18 @@ class ParkingFeeCalculator:
         """
         Calculate EV charging fee based on energy, charger type, and time
         """
-        # Base rate per kWh
-        base_rate_per_kwh = Decimal('0.30')  # $0.30 per kWh
-        
         # Charger type multiplier
-        charger_multipliers = {
-            ChargerType.LEVEL_1: Decimal('1.0'),
-            ChargerType.LEVEL_2: Decimal('1.2'),
-            ChargerType.DC_FAST: Decimal('1.5'),
-            ChargerType.TESLA: Decimal('1.8'),
-            ChargerType.CHADEMO: Decimal('1.5'),
-            ChargerType.CCS: Decimal('1.5'),
-        }
-        
-        multiplier = charger_multipliers.get(charger_type, Decimal('1.0'))
+        multiplier = ParkingFeeCalculator._CHARGER_MULTIPLIERS.get(charger_type, ParkingFeeCalculator._BASE_MULTIPLIER)
         
         # Time of day adjustment (peak vs off-peak)
         hour = time_of_day.hour
         if 8 <= hour < 20:  # Peak hours: 8 AM to 8 PM
-            multiplier *= Decimal('1.25')  # 25% peak surcharge
+            multiplier *= ParkingFeeCalculator._PEAK_MULTIPLIER
         else:  # Off-peak hours
-            multiplier *= Decimal('0.75')  # 25% off-peak discount
+            multiplier *= ParkingFeeCalculator._OFF_PEAK_MULTIPLIER
         
         # Calculate fee
-        fee_amount = Decimal(str(energy_kwh)) * base_rate_per_kwh * multiplier
+        fee_amount = Decimal(str(energy_kwh)) * ParkingFeeCalculator._EV_BASE_RATE_PER_KWH * multiplier
         return Money(fee_amount)
 
 
@@ -476,7 +476,7 @@ class LargeVehicleStrategy(ParkingStrategy):
         # Large vehicles need wide slots
         # First, find all available slots that can accommodate the vehicle
         available_slots = []
-        for slot in parking_lot._slots.values():
+        for slot in parking_lot._slots_list:
             if not slot.is_occupied and self.can_park(parking_lot, vehicle, slot):
                 available_slots.append(slot)
         
@@ -559,7 +559,7 @@ class NearestEntryStrategy(ParkingStrategy):
         
         # Get all available slots that can accommodate the vehicle
         available_slots = []
-        for slot in parking_lot._slots.values():
+        for slot in parking_lot._slots_list:
             if not slot.is_occupied and slot.can_accommodate_vehicle_type(vehicle.vehicle_type):
                 available_slots.append(slot)
         
@@ -1068,6 +1068,14 @@ class ChargingStrategyFactory(StrategyFactory[ChargingStrategy]):
 # DTO FACTORIES
 # ============================================================================
 
+def _dto_member(enum_dto, value: str):
+    """Enum DTO member for a domain value; ValueError if unmapped, like the enum call"""
+    member = enum_dto._STR_TO_MEMBER.get(value)
+    if member is None:
+        raise ValueError(f"{value!r} is not a valid {enum_dto.__name__}")
+    return member
+
+
 class DTOFactory:
     """Factory for creating DTOs"""
     
@@ -1077,7 +1085,7 @@ class DTOFactory:
         return VehicleDTO(
             id=vehicle.id,
             license_plate=vehicle.license_plate.value,
-            vehicle_type=VehicleTypeDTO(vehicle.vehicle_type.value),
+            vehicle_type=_dto_member(VehicleTypeDTO, vehicle.vehicle_type.value),
             make=vehicle.make,
             model=vehicle.model,
             year=getattr(vehicle, 'year', None),
@@ -1096,8 +1104,8 @@ class DTOFactory:
             parking_lot_id=slot.parking_lot_id,
             number=slot.number,
             floor_level=slot.floor_level,
-            slot_type=SlotTypeDTO(slot.slot_type.value),
-            vehicle_types=[VehicleTypeDTO(vt.value) for vt in slot.vehicle_types],
+            slot_type=_dto_member(SlotTypeDTO, slot.slot_type.value),
+            vehicle_types=[_dto_member(VehicleTypeDTO, vt.value) for vt in slot.vehicle_types],
             features=slot.features,
             is_occupied=slot.is_occupied,
             occupied_by=slot.occupied_by,
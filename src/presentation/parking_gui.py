@@ -2233,13 +2233,14 @@ class ParkingAppController:
     def park_vehicle(self, vehicle_data: Dict[str, Any], lot_data: Dict[str, Any] = None) -> Tuple[bool, str]:
         """Park a vehicle"""
         try:
-            # Create parking request
+            # Create parking request ("any" slot type means no preference)
+            preferred_slot_type = vehicle_data.get("preferred_slot_type", "any")
             request = ParkingRequestDTO(
                 license_plate=vehicle_data["license_plate"],
                 vehicle_type=vehicle_data["vehicle_type"],
                 parking_lot_id=lot_data["id"] if lot_data else uuid4(),
                 preferences={
-                    "preferred_slot_type": vehicle_data.get("preferred_slot_type", "any")
+                    "preferred_slot_type": None if preferred_slot_type == "any" else preferred_slot_type
                 }
             )
             
@@ -2258,6 +2259,12 @@ class ParkingAppController:
             self.logger.error(f"Error parking vehicle: {e}")
             return False, f"Error: {str(e)}"
     
+    def shutdown(self):
+        """Stop the parking service's workers, waiting for pending exit billing"""
+        service = getattr(self, "parking_service", None)
+        if service is not None:
+            service.close()
+    
     def add_parking_lot(self, lot_data: Dict[str, Any]) -> Tuple[bool, str]:
         """Add a parking lot"""
         try:
@@ -2727,6 +2734,7 @@ Features:
         """Handle window closing"""
         if messagebox.askokcancel("Quit", "Do you want to quit the application?"):
             # Cleanup resources
+            self.controller.shutdown()
             self.root.destroy()
     
     def run(self):
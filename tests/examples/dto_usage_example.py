@@ -0,0 +1,89 @@
+# File: tests/examples/dto_usage_example.py
+"""
+Example usage of the application DTOs
+
+Kept out of src/application/dtos.py so the production module carries no demo
+code. Run directly: python tests/examples/dto_usage_example.py
+"""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.application.dtos import (
+    ChargingRequestDTO,
+    ChargingStrategyTypeDTO,
+    ErrorResponseDTO,
+    MoneyDTO,
+    ParkingRequestDTO,
+    ParkingSlotQueryDTO,
+    SlotTypeDTO,
+    VehicleTypeDTO,
+)
+
+
+def example_usage():
+    """Example usage of DTOs"""
+    
+    # Create a parking request DTO
+    parking_request = ParkingRequestDTO(
+        license_plate="ABC-123",
+        vehicle_type=VehicleTypeDTO.CAR,
+        parking_lot_id=uuid4(),
+        preferences={"preferred_slot_type": "premium"}
+    )
+    
+    print(f"Parking Request: {parking_request.to_dict()}")
+    
+    # Create a money DTO
+    money = MoneyDTO(amount=Decimal("15.75"), currency="USD")
+    print(f"Money: {money.amount} {money.currency}")
+    
+    # Create a charging request DTO
+    charging_request = ChargingRequestDTO(
+        license_plate="EV-456",
+        vehicle_type=VehicleTypeDTO.EV_CAR,
+        station_id=uuid4(),
+        current_charge_percentage=20.0,
+        target_charge_percentage=80.0,
+        battery_capacity_kwh=60.0,
+        charging_strategy=ChargingStrategyTypeDTO.FAST
+    )
+    
+    print(f"Charging Request: {charging_request.to_dict()}")
+    
+    # Serialize to JSON
+    json_str = parking_request.to_json()
+    print(f"JSON: {json_str}")
+    
+    # Deserialize from JSON
+    deserialized = ParkingRequestDTO.from_json(json_str)
+    print(f"Deserialized: {deserialized.license_plate}")
+    
+    # Create paginated query
+    query = ParkingSlotQueryDTO(
+        page=1,
+        page_size=10,
+        slot_type=SlotTypeDTO.EV,
+        is_occupied=False
+    )
+    
+    print(f"Query: Page {query.page}, Size {query.page_size}")
+    
+    # Create error response
+    error_response = ErrorResponseDTO(
+        error="Parking lot is full",
+        error_code="PARKING_LOT_FULL",
+        details={"parking_lot_id": str(uuid4()), "occupancy_rate": 1.0}
+    )
+    
+    print(f"Error Response: {error_response.error}")
+
+
+
+if __name__ == "__main__":
+    example_usage()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Parking Lot Allocation Unit Tests
+
+Behavior tests for the ParkingLot aggregate's slot bookkeeping (free-slot
+queues, occupancy counters, maintenance closures), entity identity and the
+parking fee rules.
+"""
+
+import unittest
+import sys
+import uuid
+from pathlib import Path
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+try:
+    from src.domain.aggregates import ParkingLot
+    from src.domain.models import (
+        Capacity, Entity, LicensePlate, Location, Money, ParkingFeeCalculator,
+        ParkingSlot, SlotType, TimeRange, Vehicle, VehicleType,
+    )
+    HAS_PROJECT_MODULES = True
+except ImportError as e:
+    print(f"Warning: Could not import domain modules: {e}")
+    HAS_PROJECT_MODULES = False
+
+
+def make_vehicle(plate: str, vehicle_type=None) -> "Vehicle":
+    """Create a vehicle with placeholder make/model data"""
+    return Vehicle(
+        LicensePlate(plate), "Make", "Model", 2020, "red",
+        vehicle_type or VehicleType.CAR
+    )
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestParkingLotAllocation(unittest.TestCase):
+    """Park, leave and maintenance operations keep the lot's indexes consistent"""
+
+    def setUp(self):
+        self.lot = ParkingLot(
+            "Test Lot",
+            Location("1 Main Street", "Town", "CA", "12345"),
+            Capacity(regular=3, ev=1, disabled=0, premium=1)
+        )
+
+    def slot_number_of(self, vehicle) -> int:
+        return self.lot.get_slot_by_vehicle(vehicle.id).number
+
+    def test_vehicles_fill_lowest_numbered_free_slots(self):
+        """Cars take regular slots in number order"""
+        cars = [make_vehicle(f"ABC{i}23") for i in range(3)]
+        for car in cars:
+            self.lot.park_vehicle(car)
+
+        self.assertEqual([self.slot_number_of(car) for car in cars], [1, 2, 3])
+        self.assertEqual(self.lot.occupied_slots, 3)
+        self.assertEqual(self.lot.available_slots, 2)
+        self.lot._validate_invariants()
+
+    def test_count_slots_by_type_tracks_park_and_leave(self):
+        """Per-type (total, occupied) tuples follow SlotType order"""
+        slot_id, _ = self.lot.park_vehicle(make_vehicle("EVV123", VehicleType.EV_CAR))
+        self.lot.park_vehicle(make_vehicle("CAR123"))
+
+        totals, occupied = self.lot.count_slots_by_type()
+        index = {slot_type: i for i, slot_type in enumerate(SlotType)}
+        self.assertEqual(totals[index[SlotType.REGULAR]], 3)
+        self.assertEqual(totals[index[SlotType.EV]], 1)
+        self.assertEqual(occupied[index[SlotType.REGULAR]], 1)
+        self.assertEqual(occupied[index[SlotType.EV]], 1)
+
+        self.lot.leave_slot(slot_id)
+        _, occupied = self.lot.count_slots_by_type()
+        self.assertEqual(occupied[index[SlotType.EV]], 0)
+        self.assertEqual(sum(occupied), self.lot.occupied_slots)
+
+    def test_vacated_slot_is_reused(self):
+        """A slot freed by leave_slot goes back into allocation"""
+        first, second = make_vehicle("AAA111"), make_vehicle("BBB222")
+        slot_id, _ = self.lot.park_vehicle(first)
+        self.lot.park_vehicle(second)
+
+        self.lot.leave_slot(slot_id)
+        self.assertIsNone(self.lot.get_slot_by_vehicle(first.id))
+
+        third = make_vehicle("CCC333")
+        self.lot.park_vehicle(third)
+        self.assertEqual(self.slot_number_of(third), 3)
+        fourth = make_vehicle("DDD444")
+        self.lot.park_vehicle(fourth)
+        self.assertEqual(self.slot_number_of(fourth), 1)
+        self.lot._validate_invariants()
+
+    def test_leaving_an_empty_slot_changes_nothing(self):
+        """Vacating a free slot is a no-op, not a second free entry"""
+        slot = self.lot.get_slot_by_number(1)
+        self.assertEqual(self.lot.leave_slot(slot.id), (None, None))
+
+        cars = [make_vehicle(f"XYZ{i}11") for i in range(3)]
+        for car in cars:
+            self.lot.park_vehicle(car)
+        self.assertEqual(sorted(self.slot_number_of(car) for car in cars), [1, 2, 3])
+
+    def test_closed_slot_is_skipped_until_reopened(self):
+        """close_slot takes a free slot out of allocation; reopen_slot returns it"""
+        closed = self.lot.get_slot_by_number(1)
+        self.lot.close_slot(closed.id)
+        self.lot.close_slot(closed.id)  # Closing twice is harmless
+
+        car = make_vehicle("CLS123")
+        self.lot.park_vehicle(car)
+        self.assertEqual(self.slot_number_of(car), 2)
+        self.assertNotEqual(
+            self.lot.find_available_slot(VehicleType.CAR, SlotType.REGULAR).number, 1
+        )
+
+        self.lot.reopen_slot(closed.id)
+        self.lot.reopen_slot(closed.id)  # So is reopening twice
+        self.assertEqual(len(self.lot.get_available_slots_by_type(SlotType.REGULAR)), 2)
+
+        for plate in ("RE1123", "RE2123"):
+            self.lot.park_vehicle(make_vehicle(plate))
+        self.assertTrue(closed.is_occupied)
+        self.lot._validate_invariants()
+
+    def test_cannot_close_occupied_slot(self):
+        """An occupied slot cannot be closed for maintenance"""
+        slot_id, _ = self.lot.park_vehicle(make_vehicle("OCC123"))
+        with self.assertRaises(ValueError):
+            self.lot.close_slot(slot_id)
+
+    def test_same_vehicle_cannot_park_twice(self):
+        """A vehicle already in the lot is rejected"""
+        car = make_vehicle("DUP123")
+        self.lot.park_vehicle(car)
+        with self.assertRaises(ValueError):
+            self.lot.park_vehicle(car)
+
+    def test_full_lot_rejects_vehicle(self):
+        """Parking fails once no accepted slot type has a free slot"""
+        for i in range(4):  # 3 regular + 1 premium accept cars
+            self.lot.park_vehicle(make_vehicle(f"FUL{i}23"))
+        with self.assertRaises(ValueError):
+            self.lot.park_vehicle(make_vehicle("EXTRA1"))
+        self.lot._validate_invariants()
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestEntityIdentity(unittest.TestCase):
+    """Entity ids are stored compactly but read back unchanged"""
+
+    def test_generated_id_is_canonical_uuid_string(self):
+        entity = Entity()
+        self.assertEqual(str(uuid.UUID(entity.id)), entity.id)
+        self.assertIs(entity.id, entity.id)
+
+    def test_explicit_ids_round_trip(self):
+        canonical = str(uuid.uuid4())
+        for given in (canonical, canonical.upper(), "lot-001", 42):
+            self.assertEqual(Entity(given).id, given)
+
+    def test_equality_uses_id_and_type(self):
+        entity = Entity()
+        same = Entity(entity.id)
+        self.assertEqual(entity, same)
+        self.assertEqual(hash(entity), hash(same))
+        self.assertNotEqual(entity, Entity())
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestParkingFeeCalculator(unittest.TestCase):
+    """Folded fee multiplier matches applying each rule in turn"""
+
+    def fee_for(self, slot, start, hours, vehicle=None) -> Money:
+        time_range = TimeRange(start, start + timedelta(hours=hours))
+        return ParkingFeeCalculator.calculate_fee(slot, time_range, vehicle)
+
+    def test_first_hour_discount_and_feature_premiums(self):
+        slot = ParkingSlot(1, SlotType.REGULAR, features=["covered", "camera"])
+        start = datetime(2024, 1, 1, 10, 0)
+        base = slot.calculate_fee(timedelta(minutes=30)).amount
+
+        fee = self.fee_for(slot, start, 0.5)
+        self.assertEqual(fee.amount, base * Decimal('0.90') * Decimal('1.20'))
+
+    def test_evening_premium_and_vehicle_multiplier(self):
+        slot = ParkingSlot(1, SlotType.REGULAR, features=["valet"])
+        start = datetime(2024, 1, 1, 20, 0)
+        truck = make_vehicle("TRK123", VehicleType.TRUCK)
+        base = slot.calculate_fee(timedelta(hours=3)).amount
+
+        fee = self.fee_for(slot, start, 3, truck)
+        expected = base * Decimal('1.20') * Decimal('1.25') * truck.get_parking_rate_multiplier()
+        self.assertEqual(fee.amount, expected)
+
+    def test_plain_daytime_stay_is_base_fee(self):
+        slot = ParkingSlot(1, SlotType.REGULAR)
+        start = datetime(2024, 1, 1, 9, 0)
+        self.assertEqual(
+            self.fee_for(slot, start, 2).amount,
+            slot.calculate_fee(timedelta(hours=2)).amount
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Parking Service Behavior Unit Tests
+
+Tests ParkingService and its request DTOs against mocked bounded
+contexts.
+"""
+
+import unittest
+import sys
+import itertools
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+try:
+    from src.application.parking_service import (
+        ParkingService, ParkingServiceFactory, ParkingCommandHandler,
+        ParkingRequestDTO, ExitRequestDTO, ParkingLotStatusDTO,
+    )
+    from src.domain.bounded_contexts import ParkingManagementContext, ShardedParkingContext
+    HAS_PROJECT_MODULES = True
+except ImportError as e:
+    print(f"Warning: Could not import parking service modules: {e}")
+    HAS_PROJECT_MODULES = False
+
+
+CONTEXT_NAMES = (
+    "parking_management", "billing_pricing", "ev_charging",
+    "security_validation", "monitoring_analytics",
+)
+
+
+class FakeSharedCache(dict):
+    """In-memory stand-in for a redis client (get/set(ex=)/delete)"""
+
+    def set(self, key, value, ex=None):
+        self[key] = value
+
+    def delete(self, key):
+        self.pop(key, None)
+
+
+class ServiceTestBase(unittest.TestCase):
+    """Builds a ParkingService whose bounded contexts are mocks"""
+
+    def setUp(self):
+        self.ticket_ids = itertools.count(1)
+        self.allocate = MagicMock(side_effect=self._allocate)
+        self.release = MagicMock(return_value={"success": True, "slot_released": 7})
+        self.status_query = MagicMock(side_effect=self._status)
+        self.validate_plate = MagicMock(return_value={"success": True})
+        self.check_access = MagicMock(return_value={"access_granted": True})
+
+        handlers = {
+            "allocate_parking": self.allocate,
+            "release_parking": self.release,
+            "get_status_and_occupancy": self.status_query,
+            "validate_license_plate": self.validate_plate,
+            "check_access": self.check_access,
+        }
+        self.mapper = MagicMock()
+        self.mapper.contexts = {name: MagicMock() for name in CONTEXT_NAMES}
+        for name in ("parking_management", "security_validation"):
+            self.mapper.contexts[name].get_handler.side_effect = lambda handler: handlers.get(handler, MagicMock())
+
+        self.billing = self.mapper.contexts["billing_pricing"]
+        self.billing.execute_command.return_value = {"success": True, "fee_amount": 12.5, "invoice_id": "INV-1"}
+
+        self.service = self.create_service()
+        self.addCleanup(self.service.close)
+
+    def create_service(self, **kwargs) -> "ParkingService":
+        return ParkingService(context_mapper=self.mapper, **kwargs)
+
+    def _allocate(self, command):
+        return SimpleNamespace(
+            success=True, ticket_id=f"T-{next(self.ticket_ids)}", slot_number=3,
+            slot_type="regular", strategy_used="nearest", error=None
+        )
+
+    def _status(self, query):
+        return {
+            "success": True, "total_slots": 10, "occupied_slots": 4, "available_slots": 6,
+            "occupancy_rate": 40.0, "total_by_type": (8, 2, 0, 0, 0), "occupied_by_type": (3, 1, 0, 0, 0),
+        }
+
+    def park_request(self, plate="ABC123", lot="lot-1", **kwargs) -> "ParkingRequestDTO":
+        return ParkingRequestDTO(license_plate=plate, vehicle_type="car", parking_lot_id=lot, **kwargs)
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestIdempotentPark(ServiceTestBase):
+    """Retried park requests get the original allocation back"""
+
+    def test_retry_returns_first_allocation(self):
+        first = self.service.park_vehicle(self.park_request())
+        second = self.service.park_vehicle(self.park_request())
+
+        self.assertTrue(first.success)
+        self.assertIs(second, first)
+        self.assertEqual(self.allocate.call_count, 1)
+
+    def test_concurrent_retries_allocate_once(self):
+        def slow_allocate(command):
+            time.sleep(0.01)
+            return self._allocate(command)
+        self.allocate.side_effect = slow_allocate
+
+        request = self.park_request()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: self.service.park_vehicle(request), range(8)))
+
+        self.assertEqual({result.ticket_id for result in results}, {"T-1"})
+        self.assertEqual(self.allocate.call_count, 1)
+
+    def test_different_request_is_not_replayed(self):
+        self.service.park_vehicle(self.park_request())
+        other = self.service.park_vehicle(self.park_request(requires_charging=True))
+
+        self.assertEqual(other.ticket_id, "T-2")
+
+    def test_exit_by_ticket_forgets_allocation(self):
+        first = self.service.park_vehicle(self.park_request())
+        self.service.exit_vehicle(ExitRequestDTO(ticket_id=first.ticket_id, parking_lot_id="lot-1"))
+
+        again = self.service.park_vehicle(self.park_request())
+        self.assertEqual(again.ticket_id, "T-2")
+
+    def test_retry_after_window_allocates_again(self):
+        self.service.idempotency_window_seconds = 0
+        self.service.park_vehicle(self.park_request())
+        self.assertEqual(self.service.park_vehicle(self.park_request()).ticket_id, "T-2")
+
+    def test_unknown_vehicle_type_is_reported(self):
+        request = ParkingRequestDTO(license_plate="ABC123", vehicle_type="hovercraft", parking_lot_id="lot-1")
+
+        result = self.service.park_vehicle(request)
+        self.assertFalse(result.success)
+        self.assertIn("hovercraft", result.message)
+        self.allocate.assert_not_called()
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestValidatedIngress(ServiceTestBase):
+    """Only validate_request can mark a request as already validated"""
+
+    def test_constructor_and_from_dict_reject_validation_fields(self):
+        with self.assertRaises(TypeError):
+            ParkingRequestDTO(license_plate="ABC123", vehicle_type="car",
+                              parking_lot_id="lot-1", validated=True)
+        with self.assertRaises(TypeError):
+            ParkingRequestDTO.from_dict({"license_plate": "ABC123", "vehicle_type": "car",
+                                         "parking_lot_id": "lot-1", "validated": True})
+
+    def test_command_data_cannot_skip_validation(self):
+        handler = ParkingCommandHandler(self.service)
+        response = handler.handle({"type": "park_vehicle", "data": {
+            "license_plate": "ABC123", "vehicle_type": "car", "parking_lot_id": "lot-1",
+            "validated": True, "validation_error": None,
+        }})
+
+        self.assertFalse(response["success"])
+        self.allocate.assert_not_called()
+
+    def test_validated_request_is_not_validated_again(self):
+        request = self.service.validate_request(self.park_request())
+        self.assertTrue(request.validated)
+        self.assertEqual(self.validate_plate.call_count, 1)
+
+        self.assertTrue(self.service.park_vehicle(request).success)
+        self.assertEqual(self.validate_plate.call_count, 1)
+
+    def test_validation_failure_is_carried_to_park(self):
+        self.validate_plate.return_value = {"success": False, "error": "blacklisted"}
+        request = self.service.validate_request(self.park_request())
+
+        result = self.service.park_vehicle(request)
+        self.assertFalse(result.success)
+        self.assertIn("blacklisted", result.message)
+        self.allocate.assert_not_called()
+
+    def test_validation_fields_are_not_serialized(self):
+        request = self.service.validate_request(self.park_request())
+        data = request.to_dict()
+
+        self.assertNotIn("validated", data)
+        self.assertNotIn("validation_error", data)
+        self.assertEqual(ParkingRequestDTO.from_dict(data), self.park_request())
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestDeferredBilling(ServiceTestBase):
+    """Exit billing runs after the response and is reported per ticket"""
+
+    def exit(self, ticket_id="T-1"):
+        return self.service.exit_vehicle(ExitRequestDTO(ticket_id=ticket_id, parking_lot_id="lot-1"))
+
+    def test_billing_goes_from_pending_to_invoiced(self):
+        release_billing = threading.Event()
+
+        def blocked_billing(command):
+            release_billing.wait(5)
+            return {"success": True, "fee_amount": 12.5, "invoice_id": "INV-1"}
+        self.billing.execute_command.side_effect = blocked_billing
+
+        result = self.exit()
+        self.assertTrue(result.success)
+        self.assertEqual(self.service.get_billing_status("T-1"), {"status": "pending"})
+
+        release_billing.set()
+        self.service.close()
+        status = self.service.get_billing_status("T-1")
+        self.assertEqual(status["status"], "invoiced")
+        self.assertEqual(status["invoice_id"], "INV-1")
+
+    def test_failed_fee_calculation_is_reported(self):
+        self.billing.execute_command.return_value = {"success": False, "error": "no tariff"}
+
+        self.exit()
+        self.service.close()
+        status = self.service.get_billing_status("T-1")
+        self.assertEqual(status["status"], "failed")
+        self.assertIn("no tariff", status["error"])
+
+    def test_exit_after_close_is_not_left_pending(self):
+        self.service.close()
+
+        self.assertTrue(self.exit().success)
+        self.assertEqual(self.service.get_billing_status("T-1"),
+                         {"status": "failed", "error": "Service closed"})
+
+    def test_billing_workers_start_with_first_exit(self):
+        self.assertIsNone(self.service._billing_executor)
+
+        self.exit()
+        self.assertIsNotNone(self.service._billing_executor)
+
+    def test_unknown_ticket_has_no_billing_status(self):
+        self.assertIsNone(self.service.get_billing_status("missing"))
+
+    def test_status_map_is_capped(self):
+        self.service.billing_status_max_entries = 3
+        for i in range(5):
+            self.service._set_billing_status(f"T-{i}", {"status": "pending"})
+
+        self.assertIsNone(self.service.get_billing_status("T-0"))
+        self.assertIsNotNone(self.service.get_billing_status("T-4"))
+        self.assertEqual(len(self.service._billing_status), 3)
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestMetricRecording(ServiceTestBase):
+    """Metrics are recorded by a worker thread started on first use"""
+
+    def test_worker_starts_with_first_metric(self):
+        self.assertIsNone(self.service._metric_worker)
+
+        self.service.park_vehicle(self.park_request())
+        self.assertTrue(self.service._metric_worker.is_alive())
+
+    def test_close_records_queued_metrics(self):
+        monitoring = self.mapper.contexts["monitoring_analytics"]
+        self.service.park_vehicle(self.park_request())
+
+        with self.service:
+            pass
+        self.assertTrue(monitoring.execute_command.called)
+        self.assertFalse(self.service._metric_worker.is_alive())
+
+    def test_metrics_after_close_are_dropped(self):
+        self.service.close()
+        self.service._record_metrics([{"metric_type": "vehicle_entry", "value": 1}])
+
+        self.assertIsNone(self.service._metric_worker)
+        self.assertTrue(self.service._metric_queue.empty())
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestParkingLotStatusCache(ServiceTestBase):
+    """Lot status is cached briefly and dropped on every lot change"""
+
+    def test_status_is_reused_within_ttl(self):
+        first = self.service.get_parking_lot_status("lot-1")
+        second = self.service.get_parking_lot_status("lot-1")
+
+        self.assertIs(second, first)
+        self.assertEqual(self.status_query.call_count, 1)
+
+    def test_park_invalidates_status(self):
+        self.service.get_parking_lot_status("lot-1")
+        self.service.park_vehicle(self.park_request())
+        self.service.get_parking_lot_status("lot-1")
+
+        self.assertEqual(self.status_query.call_count, 2)
+
+    def test_status_read_across_invalidation_is_not_cached(self):
+        def status_with_concurrent_park(query):
+            self.service._invalidate_status("lot-1")
+            return self._status(query)
+        self.status_query.side_effect = status_with_concurrent_park
+
+        self.service.get_parking_lot_status("lot-1")
+        self.assertNotIn("lot-1", self.service._status_cache)
+
+    def test_response_keeps_by_slot_type(self):
+        data = self.service.get_parking_lot_status("lot-1").to_dict()
+
+        self.assertNotIn("slot_totals", data)
+        self.assertEqual(data["by_slot_type"]["regular"]["total"], 8)
+        self.assertEqual(data["by_slot_type"]["regular"]["occupied"], 3)
+        self.assertEqual(data["by_slot_type"]["regular"]["available"], 5)
+
+    def test_shared_cache_round_trip(self):
+        cache = FakeSharedCache()
+        service = self.create_service(cache_client=cache)
+        self.addCleanup(service.close)
+
+        status = service.get_parking_lot_status("lot-1")
+        self.assertIn("lot:status:lot-1", cache)
+
+        service._status_cache.clear()
+        restored = service.get_parking_lot_status("lot-1")
+        self.assertEqual(restored, status)
+        self.assertEqual(self.status_query.call_count, 1)
+
+        service._invalidate_status("lot-1")
+        self.assertNotIn("lot:status:lot-1", cache)
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestDashboardData(ServiceTestBase):
+    """Dashboard sub-queries run on a pool created by the first request"""
+
+    def setUp(self):
+        super().setUp()
+        monitoring = self.mapper.contexts["monitoring_analytics"]
+        monitoring.execute_query.side_effect = lambda query: {
+            "get_alerts": {"active_alerts": ["gate 2 offline"]},
+            "get_metrics": {"metrics": [{"metric_type": "revenue"}]},
+        }[query["type"]]
+
+    def test_pool_starts_with_first_request(self):
+        self.assertIsNone(self.service._dashboard_executor)
+
+        data = self.service.get_dashboard_data("lot-1")
+        self.assertTrue(data["success"])
+        self.assertEqual(data["parking_status"]["occupied_slots"], 4)
+        self.assertEqual(data["alerts"], ["gate 2 offline"])
+        self.assertEqual(data["recent_metrics"], [{"metric_type": "revenue"}])
+        self.assertIsNotNone(self.service._dashboard_executor)
+
+    def test_request_after_close_fails(self):
+        self.service.close()
+
+        self.assertFalse(self.service.get_dashboard_data("lot-1")["success"])
+        self.assertIsNone(self.service._dashboard_executor)
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestShardedParking(ServiceTestBase):
+    """A sharded service routes every caller through the shards"""
+
+    def test_sharded_context_replaces_mapper_entry(self):
+        self.mapper.contexts["parking_management"] = ParkingManagementContext()
+        service = self.create_service(parking_shards=4)
+        self.addCleanup(service.close)
+
+        self.assertIsInstance(service.parking_context, ShardedParkingContext)
+        self.assertIs(self.mapper.contexts["parking_management"], service.parking_context)
+        self.assertEqual(len(service.parking_context.shards), 4)
+
+    def test_queries_route_to_owning_shard(self):
+        sharded = ShardedParkingContext.from_context(ParkingManagementContext(), 3)
+        lot = MagicMock(id="lot-9")
+        sharded.add_parking_lot(lot)
+
+        owner = sharded.shard_for("lot-9")
+        self.assertIs(owner.parking_lots["lot-9"], lot)
+        self.assertEqual(sum("lot-9" in shard.parking_lots for shard in sharded.shards), 1)
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestServiceConfiguration(unittest.TestCase):
+    """create_service_with_config applies every documented setting"""
+
+    def setUp(self):
+        mapper = MagicMock()
+        mapper.contexts = {name: MagicMock() for name in CONTEXT_NAMES}
+        patcher = patch("src.domain.bounded_contexts.BoundedContextFactory.create_standard_configuration",
+                        return_value=mapper)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_worker_sizes_reach_the_workers(self):
+        service = ParkingServiceFactory.create_service_with_config(
+            {"metric_queue_size": 5, "billing_workers": 2, "grace_period_minutes": 3}
+        )
+        self.addCleanup(service.close)
+
+        self.assertEqual(service._metric_queue.maxsize, 5)
+        self.assertEqual(service._billing_pool()._max_workers, 2)
+        self.assertEqual(service.grace_period_minutes, 3)
+
+    def test_unknown_setting_is_ignored_with_warning(self):
+        with self.assertLogs("ParkingService", level="WARNING") as logs:
+            service = ParkingServiceFactory.create_service_with_config(
+                {"no_such_setting": 1, "grace_period_minutes": 3}
+            )
+        self.addCleanup(service.close)
+
+        self.assertIn("no_such_setting", logs.output[0])
+        self.assertEqual(service.grace_period_minutes, 3)
+        self.assertFalse(hasattr(service, "no_such_setting"))
+
+
+@unittest.skipUnless(HAS_PROJECT_MODULES, "Project modules not available")
+class TestGeneratedDTOMethods(unittest.TestCase):
+    """Generated to_dict/from_dict round-trip request DTOs"""
+
+    def test_round_trip(self):
+        request = ParkingRequestDTO(license_plate="ABC123", vehicle_type="ev_car",
+                                    parking_lot_id="lot-1", preferences={"floor": 2})
+        self.assertTrue(request.is_electric)
+        self.assertEqual(ParkingRequestDTO.from_dict(request.to_dict()), request)
+
+    def test_from_dict_rejects_unknown_keys(self):
+        with self.assertRaises(TypeError):
+            ParkingRequestDTO.from_dict({"license_plate": "ABC123", "vehicle_type": "car",
+                                         "parking_lot_id": "lot-1", "colour": "red"})
+
+    def test_status_dto_to_dict(self):
+        status = ParkingLotStatusDTO.from_dict({
+            "parking_lot_id": "lot-1", "total_slots": 2, "occupied_slots": 1,
+            "available_slots": 1, "occupancy_rate": 50.0,
+            "slot_totals": (2, 0, 0, 0, 0), "slot_occupied": (1, 0, 0, 0, 0),
+            "timestamp": None,
+        })
+        self.assertEqual(status.to_dict()["by_slot_type"]["regular"]["rate"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()